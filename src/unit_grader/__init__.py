@@ -9,6 +9,9 @@ The unit_grader package contains the following
         - cli: Contains the CLI tool for converting
           units of measure and grading student responses
           to conversion questions.
+        - client: Contains the client for the unit-grader server.
+        - launcher: Contains the entry point of the unit-grader command,
+          which grades a single response without loading the full CLI.
 
 """
 __feedback_url__ = "https://forms.gle/VxXa27tjU5ZFmyp66"
@@ -3,24 +3,60 @@ This module provides a CLI tool for converting units of
 measure and grading student responses to conversion questions.
 
 Main Functions:
-    - grade_response: Grade a student's response to a conversion question.
+    - grade_conversion: Grade a student's response to a conversion question.
     - Allow users to specify parameters via CLI arguments such as:
         - input_value: The input value provided in the question.
         - from_unit: The unit mentioned in the question.
         - to_unit: The target unit mentioned in the question.
         - student_response: The student's response.
+    - batch: Grade a CSV/TSV file of submissions in a single process.
+    - table: Write a JSON snapshot of the conversion table.
+    - regrade: Regrade prior results whose conversion changed.
+    - serve: Answer grading requests over a Unix socket.
+    - stream: Grade newline-delimited JSON requests from stdin to stdout.
+    - bench: Run the benchmark suite and compare it with a baseline.
 """
+import contextlib
+import json
 import logging
+import os
+import sys
+import time
+from typing import List, Optional
 
 import typer
 from rich import print
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from unit_grader import __feedback_url__, __version__, __app_name__
-from unit_grader.commands.conversion_grader import grade_response
-from unit_grader.config.data import UNIT_CONVERSION_INSTRUCTIONS
+from unit_grader.client import DEFAULT_SOCKET_PATH
+from unit_grader.commands.args_file_grader import grade_args_file
+from unit_grader.commands.batch_checkpoint import (
+    DEFAULT_CHECKPOINT_INTERVAL,
+    grade_file,
+)
+from unit_grader.commands.batch_grader import (
+    PlanStats,
+    grade_stream,
+    resolve_delimiter,
+)
+from unit_grader.commands.conversion_grader import ANSWER_CACHE, grade
+from unit_grader.commands.mapped_reader import map_lines
+from unit_grader.commands.regrader import diff_tables, export_table, regrade_stream
+from unit_grader.commands.result_cache import ResultCache, result_key
+from unit_grader.commands.stream_grader import DEFAULT_FLUSH_LINES, grade_ndjson
+from unit_grader.config.data import REGISTRY, UNIT_CONVERSION_INSTRUCTIONS
+from unit_grader.config.enums import OutputFormat
+from unit_grader.utils.profiler import Profiler
+from unit_grader.utils.rendering import (
+    enableLogging,
+    print_feedback,
+    print_grade_result,
+    write_grade_result,
+)
+from unit_grader.utils.timings import TIMINGS
 
-app = typer.Typer()  # creates a CLI app
+app = typer.Typer(no_args_is_help=True)  # creates a CLI app
 
 app_version: str = __version__
 
@@ -46,52 +82,146 @@ def version_callback(show_version: bool) -> None:
 
 
 def handle_feedback():
-    print(
-        f"\n[green bold]We would like your feedback! Please visit {feedback_url} to provide feedback.[/green bold]"
-    )
+    print_feedback(feedback_url)
+
+
+def start_profiler(directory: str):
+    """
+    Start profiling the command.
+
+    Args:
+        directory (str): The directory to write the reports to.
+
+    Returns:
+        A function stopping the profiler, writing the reports and listing
+        them on stderr.
+    """
+    profiler = Profiler(directory)
+    profiler.start()
+
+    def stop() -> None:
+        for path in profiler.stop():
+            typer.echo(f"Wrote {path}", err=True)
+
+    return stop
+
 
+# Options of every command, accepted before or after the command name
+TIMINGS_OPTION = typer.Option(
+    False,
+    "--timings",
+    help="Write the call count and latency histogram of each grading "
+    "stage as JSON to stderr when the command ends.",
+)
+PROFILE_OPTION = typer.Option(
+    None,
+    "--profile",
+    help="Directory to write a cProfile profile, collapsed call stacks "
+    "for flame graphs and the top memory allocation sites to when the "
+    "command ends.",
+    show_default=False,
+)
 
-def enableLogging(verbose: bool) -> None:
+
+def enable_diagnostics(
+    ctx: typer.Context, timings: bool, profile: Optional[str]
+) -> None:
     """
-    Enable logging based on the verbosity level.
+    Enable the --timings and --profile options of a command.
+
+    Both options are accepted before and after the command name, and each
+    is enabled once, on the root context, so the report is written after
+    the command and its cleanup.
 
     Args:
-        verbose (bool): A flag to indicate whether to enable verbose output.
+        ctx (typer.Context): The context of the running command.
+        timings (bool): Whether to write the timings of the grading stages.
+        profile (str): The directory to write the profile reports to, if any.
 
     Returns:
         None
+
+    Raises:
+        typer.BadParameter: If the profile directory is a file.
     """
-    lvl: int = logging.INFO
-    fmt: str = "[%(levelname)s] %(message)s"
-    if verbose:
-        print("[green]Verbose mode is enabled.[/green]")
-        lvl = logging.DEBUG
-    logging.basicConfig(level=lvl, format=fmt)
+    root = ctx.find_root()
+    if profile is not None and os.path.isfile(profile):
+        raise typer.BadParameter("must be a directory.", param_hint="'--profile'")
+    if timings and not root.meta.get("timings"):
+        root.meta["timings"] = True
+        TIMINGS.enable()
+        root.call_on_close(lambda: TIMINGS.dump(sys.stderr))
+    if profile is not None and not root.meta.get("profile"):
+        root.meta["profile"] = True
+        root.call_on_close(start_profiler(profile))
 
 
-@app.command(name=app_name, no_args_is_help=True)
+def require_options(ctx: typer.Context, names: tuple) -> None:
+    """
+    Fail the command if any of the given options was not provided.
+
+    Args:
+        ctx (typer.Context): The context of the running command.
+        names (tuple): The parameter names of the required options.
+
+    Returns:
+        None
+    """
+    for param in ctx.command.params:
+        if param.name in names and ctx.params.get(param.name) is None:
+            ctx.fail(f"Missing option '{param.opts[0]}'.")
+
+
+@app.callback(invoke_without_command=True)
 def grade_conversion(
-    input_value: str = typer.Option(
-        ..., "--input-value", "-i", help="Input numerical value."
+    ctx: typer.Context,
+    input_value: Optional[str] = typer.Option(
+        None,
+        "--input-value",
+        "-i",
+        help="Input numerical value.",
+        show_default=False,
     ),
-    from_unit: str = typer.Option(
-        ...,
+    from_unit: Optional[str] = typer.Option(
+        None,
         "--from-unit",
         "-f",
         help=f"Input conversion unit: {UNIT_CONVERSION_INSTRUCTIONS}",
+        show_default=False,
     ),
-    to_unit: str = typer.Option(
-        ...,
+    to_unit: Optional[str] = typer.Option(
+        None,
         "--to-unit",
         "-t",
         help=f"Target conversion unit: {UNIT_CONVERSION_INSTRUCTIONS}",
+        show_default=False,
+    ),
+    student_response: Optional[str] = typer.Option(
+        None,
+        "--student-response",
+        "-s",
+        help="Student's response.",
+        show_default=False,
     ),
-    student_response: str = typer.Option(
-        ..., "--student-response", "-s", help="Student's response."
+    args_file: Optional[typer.FileText] = typer.Option(
+        None,
+        "--from-args-file",
+        help="File of single-grade command lines, one set of the options "
+        "above per line, graded in one process. Also given as @FILE.",
+        show_default=False,
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.RICH,
+        "--output",
+        help="Output format. json, plain and exit-code write a single line "
+        "(none for exit-code) and exit with 0 for correct, 1 for incorrect "
+        "and 3 for invalid answers.",
     ),
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Enable verbose output."
     ),
+    timings: bool = TIMINGS_OPTION,
+    profile: Optional[str] = PROFILE_OPTION,
     version: bool = typer.Option(
         False, "--version", "-V", callback=version_callback, is_eager=True
     ),
@@ -105,22 +235,444 @@ def grade_conversion(
     rounded to the tenths place.
 
     """
-    enableLogging(verbose)
+    enable_diagnostics(ctx, timings, profile)
+    if ctx.invoked_subcommand is not None:
+        return
+    quiet = output is not OutputFormat.RICH
+    if args_file is not None:
+        if any((input_value, from_unit, to_unit, student_response)):
+            raise typer.BadParameter(
+                "cannot be combined with the grading options.",
+                param_hint="'--from-args-file'",
+            )
+        enableLogging(verbose, quiet)
+        logging.debug(f"args_file: {args_file.name}")
+        raise typer.Exit(grade_args_file(args_file, output.value))
+    require_options(ctx, ("input_value", "from_unit", "to_unit", "student_response"))
+    enableLogging(verbose, quiet)
     logging.debug(f"input_value: {input_value}")
     logging.debug(f"from_unit: {from_unit}")
     logging.debug(f"to_unit: {to_unit}")
     logging.debug(f"student_response: {student_response}")
+    if quiet:
+        with TIMINGS.stage("grade"):
+            result = grade(input_value, from_unit, to_unit, student_response)
+        with TIMINGS.stage("render"):
+            exit_code = write_grade_result(result, output.value)
+        raise typer.Exit(exit_code)
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
     ) as progress:
         conversion_task = progress.add_task(description="Processing...", total=1)
-        result = grade_response(input_value, from_unit, to_unit, student_response)
+        with TIMINGS.stage("grade"):
+            result = grade(input_value, from_unit, to_unit, student_response)
         progress.update(conversion_task, completed=1)
         progress.stop()
-        print(f"\nGrade Result: [yellow bold]{result.value}[/yellow bold]")
-        handle_feedback()
+        with TIMINGS.stage("render"):
+            print_grade_result(result)
+            handle_feedback()
+
+
+@app.command(name="batch")
+def batch(
+    ctx: typer.Context,
+    input_file: typer.FileText = typer.Argument(
+        "-", help="CSV/TSV file of submissions, or - to read from stdin."
+    ),
+    output_file: typer.FileTextWrite = typer.Option(
+        "-",
+        "--output-file",
+        "-o",
+        help="File to write the graded rows to, or - to write to stdout.",
+    ),
+    delimiter: Optional[str] = typer.Option(
+        None,
+        "--delimiter",
+        "-d",
+        help="Field delimiter. Defaults to tab for .tsv files, comma otherwise.",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=1,
+        help="Number of worker processes grading chunks of rows in parallel.",
+    ),
+    checkpoint: Optional[str] = typer.Option(
+        None,
+        "--checkpoint",
+        help="File to write the progress of the run to, so that it can be "
+        "resumed. Needs an input file and an output file.",
+        show_default=False,
+    ),
+    checkpoint_interval: float = typer.Option(
+        DEFAULT_CHECKPOINT_INTERVAL,
+        "--checkpoint-interval",
+        min=0,
+        help="Minimum number of seconds between two checkpoints.",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue from the last checkpoint instead of grading every row.",
+    ),
+    cache_dir: Optional[str] = typer.Option(
+        None,
+        "--cache-dir",
+        envvar="UNIT_GRADER_CACHE_DIR",
+        help="Directory caching the graded output of each submission file, "
+        "returned right away when the file is graded again unchanged.",
+        show_default=False,
+    ),
+    cache_max_mb: int = typer.Option(
+        1024,
+        "--cache-max-mb",
+        min=1,
+        help="Size limit of the cache directory in megabytes. The least "
+        "recently used outputs are removed above it.",
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Enable verbose output."
+    ),
+    timings: bool = TIMINGS_OPTION,
+    profile: Optional[str] = PROFILE_OPTION,
+) -> None:
+    """
+
+    Grade every submission in a CSV/TSV file in a single command.
+
+    The file needs the input_value, from_unit, to_unit and student_response
+    columns. Other columns are passed through and the grade is appended
+    in the result column, in the same row order as the input.
+
+    With --checkpoint, the progress of the run is saved regularly, and
+    running the same command again with --resume grades only the rows
+    that were not written yet. With --cache-dir, a file graded before with
+    the same options and conversion table is not graded again.
+
+    """
+    enable_diagnostics(ctx, timings, profile)
+    with contextlib.redirect_stdout(sys.stderr):  # keep stdout for graded rows
+        enableLogging(verbose)
+    field_delimiter = resolve_delimiter(input_file.name, delimiter)
+    logging.debug(f"input_file: {input_file.name}")
+    logging.debug(f"delimiter: {field_delimiter!r}")
+    logging.debug(f"workers: {workers}")
+    if resume and checkpoint is None:
+        raise typer.BadParameter("needs --checkpoint.", param_hint="'--resume'")
+    standard_streams = {"<stdin>", "<stdout>"}
+    if (
+        checkpoint is not None
+        and {input_file.name, output_file.name} & standard_streams
+    ):
+        raise typer.BadParameter(
+            "needs an input file and an output file, not stdin or stdout.",
+            param_hint="'--checkpoint'",
+        )
+    if cache_dir is not None and checkpoint is not None:
+        raise typer.BadParameter(
+            "cannot be combined with --checkpoint.", param_hint="'--cache-dir'"
+        )
+    if cache_dir is not None and input_file.name == "<stdin>":
+        raise typer.BadParameter(
+            "needs an input file, not stdin.", param_hint="'--cache-dir'"
+        )
+    stats = PlanStats()
+    start = time.perf_counter()
+    try:
+        if cache_dir is not None:
+            cache = ResultCache(cache_dir, cache_max_mb * 1024 * 1024)
+            key = result_key(input_file.name, field_delimiter)
+            if cache.load(key, output_file):
+                logging.info(
+                    f"Copied the graded rows from the result cache in "
+                    f"{time.perf_counter() - start:.2f}s (key {key[:12]})"
+                )
+                return
+            with cache.store(key) as entry, map_lines(input_file) as lines:
+                count = grade_stream(
+                    lines, entry, field_delimiter, workers, stats=stats
+                )
+            cache.load(key, output_file)
+        elif checkpoint is None:
+            with map_lines(input_file) as lines:
+                count = grade_stream(
+                    lines, output_file, field_delimiter, workers, stats=stats
+                )
+        else:
+            count, done = grade_file(
+                input_file.name,
+                output_file.name,
+                checkpoint,
+                field_delimiter,
+                workers,
+                resume,
+                checkpoint_interval,
+                stats=stats,
+            )
+            if done:
+                logging.info(f"Resumed after {done} rows graded before.")
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="INPUT_FILE")
+    elapsed = time.perf_counter() - start
+    logging.debug(f"plan: {stats}")
+    if workers == 1:  # workers keep their own caches
+        logging.debug(f"answer cache: {ANSWER_CACHE.stats()}")
+    logging.info(
+        f"Graded {count} rows in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f} rows/s)"
+    )
+
+
+@app.command(name="table")
+def table(
+    ctx: typer.Context,
+    output_file: typer.FileTextWrite = typer.Option(
+        "-",
+        "--output-file",
+        "-o",
+        help="File to write the snapshot to, or - to write to stdout.",
+    ),
+    timings: bool = TIMINGS_OPTION,
+    profile: Optional[str] = PROFILE_OPTION,
+) -> None:
+    """
+
+    Write a JSON snapshot of the conversion table.
+
+    Keep the snapshot with the results graded by this version, so they
+    can be regraded with the regrade command after the table changes.
+
+    """
+    enable_diagnostics(ctx, timings, profile)
+    json.dump(export_table(REGISTRY), output_file, indent=1)
+    output_file.write("\n")
+
+
+@app.command(name="regrade")
+def regrade(
+    ctx: typer.Context,
+    results_file: typer.FileText = typer.Argument(
+        "-", help="CSV/TSV file of graded rows, or - to read from stdin."
+    ),
+    since: typer.FileText = typer.Option(
+        ...,
+        "--since",
+        help="Snapshot of the conversion table the results were graded with, "
+        "written by the table command.",
+        show_default=False,
+    ),
+    output_file: typer.FileTextWrite = typer.Option(
+        "-",
+        "--output-file",
+        "-o",
+        help="File to write the changed rows to, or - to write to stdout.",
+    ),
+    delimiter: Optional[str] = typer.Option(
+        None,
+        "--delimiter",
+        "-d",
+        help="Field delimiter. Defaults to tab for .tsv files, comma otherwise.",
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Enable verbose output."
+    ),
+    timings: bool = TIMINGS_OPTION,
+    profile: Optional[str] = PROFILE_OPTION,
+) -> None:
+    """
+
+    Regrade the rows of a result file whose conversion changed since an
+    older conversion table, and write only the rows whose result changed.
+
+    The file needs the input_value, from_unit, to_unit, student_response
+    and result columns, like the output of the batch command. Changed rows
+    keep their columns, with the old result in the previous_result column.
+
+    """
+    enable_diagnostics(ctx, timings, profile)
+    with contextlib.redirect_stdout(sys.stderr):  # keep stdout for changed rows
+        enableLogging(verbose)
+    field_delimiter = resolve_delimiter(results_file.name, delimiter)
+    try:
+        diff = diff_tables(json.load(since), export_table(REGISTRY))
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="'--since'")
+    logging.debug(f"changed pairs: {sorted(diff.pairs)}")
+    logging.debug(f"changed units: {sorted(diff.units)}")
+    stats = PlanStats()
+    try:
+        read, regraded, changed = regrade_stream(
+            results_file, output_file, diff, field_delimiter, stats=stats
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="RESULTS_FILE")
+    logging.debug(f"plan: {stats}")
+    logging.info(
+        f"Regraded {regraded} of {read} rows, {changed} results changed "
+        f"({len(diff.pairs)} conversions and {len(diff.units)} units changed)"
+    )
+
+
+@app.command(name="serve")
+def serve_command(
+    ctx: typer.Context,
+    socket_path: str = typer.Option(
+        DEFAULT_SOCKET_PATH,
+        "--socket",
+        help="Unix socket to listen on.",
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Enable verbose output."
+    ),
+    timings: bool = TIMINGS_OPTION,
+    profile: Optional[str] = PROFILE_OPTION,
+) -> None:
+    """
+
+    Answer grading requests over a Unix socket until interrupted.
+
+    Each request is a JSON object on its own line with the input_value,
+    from_unit, to_unit and student_response fields (and an optional id).
+    Each reply is a JSON object on its own line with the grade in result.
+
+    """
+    enable_diagnostics(ctx, timings, profile)
+    from unit_grader.commands.server import serve
+
+    enableLogging(verbose)
+    logging.debug(f"socket: {socket_path}")
+    print(f"[green]Grading server listening on {socket_path}[/green]")
+    try:
+        serve(socket_path)
+    except FileExistsError as e:
+        raise typer.BadParameter(str(e), param_hint="'--socket'")
+
+
+@app.command(name="stream")
+def stream_command(
+    ctx: typer.Context,
+    flush_lines: int = typer.Option(
+        DEFAULT_FLUSH_LINES,
+        "--flush-lines",
+        min=1,
+        help="Maximum number of replies written in one flush.",
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Enable verbose output."
+    ),
+    timings: bool = TIMINGS_OPTION,
+    profile: Optional[str] = PROFILE_OPTION,
+) -> None:
+    """
+
+    Grade newline-delimited JSON requests from stdin and write one JSON
+    reply per line to stdout, in the same order.
+
+    Each request is a JSON object with the input_value, from_unit, to_unit
+    and student_response fields (and an optional id). Replies are flushed
+    in batches, and as soon as no more input is waiting.
+
+    """
+    enable_diagnostics(ctx, timings, profile)
+    with contextlib.redirect_stdout(sys.stderr):  # keep stdout for replies
+        enableLogging(verbose)
+    logging.debug(f"flush_lines: {flush_lines}")
+    start = time.perf_counter()
+    count = grade_ndjson(sys.stdin, sys.stdout, flush_lines)
+    elapsed = time.perf_counter() - start
+    logging.debug(f"answer cache: {ANSWER_CACHE.stats()}")
+    logging.debug(
+        f"Graded {count} requests in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f} requests/s)"
+    )
+
+
+@app.command(name="bench")
+def bench_command(
+    ctx: typer.Context,
+    suites: Optional[List[str]] = typer.Option(
+        None,
+        "--suite",
+        help="Benchmark group to run: micro, batch or startup. Repeat for several. Defaults to all.",
+        show_default=False,
+    ),
+    batch_rows: Optional[List[int]] = typer.Option(
+        None,
+        "--rows",
+        min=1,
+        help="Rows of a generated batch file. Repeat for several. Defaults to 1000, 100000 and 10000000.",
+        show_default=False,
+    ),
+    repeat: int = typer.Option(5, "--repeat", min=1, help="Repeats of each benchmark."),
+    number: int = typer.Option(
+        1000, "--number", min=1, help="Calls per repeat of the micro benchmarks."
+    ),
+    output_file: typer.FileTextWrite = typer.Option(
+        "-",
+        "--output-file",
+        "-o",
+        help="File to write the JSON results to, or - to write to stdout.",
+    ),
+    baseline_file: Optional[typer.FileText] = typer.Option(
+        None, "--baseline", help="JSON results of a previous run to compare with."
+    ),
+    threshold: float = typer.Option(
+        0.1,
+        "--threshold",
+        min=0,
+        help="Slowdown over the baseline reported as a regression (0.1 = 10%).",
+    ),
+    timings: bool = TIMINGS_OPTION,
+    profile: Optional[str] = PROFILE_OPTION,
+) -> None:
+    """
+
+    Run the benchmark suite and write the results as JSON.
+
+    Every result is the best time per operation in seconds. With --baseline,
+    benchmarks slower than the baseline by more than the threshold are
+    reported and the command exits with code 1.
+
+    """
+    enable_diagnostics(ctx, timings, profile)
+    from unit_grader.commands.bench import (
+        DEFAULT_BATCH_ROWS,
+        SUITES,
+        compare_results,
+        load_results,
+        run_benchmarks,
+    )
+
+    baseline = None
+    if baseline_file is not None:
+        try:
+            baseline = load_results(baseline_file)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="'--baseline'")
+    try:
+        results = run_benchmarks(
+            tuple(suites or SUITES),
+            tuple(batch_rows or DEFAULT_BATCH_ROWS),
+            number,
+            repeat,
+            progress=lambda name: typer.echo(f"Running {name}", err=True),
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="'--suite'")
+    json.dump(results, output_file, indent=2)
+    output_file.write("\n")
+    if baseline is None:
+        return
+    regressions = compare_results(results, baseline, threshold)
+    for regression in regressions:
+        typer.echo(
+            f"Regression: {regression.name} {regression.baseline:.3g}s -> "
+            f"{regression.current:.3g}s (+{regression.slowdown:.0%})",
+            err=True,
+        )
+    if regressions:
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,144 @@
+"""
+This module provides a client for the unit-grader server.
+
+It only depends on the standard library so callers can grade submissions
+through a running `unit-grader serve` process without importing numpy,
+typer or rich themselves.
+
+Main Classes:
+    - GraderClient: Send grading requests over the server's Unix socket.
+"""
+import itertools
+import json
+import os
+import socket
+import tempfile
+from typing import Iterable, Iterator, Optional
+
+from .config.enums import Answer
+
+# Unix socket the server listens on when no path is given
+DEFAULT_SOCKET_PATH: str = os.path.join(tempfile.gettempdir(), "unit-grader.sock")
+
+# Requests sent at once; at most two windows of replies are left unread, so
+# they fit in the socket buffers and the server never blocks writing them
+SEND_WINDOW: int = 256
+
+
+class GraderClient:
+    """
+    This class sends grading requests to a unit-grader server.
+
+    Requests are newline-delimited JSON objects and share one connection,
+    so the client can be used for many grades in a row:
+
+        with GraderClient() as client:
+            client.grade("100", "Kelvin", "Celsius", "-173.15")
+    """
+
+    def __init__(
+        self, socket_path: str = DEFAULT_SOCKET_PATH, timeout: Optional[float] = 5.0
+    ) -> None:
+        """
+        Connect to the server.
+
+        Args:
+            socket_path (str): The Unix socket the server listens on.
+            timeout (float): The timeout in seconds for each request.
+        """
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(socket_path)
+        self._reader = self._socket.makefile("rb")
+
+    def __enter__(self) -> "GraderClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connection to the server.
+
+        Returns:
+            None
+        """
+        self._reader.close()
+        self._socket.close()
+
+    def request(self, payloads: Iterable[dict]) -> Iterator[dict]:
+        """
+        Send raw requests to the server and read one reply for each.
+
+        Requests are sent a window at a time while the replies to the
+        previous window are read, so a batch costs about one round trip
+        without both sides blocking on full socket buffers.
+
+        Args:
+            payloads (Iterable[dict]): The requests to send.
+
+        Yields:
+            dict: The reply to each request, in order.
+
+        Raises:
+            ConnectionError: If the server closes the connection.
+        """
+        payloads = iter(payloads)
+        pending = 0
+        while True:
+            window = list(itertools.islice(payloads, SEND_WINDOW))
+            if window:
+                self._socket.sendall(
+                    b"".join(json.dumps(payload).encode() + b"\n" for payload in window)
+                )
+                pending += len(window)
+            while pending > (SEND_WINDOW if window else 0):
+                yield self._read_reply()
+                pending -= 1
+            if not window:
+                return
+
+    def _read_reply(self) -> dict:
+        """
+        Read the next reply from the server.
+
+        Returns:
+            dict: The decoded reply.
+
+        Raises:
+            ConnectionError: If the server closes the connection.
+        """
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("unit-grader server closed the connection.")
+        return json.loads(line)
+
+    def grade(
+        self, input_value: str, from_unit: str, to_unit: str, student_response: str
+    ) -> Answer:
+        """
+        Grade a student's response to a conversion question.
+
+        Args:
+            input_value (str): The input value provided in the question.
+            from_unit (str): The unit mentioned in the question.
+            to_unit (str): The target unit mentioned in the question.
+            student_response (str): The student's response.
+
+        Returns:
+            Answer: The result of the grading.
+
+        Raises:
+            ValueError: If the server rejects the request.
+        """
+        payload = {
+            "input_value": input_value,
+            "from_unit": from_unit,
+            "to_unit": to_unit,
+            "student_response": student_response,
+        }
+        (reply,) = self.request([payload])
+        if "error" in reply:
+            raise ValueError(reply["error"])
+        return Answer(reply["result"])
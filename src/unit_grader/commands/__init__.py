@@ -8,5 +8,31 @@ The commands package contains the following modules:
   - conversion_grader: Contains the functions for converting
     units of measure and grading student responses
     to conversion questions.
+  - array_grader: Contains the functions for grading whole
+    columns of submissions at once with numpy.
+  - batch_grader: Contains the functions for grading a CSV/TSV
+    file of submissions in a single process.
+  - args_file_grader: Contains the grading of a file of
+    single-grade command lines in one process.
+  - result_store: Contains the compact columns keeping the
+    grades of a whole batch of submissions in memory.
+  - mapped_reader: Contains the reading of submission files
+    through a read-only memory map.
+  - batch_checkpoint: Contains the checkpoints making batch
+    grading of large files resumable.
+  - result_cache: Contains the on-disk cache of the graded
+    output of submission files.
+  - regrader: Contains the snapshots of the conversion table
+    and the regrading of prior results after it changed.
+  - async_grader: Contains the asyncio grading API batching
+    concurrent requests.
+  - json_requests: Contains the grading of newline-delimited
+    JSON requests shared by the server and the stream grader.
+  - server: Contains the grading server answering requests
+    over a Unix socket.
+  - stream_grader: Contains the grading of newline-delimited
+    JSON requests from one stream to another.
+  - bench: Contains the benchmark suite and the comparison
+    of its results with a baseline.
 
 """
@@ -0,0 +1,151 @@
+"""
+This module grades a file of single-grade command lines in one process.
+
+Each line of an argument file holds the options of one single-grade
+command, optionally after the program name, so the command lines that
+scripts used to run one at a time can be written to a file unchanged:
+
+    unit-grader -i 100 -f Kelvin -t Celsius -s -173.15
+    --input-value=32 --from-unit Celsius --to-unit Kelvin -s 305.2
+
+Lines are split like a POSIX shell splits them. Blank lines and comments
+starting with # are skipped. The --output and --verbose options of a line
+are accepted but ignored: the output format of the whole file applies.
+
+The lines are graded a chunk at a time like a batch file, see grade_plan,
+and the results are written in line order.
+
+Main Functions:
+    - parse_invocation: Parse the question of one command line.
+    - grade_args_file: Grade every command line of an argument file.
+"""
+import itertools
+import json
+import logging
+import os
+import shlex
+import sys
+from typing import Iterable, Optional
+
+from .. import __feedback_url__
+from ..config.enums import OutputFormat
+from ..utils.options import parse_single_grade
+from ..utils.rendering import print_feedback, print_grade_result, write_grade_result
+from .batch_grader import (
+    DEFAULT_CHUNK_SIZE,
+    REQUIRED_COLUMNS,
+    PlanStats,
+    grade_plan,
+)
+
+# Name of the program that may start a command line
+PROGRAM_NAME: str = "unit-grader"
+
+# Exit code of an argument file with lines that are not single-grade commands
+USAGE_ERROR: int = 2
+
+
+def parse_invocation(line: str) -> Optional[tuple]:
+    """
+    Parse the question of one command line of an argument file.
+
+    Args:
+        line (str): The command line.
+
+    Returns:
+        tuple: The (input_value, from_unit, to_unit, student_response) question.
+        None: If the line is blank or a comment.
+
+    Raises:
+        ValueError: If the line is not a single-grade command.
+    """
+    try:
+        args = shlex.split(line, comments=True)
+    except ValueError as error:
+        raise ValueError(f"Invalid command line: {error}.") from None
+    if not args:
+        return None
+    if os.path.basename(args[0]) == PROGRAM_NAME:
+        args = args[1:]
+    params = parse_single_grade(args)
+    if params is None:
+        raise ValueError(f"Not a single-grade command: {line.strip()}")
+    return tuple(params[name] for name in REQUIRED_COLUMNS)
+
+
+def grade_args_file(
+    source: Iterable[str],
+    output: str = OutputFormat.RICH.value,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Grade every command line of an argument file and write the results.
+
+    Each result is written like the single-grade command writes it in the
+    given output format, in line order. The feedback request of the rich
+    format is printed once at the end. A line that is not a single-grade
+    command is logged as an error, and gets an {"error": ...} line in the
+    json format and an error line in the plain format.
+
+    Args:
+        source (Iterable[str]): The lines of the argument file.
+        output (str): The output format: rich, json, plain or exit-code.
+        chunk_size (int): The number of lines graded at a time.
+
+    Returns:
+        int: 2 if a line is not a single-grade command. Otherwise 0 for the
+        rich format and the highest exit code of the results for the others.
+    """
+    stats = PlanStats()
+    exit_code = 0
+    usage_error = False
+    lines = enumerate(source, 1)
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            break
+        questions: list = []
+        slots: list = []
+        for number, line in chunk:
+            try:
+                question = parse_invocation(line)
+            except ValueError as error:
+                slots.append(f"Line {number}: {error}")
+                continue
+            if question is not None:
+                slots.append(len(questions))
+                questions.append(question)
+        results: list = [None] * len(questions)
+        for positions, result in grade_plan(questions, stats):
+            for position in positions:
+                results[position] = result
+        for slot in slots:
+            if isinstance(slot, str):
+                write_line_error(slot, output)
+                usage_error = True
+            elif output == OutputFormat.RICH.value:
+                print_grade_result(results[slot])
+            else:
+                exit_code = max(exit_code, write_grade_result(results[slot], output))
+    logging.debug(f"plan: {stats}")
+    if output == OutputFormat.RICH.value:
+        print_feedback(__feedback_url__)
+    return USAGE_ERROR if usage_error else exit_code
+
+
+def write_line_error(error: str, output: str) -> None:
+    """
+    Report a line of an argument file that is not a single-grade command.
+
+    Args:
+        error (str): The error message, with the line number.
+        output (str): The output format: rich, json, plain or exit-code.
+
+    Returns:
+        None
+    """
+    logging.error(error)
+    if output == OutputFormat.JSON.value:
+        sys.stdout.write(json.dumps({"error": error}) + "\n")
+    elif output == OutputFormat.PLAIN.value:
+        sys.stdout.write("error\n")
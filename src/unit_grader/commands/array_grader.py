@@ -0,0 +1,153 @@
+"""
+This module grades whole columns of submissions at once with numpy.
+
+Main Functions:
+    - parse_numeric_column: Parse a column of numeric strings into floats.
+    - group_units: Group rows by their pair of encoded units.
+    - grade_array: Grade columns of submissions and return compact answer codes.
+    - decode_answers: Turn answer codes back into Answer members.
+
+The unit columns are dictionary-encoded into uint8 unit ids, so each
+distinct unit name is resolved once and unknown or mismatched units are
+flagged in a single vectorized pass. The remaining rows are grouped by
+(from_unit, to_unit) so each conversion runs once over a float64 array.
+Rounded values are compared as int64 tenths and rounding follows
+grade_response exactly, so the codes match the scalar path row for row.
+"""
+from typing import Sequence
+
+import numpy as np
+
+from ..config.data import CONVERSION_DATA, UNIT_INDEX
+from ..config.enums import AnswerCode
+from ..config.index import UNKNOWN_UNIT
+from ..utils.numeric import parse_numbers
+from ..utils.tenths import to_tenths_array
+
+
+def parse_numeric_column(values: Sequence) -> tuple:
+    """
+    Parse a column of numeric strings into a float64 array.
+
+    Every entry is validated without raising exceptions, see parse_numbers.
+
+    Args:
+        values (Sequence): The numeric strings (or numbers) to parse.
+
+    Returns:
+        tuple: The parsed float64 array (NaN where invalid) and a boolean
+        array flagging the valid entries.
+    """
+    return parse_numbers(values)
+
+
+def group_units(from_ids: np.ndarray, to_ids: np.ndarray) -> dict:
+    """
+    Group row indexes by their pair of encoded units.
+
+    Rows with an unknown unit, or whose units belong to different
+    categories, are left out.
+
+    Args:
+        from_ids (np.ndarray): The uint8 unit id of each question's unit,
+            see UnitIndex.encode.
+        to_ids (np.ndarray): The uint8 unit id of each question's target unit.
+
+    Returns:
+        dict: The int64 array of row indexes, in order, for each
+        (from_unit, to_unit) pair of unit names.
+    """
+    rows = np.flatnonzero((from_ids != UNKNOWN_UNIT) & (to_ids != UNKNOWN_UNIT))
+    rows = rows[UNIT_INDEX.convertible[from_ids[rows], to_ids[rows]]]
+    pairs = from_ids[rows].astype(np.intp) * (UNKNOWN_UNIT + 1) + to_ids[rows]
+    order = np.argsort(pairs, kind="stable")
+    keys, starts = np.unique(pairs[order], return_index=True)
+    units = UNIT_INDEX.units
+    return {
+        (units[key // (UNKNOWN_UNIT + 1)], units[key % (UNKNOWN_UNIT + 1)]): group
+        for key, group in zip(keys.tolist(), np.split(rows[order], starts[1:]))
+    }
+
+
+def grade_array(
+    input_values: Sequence,
+    from_units: Sequence,
+    to_units: Sequence,
+    responses: Sequence,
+    conversion_data: dict = CONVERSION_DATA,
+) -> np.ndarray:
+    """
+    Grade columns of submissions to conversion questions.
+
+    Each row is graded like grade_response: invalid input values or units
+    are invalid, non-numeric responses are incorrect, and otherwise the
+    response is correct if it matches the converted value after both are
+    rounded to the tenths place (round half to even).
+
+    Args:
+        input_values (Sequence): The input value of each question.
+        from_units (Sequence): The unit of each question.
+        to_units (Sequence): The target unit of each question.
+        responses (Sequence): The student's response to each question.
+        conversion_data (dict): The conversion data.
+
+    Returns:
+        np.ndarray: The int8 AnswerCode of each row.
+
+    Raises:
+        ValueError: If the columns do not have the same length.
+    """
+    size = len(input_values)
+    if not (len(from_units) == len(to_units) == len(responses) == size):
+        raise ValueError("All columns must have the same length.")
+    codes = np.full(size, AnswerCode.INVALID, dtype=np.int8)
+    if size == 0:
+        return codes
+    values, values_valid = parse_numeric_column(input_values)
+    answers, answers_valid = parse_numeric_column(responses)
+    answer_tenths, answers_exact = to_tenths_array(answers)
+    groups = group_units(UNIT_INDEX.encode(from_units), UNIT_INDEX.encode(to_units))
+    with np.errstate(all="ignore"):
+        for (from_unit, to_unit), rows in groups.items():
+            category = UNIT_INDEX.category_of(from_unit)
+            rows = rows[values_valid[rows]]
+            if from_unit == to_unit:
+                correct = values[rows]
+            else:
+                conversion_func = conversion_data.get(category, {}).get(
+                    (from_unit, to_unit)
+                )
+                if not callable(conversion_func):
+                    continue
+                try:
+                    converted = conversion_func(values[rows])
+                except Exception:
+                    continue
+                correct = np.round(converted, 3)
+            correct_tenths, correct_exact = to_tenths_array(correct)
+            matches = correct_tenths == answer_tenths[rows]
+            inexact = ~(correct_exact & answers_exact[rows]) & answers_valid[rows]
+            if inexact.any():  # no exact tenths, compare the rounded floats
+                matches[inexact] = np.round(correct[inexact], 1) == np.round(
+                    answers[rows[inexact]], 1
+                )
+            codes[rows] = np.where(
+                answers_valid[rows] & matches,
+                AnswerCode.CORRECT,
+                AnswerCode.INCORRECT,
+            )
+    return codes
+
+
+def decode_answers(codes: np.ndarray) -> list:
+    """
+    Turn answer codes back into Answer members.
+
+    Args:
+        codes (np.ndarray): The AnswerCode of each row.
+
+    Returns:
+        list[Answer]: The grading result of each row.
+    """
+    answers = [code.answer for code in AnswerCode]
+    return [answers[code] for code in codes.tolist()]
@@ -0,0 +1,194 @@
+"""
+This module grades from asyncio code by micro-batching concurrent requests.
+
+Requests awaiting a grade are collected for a short delay (a few hundred
+microseconds by default) and graded together like a chunk of a batch file,
+see grade_plan: each question is solved once, each distinct response is
+graded once, and large groups of responses are compared in a single
+vectorized pass. Each request then gets its own GradeResult. Grading never
+prints and never leaves the event loop thread, so there is no executor
+hop per request.
+
+    async def handler(request):
+        result = await grade("100", "Kelvin", "Celsius", "-173.15")
+        return result.answer.value
+
+Main Classes:
+    - AsyncGrader: Collect concurrent grading requests into batches.
+
+Main Functions:
+    - grade: Grade a student's response with the grader of the running loop.
+"""
+import asyncio
+import copy
+import weakref
+from typing import Optional
+
+from .batch_grader import PlanStats, grade_plan
+from .conversion_grader import GradeResult
+from .conversion_grader import grade as grade_now
+
+# Seconds a request waits for others before its batch is graded
+DEFAULT_MAX_DELAY: float = 0.0003
+
+# Requests graded at most in one batch
+DEFAULT_MAX_BATCH: int = 1024
+
+# The default grader of each running event loop
+_GRADERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class AsyncGrader:
+    """
+    This class collects concurrent grading requests into batches.
+
+    A batch is graded when the first of its requests has waited max_delay
+    seconds or when it holds max_batch requests, whichever comes first.
+    A grader belongs to the event loop of its first request.
+
+    Attributes:
+        max_delay (float): Seconds a request waits for others.
+        max_batch (int): Requests graded at most in one batch.
+        stats (PlanStats): The plan stats of every graded batch.
+    """
+
+    def __init__(
+        self,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """
+        Create a grader without pending requests.
+
+        Args:
+            max_delay (float): Seconds a request waits for others.
+            max_batch (int): Requests graded at most in one batch.
+
+        Raises:
+            ValueError: If max_delay is negative or max_batch is less than 1.
+        """
+        if max_delay < 0:
+            raise ValueError(f"Batch delay must not be negative, got {max_delay}.")
+        if max_batch < 1:
+            raise ValueError(f"Batch size must be at least 1, got {max_batch}.")
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.stats = PlanStats()
+        self._pending: list = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def grade(
+        self,
+        input_value: str,
+        from_unit: str,
+        to_unit: str,
+        student_response: str,
+    ) -> GradeResult:
+        """
+        Grade a student's response to a conversion question in the next batch.
+
+        Args:
+            input_value (str): The input value provided in the question.
+            from_unit (str): The unit mentioned in the question.
+            to_unit (str): The target unit mentioned in the question.
+            student_response (str): The student's response.
+
+        Returns:
+            GradeResult: The result of the grading, like
+            conversion_grader.grade. Identical requests of a batch get
+            copies of one result.
+
+        Raises:
+            Exception: Whatever conversion_grader.grade raises for the request.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        question = (input_value, from_unit, to_unit, student_response)
+        self._pending.append((question, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """
+        Grade every pending request now and resolve its future.
+
+        Requests that were cancelled meanwhile are skipped. If the batch
+        cannot be graded (e.g. a field is not hashable), the remaining
+        requests are graded one at a time, and a request that still fails
+        gets the exception instead of a result.
+
+        Returns:
+            None
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            plan = grade_plan([question for question, _ in pending], self.stats)
+            for positions, result in plan:
+                resolve(pending[positions[0]][1], result)
+                for position in positions[1:]:
+                    resolve(pending[position][1], copy.copy(result))
+        except Exception:
+            for question, future in pending:
+                if not future.done():
+                    try:
+                        future.set_result(grade_now(*question))
+                    except Exception as e:
+                        future.set_exception(e)
+
+
+def resolve(future: asyncio.Future, result: GradeResult) -> None:
+    """
+    Resolve the future of a request, unless it was cancelled.
+
+    Args:
+        future (asyncio.Future): The future of the request.
+        result (GradeResult): The result of the grading.
+
+    Returns:
+        None
+    """
+    if not future.done():
+        future.set_result(result)
+
+
+def default_grader() -> AsyncGrader:
+    """
+    Get the default grader of the running event loop.
+
+    Returns:
+        AsyncGrader: The grader, created on first use.
+    """
+    loop = asyncio.get_running_loop()
+    grader = _GRADERS.get(loop)
+    if grader is None:
+        grader = _GRADERS[loop] = AsyncGrader()
+    return grader
+
+
+async def grade(
+    input_value: str, from_unit: str, to_unit: str, student_response: str
+) -> GradeResult:
+    """
+    Grade a student's response to a conversion question without blocking
+    on other requests, with the default grader of the running event loop.
+
+    Args:
+        input_value (str): The input value provided in the question.
+        from_unit (str): The unit mentioned in the question.
+        to_unit (str): The target unit mentioned in the question.
+        student_response (str): The student's response.
+
+    Returns:
+        GradeResult: The result of the grading.
+    """
+    return await default_grader().grade(
+        input_value, from_unit, to_unit, student_response
+    )
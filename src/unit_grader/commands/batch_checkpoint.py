@@ -0,0 +1,296 @@
+"""
+This module makes batch grading of large submission files resumable.
+
+While a file is graded, a checkpoint is written every few minutes at the
+end of a chunk of rows: the byte offset of the next row to read, the
+number of rows done, the byte size of the output written so far and the
+fingerprint of the conversion table. Each checkpoint is written only after
+the output it points to is on disk, and replaces the previous one
+atomically.
+
+A run resumed from a checkpoint truncates the output to that size, seeks
+the input to that offset and grades only the remaining rows, so its output
+is the same as the one of an uninterrupted run. A checkpoint written with
+another conversion table is refused, since its rows were graded with other
+answers.
+
+Main Classes:
+    - Checkpoint: The progress of a batch grading run.
+    - OffsetLines: Read the lines of a binary stream, counting their bytes.
+
+Main Functions:
+    - load_checkpoint: Read the checkpoint of a run.
+    - save_checkpoint: Replace the checkpoint of a run.
+    - grade_file: Grade a submission file with checkpoints.
+"""
+import csv
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import BinaryIO, Iterator, NamedTuple, Optional, TextIO, Union
+
+from ..config.data import REGISTRY
+from .batch_grader import (
+    CSV_DELIMITER,
+    DEFAULT_CHUNK_SIZE,
+    PlanStats,
+    grade_rows,
+    grade_rows_parallel,
+    graded_writer,
+)
+from .mapped_reader import MappedLines
+
+# Seconds between two checkpoints
+DEFAULT_CHECKPOINT_INTERVAL: float = 60.0
+
+# Encoding of submission files graded with checkpoints
+ENCODING: str = "utf-8"
+
+
+class Checkpoint(NamedTuple):
+    """
+    This class contains the progress of a batch grading run.
+
+    Attributes:
+        input_offset (int): The byte offset of the next row to read.
+        rows (int): The number of rows graded and written.
+        output_offset (int): The byte size of the output written so far.
+        table_hash (str): The fingerprint of the conversion table.
+    """
+
+    input_offset: int
+    rows: int
+    output_offset: int
+    table_hash: str
+
+
+class OffsetLines:
+    """
+    This class reads the lines of a binary stream and counts their bytes.
+
+    Attributes:
+        offset (int): The byte offset following the last line read.
+    """
+
+    __slots__ = ("offset", "_raw")
+
+    def __init__(self, raw: BinaryIO, offset: int = 0) -> None:
+        """
+        Read lines from the current position of a binary stream.
+
+        Args:
+            raw (BinaryIO): The binary stream.
+            offset (int): The current position of the stream.
+        """
+        self.offset = offset
+        self._raw = raw
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Read the lines of the stream.
+
+        Yields:
+            str: Each decoded line, with its line terminator.
+        """
+        for line in self._raw:
+            self.offset += len(line)
+            yield line.decode(ENCODING)
+
+    def seek(self, offset: int) -> None:
+        """
+        Continue reading at another byte offset.
+
+        Args:
+            offset (int): The byte offset of the next line to read.
+
+        Returns:
+            None
+        """
+        self._raw.seek(offset)
+        self.offset = offset
+
+
+def load_checkpoint(path: str) -> Optional[Checkpoint]:
+    """
+    Read the checkpoint of a run.
+
+    Args:
+        path (str): The path of the checkpoint file.
+
+    Returns:
+        Checkpoint: The progress of the run.
+        None: If there is no checkpoint file.
+
+    Raises:
+        ValueError: If the file is not a checkpoint.
+    """
+    try:
+        with open(path, encoding=ENCODING) as file:
+            fields = json.load(file)
+        return Checkpoint(**fields)
+    except FileNotFoundError:
+        return None
+    except (TypeError, ValueError):
+        raise ValueError(f"{path} is not a checkpoint file.") from None
+
+
+def save_checkpoint(path: str, checkpoint: Checkpoint) -> None:
+    """
+    Replace the checkpoint of a run atomically.
+
+    Args:
+        path (str): The path of the checkpoint file.
+        checkpoint (Checkpoint): The progress of the run.
+
+    Returns:
+        None
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding=ENCODING) as file:
+        json.dump(checkpoint._asdict(), file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def grade_file(
+    input_path: str,
+    output_path: str,
+    checkpoint_path: str,
+    delimiter: str = CSV_DELIMITER,
+    workers: int = 1,
+    resume: bool = False,
+    interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[PlanStats] = None,
+) -> tuple:
+    """
+    Grade a CSV/TSV submission file like grade_stream, with checkpoints.
+
+    A checkpoint is written at the end of the first chunk of rows graded
+    interval seconds after the previous one, and once every row is graded.
+    The submission file is read through a memory map, see MappedLines,
+    unless it is not a regular file.
+
+    Args:
+        input_path (str): The path of the submission file.
+        output_path (str): The path of the file to write graded rows to.
+        checkpoint_path (str): The path of the checkpoint file.
+        delimiter (str): The field delimiter of both files.
+        workers (int): The number of worker processes.
+        resume (bool): Continue from the checkpoint, if there is one.
+        interval (float): The minimum number of seconds between checkpoints.
+        chunk_size (int): The number of rows planned together.
+        stats (PlanStats): Counts the rows and groups, if given.
+
+    Returns:
+        tuple: The number of rows graded by this run, and the number of
+        rows graded before, by the run it resumed.
+
+    Raises:
+        ValueError: If the header misses one of the required columns, or
+        the checkpoint does not match the conversion table or the files.
+    """
+    table_hash = REGISTRY.fingerprint()
+    checkpoint = load_checkpoint(checkpoint_path) if resume else None
+    if checkpoint is not None:
+        check_resumable(checkpoint, table_hash, input_path, output_path)
+    with open(input_path, "rb") as raw, open(
+        output_path, "w" if checkpoint is None else "r+", encoding=ENCODING, newline=""
+    ) as sink:
+        try:
+            lines: Union[MappedLines, OffsetLines] = MappedLines(raw, ENCODING)
+        except OSError:  # not a regular file, e.g. a named pipe
+            lines = OffsetLines(raw)
+        reader = csv.DictReader(lines, delimiter=delimiter)
+        writer = graded_writer(reader, sink, delimiter)
+        if checkpoint is None:
+            writer.writeheader()
+            done = 0
+        else:
+            lines.seek(checkpoint.input_offset)
+            sink.seek(checkpoint.output_offset)
+            sink.truncate()
+            done = checkpoint.rows
+        offsets: deque = deque()  # input offset at the end of each chunk read
+
+        def read_rows() -> Iterator[dict]:
+            for number, row in enumerate(reader, 1):
+                if number % chunk_size == 0:
+                    offsets.append(lines.offset)
+                yield row
+
+        if workers > 1:
+            graded = grade_rows_parallel(read_rows(), workers, chunk_size, stats)
+        else:
+            graded = grade_rows(read_rows(), chunk_size, stats)
+        count = 0
+        saved = time.monotonic()
+        for row in graded:
+            writer.writerow(row)
+            count += 1
+            if count % chunk_size:
+                continue
+            offset = offsets.popleft()
+            if time.monotonic() - saved >= interval:
+                save_progress(checkpoint_path, sink, offset, done + count, table_hash)
+                saved = time.monotonic()
+        save_progress(checkpoint_path, sink, lines.offset, done + count, table_hash)
+    return count, done
+
+
+def check_resumable(
+    checkpoint: Checkpoint, table_hash: str, input_path: str, output_path: str
+) -> None:
+    """
+    Check that a run can resume from a checkpoint.
+
+    Args:
+        checkpoint (Checkpoint): The progress of the interrupted run.
+        table_hash (str): The fingerprint of the current conversion table.
+        input_path (str): The path of the submission file.
+        output_path (str): The path of the file of graded rows.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If the conversion table changed, or either file is
+        shorter than the checkpoint says.
+    """
+    if checkpoint.table_hash != table_hash:
+        raise ValueError(
+            "The conversion table changed since the checkpoint was written. "
+            "Grade the file again without --resume."
+        )
+    if os.path.getsize(input_path) < checkpoint.input_offset:
+        raise ValueError(f"{input_path} is shorter than at the checkpoint.")
+    if not os.path.exists(output_path):
+        raise ValueError(f"{output_path} of the checkpoint does not exist.")
+    if os.path.getsize(output_path) < checkpoint.output_offset:
+        raise ValueError(f"{output_path} is shorter than at the checkpoint.")
+
+
+def save_progress(
+    path: str, sink: TextIO, input_offset: int, rows: int, table_hash: str
+) -> None:
+    """
+    Write the graded rows to disk, then the checkpoint pointing past them.
+
+    Args:
+        path (str): The path of the checkpoint file.
+        sink (TextIO): The file of graded rows.
+        input_offset (int): The byte offset of the next row to read.
+        rows (int): The number of rows graded and written.
+        table_hash (str): The fingerprint of the conversion table.
+
+    Returns:
+        None
+    """
+    sink.flush()
+    os.fsync(sink.fileno())
+    checkpoint = Checkpoint(input_offset, rows, sink.tell(), table_hash)
+    save_checkpoint(path, checkpoint)
+    logging.debug(f"checkpoint: {checkpoint}")
@@ -0,0 +1,528 @@
+"""
+This module grades a whole file of submissions in a single process.
+
+Main Functions:
+    - resolve_delimiter: Pick the field delimiter for a submission file.
+    - plan_questions: Group the submissions of a chunk by question.
+    - grade_plan: Grade a chunk of submissions question by question.
+    - grade_questions: Grade a chunk of submissions into a ResultStore.
+    - grade_results: Grade an iterable of submissions in chunks into a
+      ResultStore.
+    - grade_rows: Grade an iterable of submission rows in chunks.
+    - grade_rows_parallel: Grade submission rows in chunks on worker processes.
+    - graded_writer: Check the header of a submission file and build the
+      writer of its graded rows.
+    - grade_stream: Read submissions from a CSV/TSV stream and write
+      the graded rows to another stream.
+
+Every row must provide the input_value, from_unit, to_unit and
+student_response columns. Any other column (e.g. a student id) is passed
+through untouched and the grade is appended in the result column.
+
+Submission files usually hold a few questions answered by many students,
+so rows are graded a chunk at a time: the rows of a chunk are grouped by
+(input_value, from_unit, to_unit) question, the correct answer of each
+question is computed once, and the responses of large groups are compared
+with it in a single vectorized pass. PlanStats counts the groups and how
+many rows reuse each correct answer. The grades of a chunk are kept in a
+ResultStore, which encodes each distinct result once, and worker
+processes send back that store rather than a pair of strings per row.
+
+The unit columns of each chunk are dictionary-encoded into uint8 unit ids,
+resolving each distinct name against the unit index once, and questions
+are grouped on those ids. Rows naming an unknown unit are flagged in the
+same pass and grouped apart, under the units as read, since they are
+invalid whatever the rest of the row says.
+"""
+import csv
+import itertools
+import sys
+from collections import deque
+from typing import Iterable, Iterator, Optional, TextIO
+
+from ..config.data import UNIT_INDEX
+from ..config.enums import Answer, ErrorCode
+from ..config.index import UNKNOWN_UNIT
+from ..utils.common import round_half_even
+from ..utils.numeric import parse_numbers
+from ..utils.tenths import to_tenths, to_tenths_array
+from ..utils.timings import TIMINGS
+from .conversion_grader import (
+    GradeResult,
+    grade_solved,
+    parse_question,
+    solve_cached,
+)
+from .result_store import ResultStore
+
+# Columns every submission file must provide
+REQUIRED_COLUMNS: tuple = (
+    "input_value",
+    "from_unit",
+    "to_unit",
+    "student_response",
+)
+
+# Column appended to every graded row
+RESULT_COLUMN: str = "result"
+
+# Rows planned together, and sent to a worker process at a time
+DEFAULT_CHUNK_SIZE: int = 10_000
+
+# Smallest group of responses compared in a single vectorized pass
+VECTORIZE_MIN_ROWS: int = 16
+
+# Default field delimiters
+CSV_DELIMITER: str = ","
+TSV_DELIMITER: str = "\t"
+
+
+def resolve_delimiter(file_name: str, delimiter: Optional[str] = None) -> str:
+    """
+    Pick the field delimiter for a submission file.
+
+    Args:
+        file_name (str): The name of the submission file.
+        delimiter (str): The delimiter requested by the user, if any.
+
+    Returns:
+        str: The requested delimiter, a tab for .tsv files or a comma otherwise.
+    """
+    if delimiter:
+        return TSV_DELIMITER if delimiter in ("\\t", "tab") else delimiter
+    if str(file_name).lower().endswith(".tsv"):
+        return TSV_DELIMITER
+    return CSV_DELIMITER
+
+
+class PlanStats:
+    """
+    This class counts how batch grading was planned.
+
+    Attributes:
+        rows (int): The number of graded rows.
+        groups (int): The number of questions, counted once per chunk.
+        responses (int): The number of distinct responses to each question,
+            counted once per chunk.
+        vectorized (int): The number of distinct responses compared in
+            vectorized passes.
+    """
+
+    __slots__ = ("rows", "groups", "responses", "vectorized")
+
+    def __init__(
+        self, rows: int = 0, groups: int = 0, responses: int = 0, vectorized: int = 0
+    ) -> None:
+        self.rows = rows
+        self.groups = groups
+        self.responses = responses
+        self.vectorized = vectorized
+
+    def __repr__(self) -> str:
+        return (
+            f"PlanStats(rows={self.rows}, groups={self.groups}, "
+            f"responses={self.responses}, vectorized={self.vectorized}, "
+            f"reuse_ratio={self.reuse_ratio:.1f})"
+        )
+
+    @property
+    def reuse_ratio(self) -> float:
+        """
+        The average number of rows graded per correct answer.
+        """
+        return self.rows / self.groups if self.groups else 0.0
+
+    def add(self, other: "PlanStats") -> None:
+        """
+        Add the counts of another plan.
+
+        Args:
+            other (PlanStats): The counts to add.
+
+        Returns:
+            None
+        """
+        self.rows += other.rows
+        self.groups += other.groups
+        self.responses += other.responses
+        self.vectorized += other.vectorized
+
+
+def plan_questions(questions: list) -> tuple:
+    """
+    Group the submissions of a chunk by question, then by response.
+
+    Both unit columns are encoded into unit ids in one pass each, see
+    UnitIndex.encode, so questions are keyed on the ids and the rows with
+    an unknown unit are flagged on the way.
+
+    Args:
+        questions (list): The (input_value, from_unit, to_unit, student_response)
+            tuple of each submission.
+
+    Returns:
+        tuple: For each (input_value, from_unit_id, to_unit_id) question, and
+        then for each (input_value, from_unit, to_unit) question naming an
+        unknown unit, the positions of the submissions giving each distinct
+        response, in order of first use.
+    """
+    from_ids = UNIT_INDEX.encode([question[1] for question in questions]).tolist()
+    to_ids = UNIT_INDEX.encode([question[2] for question in questions]).tolist()
+    known: dict = {}
+    unknown: dict = {}
+    for position, (input_value, from_unit, to_unit, response) in enumerate(questions):
+        from_id, to_id = from_ids[position], to_ids[position]
+        if from_id == UNKNOWN_UNIT or to_id == UNKNOWN_UNIT:
+            groups, key = unknown, (input_value, from_unit, to_unit)
+        else:
+            groups, key = known, (input_value, from_id, to_id)
+        responses = groups.get(key)
+        if responses is None:
+            groups[key] = {response: [position]}
+        elif response in responses:
+            responses[response].append(position)
+        else:
+            responses[response] = [position]
+    return known, unknown
+
+
+def match_responses(responses: list, correct_tenths: int) -> list:
+    """
+    Compare the responses to a question with its correct answer in one pass.
+
+    Args:
+        responses (list): The student's responses.
+        correct_tenths (int): The correct answer, in tenths.
+
+    Returns:
+        list: The parsed value of each response matching the correct answer
+        exactly in tenths, and None for the responses that still need grading.
+    """
+    values, valid = parse_numbers(responses)
+    tenths, exact = to_tenths_array(values)
+    matches = valid & exact & (tenths == correct_tenths)
+    return [
+        value if match else None
+        for value, match in zip(values.tolist(), matches.tolist())
+    ]
+
+
+def grade_plan(questions: list, stats: Optional[PlanStats] = None) -> Iterator[tuple]:
+    """
+    Grade a chunk of submissions question by question.
+
+    Each question is parsed and solved once, through the answer cache, and
+    each distinct response to it is graded once against that solution.
+    When a question has at least VECTORIZE_MIN_ROWS distinct responses,
+    they are compared with the correct answer in a single vectorized pass,
+    and only the responses that do not match are graded one at a time.
+
+    Args:
+        questions (list): The (input_value, from_unit, to_unit, student_response)
+            tuple of each submission.
+        stats (PlanStats): Counts the rows and groups once every submission
+            is graded, if given.
+
+    Yields:
+        tuple: The positions of identical submissions and their GradeResult.
+
+    Raises:
+        TypeError: If a field of a submission is not hashable.
+    """
+    known, unknown = plan_questions(questions)
+    names = UNIT_INDEX.units
+    groups = itertools.chain(
+        (
+            ((input_value, names[from_id], names[to_id]), responses)
+            for (input_value, from_id, to_id), responses in known.items()
+        ),
+        unknown.items(),
+    )
+    distinct = vectorized = 0
+    for key, responses in groups:
+        distinct += len(responses)
+        solution = solve_cached(*key, parse_question(*key))
+        error, correct_value, _ = solution
+        matches = itertools.repeat(None)
+        if error is ErrorCode.NONE and len(responses) >= VECTORIZE_MIN_ROWS:
+            correct_tenths = to_tenths(correct_value)
+            if correct_tenths is not None:
+                matches = match_responses(list(responses), correct_tenths)
+                vectorized += len(responses)
+        for (response, positions), match in zip(responses.items(), matches):
+            if match is None:
+                result = grade_solved(solution, *key, response)
+            else:
+                result = GradeResult(
+                    Answer.CORRECT,
+                    ErrorCode.NONE,
+                    correct_value,
+                    round_half_even(match, 1),
+                    *key,
+                    response,
+                )
+            yield positions, result
+    if stats is not None:
+        groups = len(known) + len(unknown)
+        stats.add(PlanStats(len(questions), groups, distinct, vectorized))
+
+
+def grade_questions(questions: list, stats: Optional[PlanStats] = None) -> ResultStore:
+    """
+    Grade a chunk of submissions question by question, see grade_plan.
+
+    Args:
+        questions (list): The (input_value, from_unit, to_unit, student_response)
+            tuple of each submission.
+        stats (PlanStats): Counts the rows and groups, if given.
+
+    Returns:
+        ResultStore: The grade of each submission, in order.
+    """
+    store = ResultStore()
+    store.record(grade_plan(questions, stats), len(questions))
+    return store
+
+
+def grade_results(
+    questions: Iterable[tuple],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[PlanStats] = None,
+) -> ResultStore:
+    """
+    Grade submissions a chunk at a time into a single ResultStore.
+
+    Args:
+        questions (Iterable[tuple]): The (input_value, from_unit, to_unit,
+            student_response) tuple of each submission.
+        chunk_size (int): The number of submissions planned together.
+        stats (PlanStats): Counts the rows and groups, if given.
+
+    Returns:
+        ResultStore: The grade of each submission, in order.
+    """
+    store = ResultStore()
+    questions = iter(questions)
+    while True:
+        chunk = list(itertools.islice(questions, chunk_size))
+        if not chunk:
+            return store
+        store.record(grade_plan(chunk, stats), len(chunk))
+
+
+def grade_chunk(questions: list) -> tuple:
+    """
+    Grade a chunk of submissions in a worker process.
+
+    Args:
+        questions (list): The (input_value, from_unit, to_unit, student_response)
+            tuple of each submission.
+
+    Returns:
+        tuple: The ResultStore of the chunk and its PlanStats.
+    """
+    stats = PlanStats()
+    return grade_questions(questions, stats), stats
+
+
+def chunk_questions(rows: Iterable[dict], chunk_size: int) -> Iterator[tuple]:
+    """
+    Split submission rows into chunks of graded columns.
+
+    Args:
+        rows (Iterable[dict]): The submission rows keyed by column name.
+        chunk_size (int): The number of rows per chunk.
+
+    Yields:
+        tuple: The rows of each chunk and their (input_value, from_unit,
+        to_unit, student_response) tuples.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield (
+            chunk,
+            [tuple(row.get(column) for column in REQUIRED_COLUMNS) for row in chunk],
+        )
+
+
+def grade_rows(
+    rows: Iterable[dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[PlanStats] = None,
+) -> Iterator[dict]:
+    """
+    Grade submission rows a chunk at a time, see grade_questions.
+
+    The feedback for rows that are not correct is written to stderr, once
+    per chunk, so that stdout only carries graded rows.
+
+    Args:
+        rows (Iterable[dict]): The submission rows keyed by column name.
+        chunk_size (int): The number of rows planned together.
+        stats (PlanStats): Counts the rows and groups, if given.
+
+    Yields:
+        dict: The submission row with the grade in the result column.
+    """
+    for chunk, questions in chunk_questions(rows, chunk_size):
+        yield from record_grades(chunk, grade_questions(questions, stats))
+
+
+def record_grades(chunk: list, store: ResultStore) -> list:
+    """
+    Store the grades of a chunk of rows and write their feedback to stderr
+    in a single write.
+
+    Args:
+        chunk (list): The submission rows.
+        store (ResultStore): The grade of each row.
+
+    Returns:
+        list: The submission rows with the grade in the result column.
+    """
+    feedback = []
+    for row, (answer, message) in zip(chunk, store.graded()):
+        row[RESULT_COLUMN] = answer
+        if message is not None:
+            feedback.append(message)
+    if feedback:
+        feedback.append("")
+        sys.stderr.write("\n".join(feedback))
+    return chunk
+
+
+def grade_rows_parallel(
+    rows: Iterable[dict],
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[PlanStats] = None,
+) -> Iterator[dict]:
+    """
+    Grade submission rows in chunks on a pool of worker processes.
+
+    Only the graded columns are sent to the workers. At most two chunks per
+    worker are in flight, so memory use does not grow with the size of the
+    input, and rows are yielded in input order.
+
+    Args:
+        rows (Iterable[dict]): The submission rows keyed by column name.
+        workers (int): The number of worker processes.
+        chunk_size (int): The number of rows sent to a worker at a time.
+        stats (PlanStats): Counts the rows and groups, if given.
+
+    Yields:
+        dict: The submission row with the grade in the result column.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = chunk_questions(rows, chunk_size)
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            chunk, questions = next(chunks, (None, None))
+            if chunk:
+                pending.append((chunk, executor.submit(grade_chunk, questions)))
+            if pending and (not chunk or len(pending) > 2 * workers):
+                chunk_rows, future = pending.popleft()
+                store, chunk_stats = future.result()
+                if stats is not None:
+                    stats.add(chunk_stats)
+                yield from record_grades(chunk_rows, store)
+            elif not chunk:
+                return
+
+
+def graded_writer(
+    reader: csv.DictReader, sink: TextIO, delimiter: str
+) -> csv.DictWriter:
+    """
+    Check the header of a submission file and build the writer of its
+    graded rows.
+
+    Args:
+        reader (csv.DictReader): The reader of the submission file.
+        sink (TextIO): The stream to write graded rows to.
+        delimiter (str): The field delimiter of both streams.
+
+    Returns:
+        csv.DictWriter: The writer of the submission columns followed by
+        the result column.
+
+    Raises:
+        ValueError: If the header misses one of the required columns.
+    """
+    header = reader.fieldnames or []
+    missing = [column for column in REQUIRED_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(
+            f"Submission file is missing the column(s): {', '.join(missing)}."
+        )
+    fieldnames = [column for column in header if column != RESULT_COLUMN]
+    return csv.DictWriter(
+        sink,
+        fieldnames=fieldnames + [RESULT_COLUMN],
+        delimiter=delimiter,
+        lineterminator="\n",
+        extrasaction="ignore",
+    )
+
+
+def grade_stream(
+    source: Iterable[str],
+    sink: TextIO,
+    delimiter: str = CSV_DELIMITER,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[PlanStats] = None,
+) -> int:
+    """
+    Grade a CSV/TSV stream of submissions and write the graded rows.
+
+    Rows are read, graded and written as a stream so memory use does not
+    grow with the size of the input. Each chunk of rows is graded question
+    by question, on worker processes when there is more than one worker,
+    and written in input order.
+
+    Args:
+        source (Iterable[str]): The stream, or lines, to read submissions
+            from, see mapped_reader.map_lines.
+        sink (TextIO): The stream to write graded rows to.
+        delimiter (str): The field delimiter of both streams.
+        workers (int): The number of worker processes.
+        chunk_size (int): The number of rows planned together, and sent to
+            a worker at a time.
+        stats (PlanStats): Counts the rows and groups, if given.
+
+    Returns:
+        int: The number of graded rows.
+
+    Raises:
+        ValueError: If the header misses one of the required columns.
+    """
+    reader = csv.DictReader(source, delimiter=delimiter)
+    writer = graded_writer(reader, sink, delimiter)
+    writer.writeheader()
+    count = 0
+    if workers > 1:
+        graded = grade_rows_parallel(reader, workers, chunk_size, stats)
+    else:
+        graded = grade_rows(reader, chunk_size, stats)
+    for row in graded:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+# Batch stages timed while timings are enabled, see utils.timings
+TIMINGS.register(
+    globals(),
+    {
+        "grade_questions": "plan",
+        "match_responses": "match",
+        "grade_solved": "grade",
+        "record_grades": "record",
+    },
+)
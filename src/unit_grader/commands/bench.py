@@ -0,0 +1,318 @@
+"""
+This module contains the benchmark suite of the grader.
+
+Every benchmark reports the best time per operation, in seconds, over a
+number of repeats, so results are comparable between runs and machines
+of the same kind:
+
+    - micro: every conversion pair of the conversion data, input
+      validation, numeric parsing and grading of a single response.
+    - batch: batch grading throughput on generated submission files.
+    - startup: start-up time of a single-grade command and of the full CLI.
+
+Results are JSON documents that can be stored as a baseline and compared
+with later runs.
+
+Main Functions:
+    - run_benchmarks: Run the benchmark suite.
+    - load_results: Read the results of a previous run.
+    - compare_results: Find the benchmarks that regressed against a baseline.
+"""
+import contextlib
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Iterator, NamedTuple, Optional, TextIO
+
+from .. import __version__
+from ..config.data import CONVERSION_DATA, UNITS
+from ..utils.cache import LRUCache
+from ..utils.common import convert_value, is_valid_numeric_string
+from .batch_grader import REQUIRED_COLUMNS, grade_stream
+from .conversion_grader import ANSWER_CACHE, check_input, grade
+
+# Benchmark groups, in the order they run
+SUITES: tuple = ("micro", "batch", "startup")
+
+# Number of rows of the generated batch files
+DEFAULT_BATCH_ROWS: tuple = (1_000, 100_000, 10_000_000)
+
+# Slowdown over the baseline reported as a regression (0.1 = 10% slower)
+DEFAULT_THRESHOLD: float = 0.1
+
+# Command graded by the start-up benchmark
+STARTUP_ARGS: list = ["-i", "100", "-f", "Kelvin", "-t", "Celsius", "-s", "-173.15"]
+
+
+class Regression(NamedTuple):
+    """
+    This class contains a benchmark that is slower than its baseline.
+    """
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def slowdown(self) -> float:
+        """
+        How much slower the benchmark is, e.g. 0.25 for 25% slower.
+        """
+        return self.current / self.baseline - 1
+
+
+def time_per_call(func: Callable[[], object], number: int, repeat: int) -> float:
+    """
+    Time a function.
+
+    Args:
+        func (Callable): The function to time.
+        number (int): The number of calls per repeat.
+        repeat (int): The number of repeats.
+
+    Returns:
+        float: The best time per call, in seconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def micro_benchmarks() -> Iterator[tuple]:
+    """
+    List the micro benchmarks.
+
+    Yields:
+        tuple: The name of each benchmark and the function it times.
+    """
+    for category, conversions in CONVERSION_DATA.items():
+        for from_unit, to_unit in conversions:
+            yield (
+                f"convert/{from_unit}->{to_unit}",
+                lambda args=(100.0, from_unit, to_unit, category): convert_value(
+                    *args, CONVERSION_DATA
+                ),
+            )
+    yield "validate/valid", lambda: check_input("Kelvin", "Celsius", "100")
+    yield "validate/invalid-unit", lambda: check_input("Kelvin", "Test", "100")
+    yield "parse/valid", lambda: is_valid_numeric_string("-173.15")
+    yield "parse/invalid", lambda: is_valid_numeric_string("dog")
+    yield "grade/uncached", lambda: grade("100", "Kelvin", "Celsius", "-173.15", None)
+    cache = LRUCache(1)
+    yield "grade/cached", lambda: grade("100", "Kelvin", "Celsius", "-173.15", cache)
+
+
+def generate_submissions(rows: int, seed: int = 0) -> Iterator[str]:
+    """
+    Generate the lines of a CSV submission file.
+
+    The file mixes a few hundred questions with correct, incorrect and
+    invalid responses, like the answers of a class to an exam.
+
+    Args:
+        rows (int): The number of submissions.
+        seed (int): The seed of the generator, for reproducible files.
+
+    Yields:
+        str: The header and then one line per submission.
+    """
+    generator = random.Random(seed)
+    questions = []
+    for _ in range(256):
+        units = UNITS[generator.choice(list(UNITS))]
+        question = (str(generator.randint(-500, 500)), *generator.sample(units, 2))
+        answer = grade(*question, "0", cache=None).correct_value
+        questions.append((question, answer))
+    yield "id," + ",".join(REQUIRED_COLUMNS) + "\n"
+    for i in range(rows):
+        (input_value, from_unit, to_unit), answer = generator.choice(questions)
+        roll = generator.random()
+        if roll < 0.6:
+            response = str(answer)
+        elif roll < 0.95:
+            response = f"{generator.uniform(-1000, 1000):.2f}"
+        else:
+            response = "n/a"
+        yield f"{i},{input_value},{from_unit},{to_unit},{response}\n"
+
+
+class NullWriter:
+    """
+    This class is a text stream that discards everything written to it.
+    """
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def batch_benchmark(rows: int, repeat: int = 1) -> float:
+    """
+    Time batch grading of a generated submission file, each run starting
+    with an empty answer cache.
+
+    Args:
+        rows (int): The number of submissions.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The best time per graded row, in seconds.
+    """
+    sink = NullWriter()
+    times = []
+    with contextlib.redirect_stderr(sink):  # drop the per-row feedback
+        for _ in range(repeat):
+            ANSWER_CACHE.clear()
+            start = time.perf_counter()
+            grade_stream(generate_submissions(rows), sink)
+            times.append(time.perf_counter() - start)
+    return min(times) / rows
+
+
+def startup_benchmark(code: str, repeat: int) -> float:
+    """
+    Time a fresh interpreter running some code.
+
+    Args:
+        code (str): The code to run.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The best wall time, in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_benchmarks(
+    suites: tuple = SUITES,
+    batch_rows: tuple = DEFAULT_BATCH_ROWS,
+    number: int = 1000,
+    repeat: int = 5,
+    progress: Optional[Callable[[str], None]] = None,
+) -> dict:
+    """
+    Run the benchmark suite.
+
+    Args:
+        suites (tuple): The benchmark groups to run.
+        batch_rows (tuple): The number of rows of each batch benchmark.
+        number (int): The number of calls per repeat of the micro benchmarks.
+        repeat (int): The number of repeats of each benchmark.
+        progress (Callable): Called with the name of each benchmark before it runs.
+
+    Returns:
+        dict: The environment of the run and the time per operation,
+        in seconds, of each benchmark.
+
+    Raises:
+        ValueError: If a benchmark group does not exist.
+    """
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        raise ValueError(f"Unknown benchmark suite(s): {', '.join(sorted(unknown))}.")
+    report = progress or (lambda name: None)
+    results = {}
+    if "micro" in suites:
+        for name, func in micro_benchmarks():
+            report(name)
+            results[name] = time_per_call(func, number, repeat)
+    if "batch" in suites:
+        for rows in batch_rows:
+            name = f"batch/{rows}-rows"
+            report(name)
+            results[name] = batch_benchmark(rows, repeat)
+    if "startup" in suites:
+        for name, code in (
+            (
+                "startup/single-grade",
+                f"from unit_grader.launcher import main; main({STARTUP_ARGS!r})",
+            ),
+            ("startup/cli-import", "import unit_grader.cli"),
+        ):
+            report(name)
+            results[name] = startup_benchmark(code, repeat)
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def load_results(source: TextIO) -> dict:
+    """
+    Read the results of a previous run.
+
+    Args:
+        source (TextIO): The stream of the JSON results.
+
+    Returns:
+        dict: The results.
+
+    Raises:
+        ValueError: If the stream does not contain benchmark results, or a
+            time is not a positive number of seconds.
+    """
+    try:
+        results = json.load(source)
+    except ValueError as e:
+        raise ValueError(f"Benchmark results are not valid JSON: {e}")
+    if not isinstance(results, dict) or not isinstance(results.get("results"), dict):
+        raise ValueError("Benchmark results have no results object.")
+    for name, seconds in results["results"].items():
+        if not is_positive_time(seconds):
+            raise ValueError(
+                f"Benchmark {name} must take a positive number of seconds, "
+                f"got {seconds!r}."
+            )
+    return results
+
+
+def is_positive_time(seconds: object) -> bool:
+    """
+    Check if a benchmark result is a positive number of seconds.
+
+    Args:
+        seconds (object): The result to check.
+
+    Returns:
+        bool: True if the result is a positive number, False otherwise.
+    """
+    return (
+        isinstance(seconds, (int, float))
+        and not isinstance(seconds, bool)
+        and seconds > 0
+    )
+
+
+def compare_results(
+    current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list:
+    """
+    Find the benchmarks that regressed against a baseline.
+
+    Only benchmarks present in both runs are compared, and baselines that
+    are not a positive number of seconds are skipped.
+
+    Args:
+        current (dict): The results of the current run.
+        baseline (dict): The results of the baseline run.
+        threshold (float): The slowdown allowed before a benchmark regresses,
+            e.g. 0.1 for 10%.
+
+    Returns:
+        list: The regressions, from the largest slowdown to the smallest.
+    """
+    regressions = [
+        Regression(name, baseline["results"][name], seconds)
+        for name, seconds in current["results"].items()
+        if is_positive_time(baseline["results"].get(name))
+        and seconds > baseline["results"][name] * (1 + threshold)
+    ]
+    return sorted(regressions, key=lambda regression: -regression.slowdown)
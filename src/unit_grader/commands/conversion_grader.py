@@ -1,17 +1,118 @@
-from typing import Optional
+from typing import NamedTuple, Optional
 
-import numpy as np  # Import numpy for rounding
-import typer
-from rich import print
+from ..config.data import CONVERSION_DATA, ERROR_MESSAGES, UNIT_INDEX, UNITS
+from ..config.enums import Answer, ErrorCode
+from ..config.index import UnitEntry
+from ..utils.cache import LRUCache
+from ..utils.common import convert_value, round_half_even
+from ..utils.numeric import parse_number
+from ..utils.tenths import to_tenths
+from ..utils.timings import TIMINGS
 
-from ..config.data import (
-    CONVERSION_DATA,
-    HELP_INSTRUCTION,
-    UNIT_CONVERSION_INSTRUCTIONS,
-    UNITS,
-)
-from ..config.enums import Answer
-from ..utils.common import convert_units, is_valid_numeric_string
+# Number of questions whose correct answer is kept in the answer cache
+ANSWER_CACHE_SIZE: int = 4096
+
+# Correct answers of recently graded questions, shared by every grading path
+ANSWER_CACHE: LRUCache = LRUCache(ANSWER_CACHE_SIZE)
+
+
+class GradeResult:
+    """
+    This class contains the outcome of grading a student's response.
+
+    Grading never prints anything: the feedback for the student is only
+    formatted when message() is called, so callers grading many responses
+    pay nothing for messages they do not show.
+    """
+
+    __slots__ = (
+        "answer",
+        "error",
+        "correct_value",
+        "response_value",
+        "input_value",
+        "from_unit",
+        "to_unit",
+        "student_response",
+        "detail",
+    )
+
+    def __init__(
+        self,
+        answer: Answer,
+        error: ErrorCode = ErrorCode.NONE,
+        correct_value: Optional[float] = None,
+        response_value: Optional[float] = None,
+        input_value: Optional[str] = None,
+        from_unit: Optional[str] = None,
+        to_unit: Optional[str] = None,
+        student_response: Optional[str] = None,
+        detail: Optional[Exception] = None,
+    ) -> None:
+        """
+        Create a grade result.
+
+        Args:
+            answer (Answer): The result of the grading.
+            error (ErrorCode): Why the response is not correct, if it is not.
+            correct_value (float): The correct answer rounded to the tenths place.
+            response_value (float): The student's response rounded to the tenths place.
+            input_value (str): The input value provided in the question.
+            from_unit (str): The unit mentioned in the question.
+            to_unit (str): The target unit mentioned in the question.
+            student_response (str): The student's response.
+            detail (Exception): The error raised while grading, if any.
+        """
+        self.answer = answer
+        self.error = error
+        self.correct_value = correct_value
+        self.response_value = response_value
+        self.input_value = input_value
+        self.from_unit = from_unit
+        self.to_unit = to_unit
+        self.student_response = student_response
+        self.detail = detail
+
+    def __repr__(self) -> str:
+        return f"GradeResult({self.answer}, {self.error!r})"
+
+    def message(self) -> Optional[str]:
+        """
+        Format the feedback for the student.
+
+        Returns:
+            str: The feedback explaining why the response is not correct.
+            None: If the response is correct.
+        """
+        if self.error is ErrorCode.NONE:
+            return None
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        return ERROR_MESSAGES[self.error].format(**fields)
+
+
+class Question(NamedTuple):
+    """
+    This class contains a conversion question parsed once: its input value
+    and the index entries of its units, each None if it is invalid.
+    """
+
+    number: Optional[float]
+    from_entry: Optional[UnitEntry]
+    to_entry: Optional[UnitEntry]
+
+    @property
+    def key(self) -> Optional[tuple]:
+        """
+        The key of the question in the answer cache: the exact input value
+        (as float.hex, so -0.0 and 0.0 stay apart) and the ids of both units,
+        or None if the input value or a unit is invalid.
+
+        Questions asking the same thing in other words, e.g. an input value
+        of "100", " 100", "100.0" or "1e2", share one key.
+        """
+        if self.number is None or self.from_entry is None or self.to_entry is None:
+            return None
+        return self.number.hex(), self.from_entry.unit_id, self.to_entry.unit_id
 
 
 def check_unit_existence(
@@ -20,6 +121,9 @@ def check_unit_existence(
     """
     Check if a unit exists in a dictionary.
 
+    The units of the conversion data are looked up in the unit index,
+    other dictionaries are scanned.
+
     Args:
         dictionary (dict): The dictionary to check.
         unit_to_check (str): The unit to check.
@@ -28,12 +132,80 @@ def check_unit_existence(
         str: The category of the unit (e.g., 'temperature' or 'volume').
         None: If the unit does not exist.
     """
+    if dictionary is UNITS:
+        return UNIT_INDEX.category_of(unit_to_check)
     for key, units in dictionary.items():
         if unit_to_check in units:
             return key
     return None
 
 
+def check_input(
+    from_unit: str, to_unit: str, input_value: str
+) -> tuple[Optional[str], ErrorCode]:
+    """
+    Check the input values of a conversion question.
+
+    Args:
+        from_unit (str): The unit to convert from.
+        to_unit (str): The unit to convert to.
+        input_value (str): The input value to be converted.
+
+    Returns:
+        tuple: The category of the units (None if the input is invalid)
+        and the error code of the input (ErrorCode.NONE if it is valid).
+    """
+    if parse_number(input_value) is None:
+        return None, ErrorCode.INVALID_INPUT_VALUE
+    return check_units(from_unit, to_unit)
+
+
+def check_units(from_unit: str, to_unit: str) -> tuple[Optional[str], ErrorCode]:
+    """
+    Check the units of a conversion question.
+
+    Args:
+        from_unit (str): The unit to convert from.
+        to_unit (str): The unit to convert to.
+
+    Returns:
+        tuple: The category of the units (None if they are invalid)
+        and the error code of the units (ErrorCode.NONE if they are valid).
+    """
+    from_unit_category = check_unit_existence(UNITS, from_unit)
+    to_unit_category = check_unit_existence(UNITS, to_unit)
+    if from_unit_category is None:
+        return None, ErrorCode.UNSUPPORTED_FROM_UNIT
+    if to_unit_category is None:
+        return None, ErrorCode.UNSUPPORTED_TO_UNIT
+    if from_unit_category != to_unit_category:
+        return None, ErrorCode.CATEGORY_MISMATCH
+    return from_unit_category, ErrorCode.NONE
+
+
+def check_entries(
+    from_entry: Optional[UnitEntry], to_entry: Optional[UnitEntry]
+) -> tuple[Optional[str], ErrorCode]:
+    """
+    Check the units of a conversion question from their index entries.
+
+    Args:
+        from_entry (UnitEntry): The entry of the unit to convert from, if any.
+        to_entry (UnitEntry): The entry of the unit to convert to, if any.
+
+    Returns:
+        tuple: The category of the units (None if they are invalid)
+        and the error code of the units (ErrorCode.NONE if they are valid).
+    """
+    if from_entry is None:
+        return None, ErrorCode.UNSUPPORTED_FROM_UNIT
+    if to_entry is None:
+        return None, ErrorCode.UNSUPPORTED_TO_UNIT
+    if from_entry.category_id != to_entry.category_id:
+        return None, ErrorCode.CATEGORY_MISMATCH
+    return from_entry.category, ErrorCode.NONE
+
+
 def validate_input(from_unit: str, to_unit: str, input_value: str) -> Optional[str]:
     """
     Validate the input values
@@ -47,52 +219,198 @@ def validate_input(from_unit: str, to_unit: str, input_value: str) -> Optional[s
         str: The category of the units (e.g., 'temperature' or 'volume').
         None: If the input is invalid.
     """
-
     try:
-        if not is_valid_numeric_string(input_value):
-            raise TypeError(
-                (
-                    f"{input_value} as input_value"
-                    f" needs to be a number. {HELP_INSTRUCTION}"
-                )
-            )
-        from_unit_category = check_unit_existence(UNITS, from_unit)
-        to_unit_category = check_unit_existence(UNITS, to_unit)
-
-        if from_unit_category is None:
-            raise ValueError(
-                (
-                    f"{from_unit} as from_unit"
-                    f" is not supported. {UNIT_CONVERSION_INSTRUCTIONS}"
-                )
-            )
-
-        if to_unit_category is None:
-            raise ValueError(
-                (
-                    f"{to_unit} as to_unit"
-                    f" is not supported. {UNIT_CONVERSION_INSTRUCTIONS}"
-                )
-            )
-
-        if from_unit_category != to_unit_category:
-            raise ValueError(
-                (
-                    f"Ensure the selected conversion units"
-                    " match their respective categories"
-                    f" for a valid conversion. {UNIT_CONVERSION_INSTRUCTIONS}"
-                )
-            )
-    except TypeError as e:
-        print(f"[bold red]Input Error: {e}[/bold red]")
-        return None
-    except ValueError as e:
-        print(f"[bold red]Input Error: {e}[/bold red]")
+        category, _ = check_input(from_unit, to_unit, input_value)
+    except Exception:
         return None
+    return category
+
+
+def parse_question(input_value: str, from_unit: str, to_unit: str) -> Question:
+    """
+    Parse the input value and look up the units of a conversion question.
+
+    Args:
+        input_value (str): The input value provided in the question.
+        from_unit (str): The unit mentioned in the question.
+        to_unit (str): The target unit mentioned in the question.
+
+    Returns:
+        Question: The parsed input value and the entries of both units.
+    """
+    return Question(
+        parse_number(input_value),
+        UNIT_INDEX.lookup(from_unit),
+        UNIT_INDEX.lookup(to_unit),
+    )
+
+
+def solve_question(
+    input_value: str,
+    from_unit: str,
+    to_unit: str,
+    question: Optional[Question] = None,
+) -> tuple:
+    """
+    Validate a conversion question and compute its correct answer.
+
+    Args:
+        input_value (str): The input value provided in the question.
+        from_unit (str): The unit mentioned in the question.
+        to_unit (str): The target unit mentioned in the question.
+        question (Question): The question parsed by parse_question, so it is
+            not parsed again. Parsed here if not given.
+
+    Returns:
+        tuple: The error code of the question (ErrorCode.NONE if it is valid),
+        the correct answer rounded to the tenths place (None if it is not)
+        and the error raised while solving it, if any.
+    """
+    if question is None:
+        question = parse_question(input_value, from_unit, to_unit)
+    if question.number is None:
+        return ErrorCode.INVALID_INPUT_VALUE, None, None
+    try:
+        category, error = check_entries(question.from_entry, question.to_entry)
     except Exception as e:
-        print(f"[bold red]Error: {e}.[/bold red]")
-        return None
-    return from_unit_category
+        return ErrorCode.UNEXPECTED_ERROR, None, e.with_traceback(None)
+    if category is None:  # invalid units
+        return error, None, None
+    try:
+        correct_value = convert_value(
+            question.number, from_unit, to_unit, category, CONVERSION_DATA
+        )
+    except Exception as e:
+        return ErrorCode.CONVERSION_FAILED, None, e.with_traceback(None)
+    return ErrorCode.NONE, correct_value, None
+
+
+def solve_cached(
+    input_value: str,
+    from_unit: str,
+    to_unit: str,
+    question: Question,
+    cache: Optional[LRUCache] = ANSWER_CACHE,
+) -> tuple:
+    """
+    Solve a parsed conversion question, keeping its answer in the cache.
+
+    The correct answer of each valid question is kept under its key, see
+    Question.key. Invalid questions are cheap to check and are not cached.
+
+    Args:
+        input_value (str): The input value provided in the question.
+        from_unit (str): The unit mentioned in the question.
+        to_unit (str): The target unit mentioned in the question.
+        question (Question): The question parsed by parse_question.
+        cache (LRUCache): The cache of correct answers, or None to solve
+            the question every time.
+
+    Returns:
+        tuple: The error code, correct answer and error of the question,
+        see solve_question.
+    """
+    key = None if cache is None else question.key
+    if key is None:
+        return solve_question(input_value, from_unit, to_unit, question)
+    return cache.get(
+        key, lambda: solve_question(input_value, from_unit, to_unit, question)
+    )
+
+
+def grade(
+    input_value: str,
+    from_unit: str,
+    to_unit: str,
+    student_response: str,
+    cache: Optional[LRUCache] = ANSWER_CACHE,
+) -> GradeResult:
+    """
+    Grade a student's response to a conversion question without printing.
+
+    The student's response is correct if it matches the correct answer
+    after both values are rounded to the tenths place, rounding half to
+    even (Banker's rounding). Both values are compared as integer numbers
+    of tenths, see to_tenths.
+
+    Each field is parsed once. The correct answer of each valid question is
+    kept in the cache, so grading more responses to the same question,
+    however its input value is written, only parses and compares the
+    response, see solve_cached.
+
+    Args:
+        input_value (str): The input value provided in the question.
+        from_unit (str): The unit mentioned in the question.
+        to_unit (str): The target unit mentioned in the question.
+        student_response (str): The student's response.
+        cache (LRUCache): The cache of correct answers, or None to solve
+            the question every time.
+    Returns:
+        GradeResult: The result of the grading, with the rounded values and
+        the reason the response is not correct, if it is not.
+    """
+    question = parse_question(input_value, from_unit, to_unit)
+    solution = solve_cached(input_value, from_unit, to_unit, question, cache)
+    return grade_solved(solution, input_value, from_unit, to_unit, student_response)
+
+
+def grade_solved(
+    solution: tuple,
+    input_value: str,
+    from_unit: str,
+    to_unit: str,
+    student_response: str,
+) -> GradeResult:
+    """
+    Grade a student's response to a question that is already solved.
+
+    Args:
+        solution (tuple): The error code, correct answer and error of the
+            question, see solve_question.
+        input_value (str): The input value provided in the question.
+        from_unit (str): The unit mentioned in the question.
+        to_unit (str): The target unit mentioned in the question.
+        student_response (str): The student's response.
+
+    Returns:
+        GradeResult: The result of the grading, see grade.
+    """
+    error, correct_value, detail = solution
+    result = GradeResult(
+        Answer.INVALID,
+        error,
+        correct_value,
+        None,
+        input_value,
+        from_unit,
+        to_unit,
+        student_response,
+        detail,
+    )
+    if error is not ErrorCode.NONE and error is not ErrorCode.CONVERSION_FAILED:
+        return result  # invalid input
+
+    response = parse_number(student_response)
+    if response is None:
+        result.answer, result.error = Answer.INCORRECT, ErrorCode.INVALID_RESPONSE
+        result.detail = None
+        return result
+
+    result.response_value = round_half_even(response, 1)
+    if error is ErrorCode.CONVERSION_FAILED:
+        return result
+
+    correct_tenths = to_tenths(correct_value)
+    response_tenths = to_tenths(response)
+    if correct_tenths is None or response_tenths is None:  # no exact tenths
+        matches = correct_value == result.response_value
+    else:
+        matches = correct_tenths == response_tenths
+    if matches:
+        result.answer = Answer.CORRECT
+    else:
+        result.answer, result.error = Answer.INCORRECT, ErrorCode.WRONG_ANSWER
+    return result
 
 
 def grade_response(
@@ -112,37 +430,19 @@ def grade_response(
         Answer: The result of the grading.
         Possible values are: Answer.CORRECT, Answer.INCORRECT, Answer.INVALID
     """
-    # unit name validation
-    category: Optional[str] = validate_input(from_unit, to_unit, input_value)
-    if category is None:  # invalid input
-        return Answer.INVALID
-
-    if not is_valid_numeric_string(student_response):
-        typer.echo(f"\n{student_response} is not a valid numeric string.")
-        return Answer.INCORRECT
-
-    if from_unit == to_unit:
-        correct_answer: float = np.round(float(input_value), 1)
-        student_response: float = np.round(float(student_response), 1)
-        if correct_answer == student_response:
-            return Answer.CORRECT
-        else:
-            typer.echo(
-                f"\n{student_response} is not the correct answer. The correct answer is {correct_answer}."
-            )
-            return Answer.INCORRECT
-
-    student_response: float = np.round(float(student_response), 1)
-    input_numeric_value: float = float(input_value)
-    convert_value: Optional(float) = convert_units(
-        input_numeric_value, from_unit, to_unit, category, CONVERSION_DATA
-    )
-    if convert_value is None:
-        return Answer.INVALID
-    elif convert_value == student_response:
-        return Answer.CORRECT
-    else:
-        typer.echo(
-            f"\n{student_response} is not the correct answer. The correct answer is {convert_value}."
-        )
-        return Answer.INCORRECT
+    return grade(input_value, from_unit, to_unit, student_response).answer
+
+
+# Grading stages timed while timings are enabled, see utils.timings
+TIMINGS.register(
+    globals(),
+    {
+        "solve_question": "solve",
+        "parse_number": "parse",
+        "check_units": "validate",
+        "check_entries": "validate",
+        "convert_value": "convert",
+        "round_half_even": "round",
+        "to_tenths": "round",
+    },
+)
@@ -0,0 +1,66 @@
+"""
+This module grades requests in the newline-delimited JSON format shared
+by the grading server and the stream grader, one JSON object per line:
+
+    {"input_value": "100", "from_unit": "Kelvin",
+     "to_unit": "Celsius", "student_response": "-173.15", "id": 7}
+    -> {"result": "correct", "id": 7}
+
+It does not depend on sockets, so the stream grader can use it on
+platforms without Unix sockets.
+
+Main Functions:
+    - handle_request: Grade one decoded request.
+    - handle_line: Grade one line of newline-delimited JSON.
+"""
+import json
+from typing import Optional, Union
+
+from .batch_grader import REQUIRED_COLUMNS
+from .conversion_grader import grade
+
+
+def handle_request(payload: object) -> dict:
+    """
+    Grade one decoded request.
+
+    Args:
+        payload (object): The decoded JSON request.
+
+    Returns:
+        dict: The reply with the grade in result (or an error), and the
+        request id if one was given.
+    """
+    if not isinstance(payload, dict):
+        return {"error": "Request must be a JSON object."}
+    result = grade(*(payload.get(column) for column in REQUIRED_COLUMNS))
+    reply = {"result": result.answer.value}
+    if "id" in payload:
+        reply["id"] = payload["id"]
+    return reply
+
+
+def handle_line(line: Union[str, bytes]) -> Optional[str]:
+    """
+    Grade one line of newline-delimited JSON.
+
+    Args:
+        line (str | bytes): The JSON request.
+
+    Returns:
+        str: The JSON reply, terminated by a newline.
+        None: If the line is blank.
+    """
+    if not line.strip():
+        return None
+    try:
+        payload = json.loads(line)
+    except (ValueError, RecursionError) as e:  # RecursionError: nested too deeply
+        return json.dumps({"error": f"Invalid JSON: {e}"}) + "\n"
+    try:
+        reply = handle_request(payload)
+    except Exception as e:  # keep serving the connection
+        reply = {"error": f"Grading failed: {e!r}"}
+        if isinstance(payload, dict) and "id" in payload:
+            reply["id"] = payload["id"]
+    return json.dumps(reply) + "\n"
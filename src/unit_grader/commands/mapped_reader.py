@@ -0,0 +1,172 @@
+"""
+This module reads submission files through a read-only memory map.
+
+The lines of a mapped file are split by mmap.readline straight from the
+page cache, without copying the file through the buffers of a file
+object, and each line is only decoded when the CSV reader asks for it.
+The kernel is told the file is read sequentially, so it reads ahead, and
+every RELEASE_BYTES the pages behind the current line are dropped from
+the mapping, so a multi-GB file graded from start to end keeps a bounded
+resident memory instead of mapping the whole file in.
+
+    with map_lines(open("submissions.csv", encoding="utf-8")) as lines:
+        grade_stream(lines, sys.stdout)
+
+Lines are split at "\\n" only and keep their line terminator, like a file
+opened with newline="", which is what the csv module expects.
+
+Main Classes:
+    - MappedLines: Read the lines of a file through a memory map.
+
+Main Functions:
+    - map_lines: Read the lines of an open text file through a memory map
+      when it is a regular file.
+    - advise: Give the kernel advice about the pages of a memory map.
+"""
+import mmap
+import os
+from typing import IO, Iterator, Optional, TextIO, Union
+
+# Bytes read between two releases of the pages behind the current line
+RELEASE_BYTES: int = 4 * 1024 * 1024
+
+
+class MappedLines:
+    """
+    This class reads the lines of a file through a read-only memory map.
+
+    The map is closed once every line was read, or by close.
+
+    Attributes:
+        offset (int): The byte offset following the last line read.
+        encoding (str): The encoding of the file.
+    """
+
+    __slots__ = ("offset", "encoding", "_map", "_released")
+
+    def __init__(self, file: IO, encoding: str = "utf-8") -> None:
+        """
+        Map a file to read lines from its current position.
+
+        Args:
+            file (IO): The file, opened in text or binary mode.
+            encoding (str): The encoding of the file.
+
+        Raises:
+            OSError: If the file cannot be mapped, e.g. it is a pipe.
+            ValueError: If the file has no file descriptor.
+        """
+        self.encoding = encoding
+        self.offset = file.tell()
+        self._released = self.offset - self.offset % mmap.PAGESIZE
+        self._map: Optional[mmap.mmap] = None
+        if os.fstat(file.fileno()).st_size > 0:  # empty files cannot be mapped
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._map.seek(self.offset)
+            advise(self._map, "MADV_SEQUENTIAL")
+
+    def __enter__(self) -> "MappedLines":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Read the lines of the file.
+
+        Yields:
+            str: Each decoded line, with its line terminator.
+        """
+        if self._map is None:
+            return
+        readline = self._map.readline
+        encoding = self.encoding
+        release = self._released + RELEASE_BYTES
+        for line in iter(readline, b""):
+            self.offset += len(line)
+            if self.offset >= release:
+                self.release()
+                release = self._released + RELEASE_BYTES
+            yield line.decode(encoding)
+        self.close()
+
+    def seek(self, offset: int) -> None:
+        """
+        Continue reading at another byte offset.
+
+        Args:
+            offset (int): The byte offset of the next line to read.
+
+        Returns:
+            None
+        """
+        if self._map is not None:
+            self._map.seek(offset)
+        self.offset = offset
+        self._released = offset - offset % mmap.PAGESIZE
+
+    def release(self) -> None:
+        """
+        Drop the pages before the current line from the mapping.
+
+        They stay in the page cache, so they are read again cheaply if
+        needed, but no longer count as resident memory of the process.
+
+        Returns:
+            None
+        """
+        end = self.offset - self.offset % mmap.PAGESIZE
+        if self._map is not None and end > self._released:
+            advise(self._map, "MADV_DONTNEED", self._released, end - self._released)
+            self._released = end
+
+    def close(self) -> None:
+        """
+        Close the memory map.
+
+        Returns:
+            None
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def advise(mapped: mmap.mmap, option: str, start: int = 0, length: int = 0) -> bool:
+    """
+    Give the kernel advice about the pages of a memory map.
+
+    Args:
+        mapped (mmap.mmap): The memory map.
+        option (str): The name of the advice, e.g. "MADV_SEQUENTIAL".
+        start (int): The page-aligned offset of the first page.
+        length (int): The number of bytes, 0 for the whole map.
+
+    Returns:
+        bool: False if the platform does not support the advice.
+    """
+    value = getattr(mmap, option, None)
+    if value is None or not hasattr(mapped, "madvise"):
+        return False
+    mapped.madvise(value, start, length or len(mapped) - start)
+    return True
+
+
+def map_lines(file: TextIO) -> Union[MappedLines, TextIO]:
+    """
+    Read the lines of an open text file through a memory map when it is a
+    regular file.
+
+    Args:
+        file (TextIO): The file to read from its current position.
+
+    Returns:
+        MappedLines: The lines of the mapped file.
+        TextIO: The file itself, if it cannot be mapped (e.g. stdin is a
+        pipe or a terminal).
+    """
+    try:
+        return MappedLines(file, file.encoding)
+    except (OSError, ValueError):  # also io.UnsupportedOperation
+        return file
@@ -0,0 +1,219 @@
+"""
+This module regrades prior results after the conversion table changed.
+
+A snapshot of the conversion table is a JSON object listing the units of
+each category and the coefficients of every conversion, see export_table.
+Diffing the snapshot a result file was graded with against the current
+table gives the unit pairs whose conversion changed, appeared or
+disappeared. Only the rows of the result file that ask for one of those
+pairs need to be graded again; every other row keeps its result.
+
+    {"fingerprint": "...", "units": {"volume": ["liters", ...]},
+     "conversions": [["gallons", "cubic-feet", 1.0, 0.0, 7.48], ...]}
+
+Main Classes:
+    - TableDiff: The conversions that differ between two tables.
+
+Main Functions:
+    - export_table: Build the snapshot of a conversion table.
+    - load_table: Read the snapshot of a conversion table.
+    - diff_tables: Find the conversions that differ between two snapshots.
+    - regrade_stream: Regrade the affected rows of a result file and write
+      the rows whose result changed.
+"""
+import csv
+import itertools
+from typing import Iterator, NamedTuple, Optional, TextIO
+
+from ..config.registry import UnitRegistry
+from .batch_grader import (
+    CSV_DELIMITER,
+    DEFAULT_CHUNK_SIZE,
+    REQUIRED_COLUMNS,
+    RESULT_COLUMN,
+    PlanStats,
+    grade_questions,
+)
+
+# Column of the result a regraded row had before
+PREVIOUS_RESULT_COLUMN: str = "previous_result"
+
+
+class TableDiff(NamedTuple):
+    """
+    This class contains the conversions that differ between two tables.
+
+    Attributes:
+        pairs (frozenset): The (from_unit, to_unit) pairs whose conversion
+            changed, or exists in only one of the tables.
+        units (frozenset): The units defined in only one of the tables.
+    """
+
+    pairs: frozenset
+    units: frozenset
+
+    def touches(self, from_unit: str, to_unit: str) -> bool:
+        """
+        Check whether the grade of a question may differ between the tables.
+
+        Args:
+            from_unit (str): The unit mentioned in the question.
+            to_unit (str): The target unit mentioned in the question.
+
+        Returns:
+            bool: True if the conversion of the question differs, or one of
+            its units is defined in only one of the tables.
+        """
+        return (
+            (from_unit, to_unit) in self.pairs
+            or from_unit in self.units
+            or to_unit in self.units
+        )
+
+
+def export_table(registry: UnitRegistry) -> dict:
+    """
+    Build the snapshot of a conversion table.
+
+    Args:
+        registry (UnitRegistry): The unit registry.
+
+    Returns:
+        dict: The fingerprint of the table, the units of each category and
+        the [from_unit, to_unit, scale, offset, divisor] of every conversion.
+    """
+    return {
+        "fingerprint": registry.fingerprint(),
+        "units": registry.units,
+        "conversions": [
+            [from_unit, to_unit, *transform]
+            for transforms in registry.conversion_table().values()
+            for (from_unit, to_unit), transform in transforms.items()
+        ],
+    }
+
+
+def load_table(snapshot: dict) -> tuple:
+    """
+    Read the snapshot of a conversion table.
+
+    Args:
+        snapshot (dict): The snapshot, see export_table.
+
+    Returns:
+        tuple: The set of units, and the (scale, offset, divisor) of each
+        (from_unit, to_unit) pair. Snapshots written before conversions had
+        a divisor have a divisor of one.
+
+    Raises:
+        ValueError: If the snapshot is not a conversion table.
+    """
+    try:
+        units = {unit for units in snapshot["units"].values() for unit in units}
+        conversions = {
+            (from_unit, to_unit): (float(scale), float(offset), float(divisor))
+            for from_unit, to_unit, scale, offset, divisor in (
+                conversion if len(conversion) > 4 else [*conversion, 1]
+                for conversion in snapshot["conversions"]
+            )
+        }
+    except (AttributeError, KeyError, TypeError, ValueError):
+        raise ValueError("The snapshot is not a conversion table.") from None
+    return units, conversions
+
+
+def diff_tables(old: dict, new: dict) -> TableDiff:
+    """
+    Find the conversions that differ between two snapshots.
+
+    Args:
+        old (dict): The snapshot the results were graded with.
+        new (dict): The snapshot to regrade with.
+
+    Returns:
+        TableDiff: The changed pairs and units.
+
+    Raises:
+        ValueError: If a snapshot is not a conversion table.
+    """
+    old_units, old_conversions = load_table(old)
+    new_units, new_conversions = load_table(new)
+    pairs = {
+        pair
+        for pair in old_conversions.keys() | new_conversions.keys()
+        if old_conversions.get(pair) != new_conversions.get(pair)
+    }
+    return TableDiff(frozenset(pairs), frozenset(old_units ^ new_units))
+
+
+def regrade_stream(
+    source: TextIO,
+    sink: TextIO,
+    diff: TableDiff,
+    delimiter: str = CSV_DELIMITER,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[PlanStats] = None,
+) -> tuple:
+    """
+    Regrade the rows of a result file touched by a table diff, and write
+    the rows whose result changed.
+
+    Each written row keeps its columns, with the old result in the
+    previous_result column and the new one in the result column.
+    The grades of each chunk are kept in a ResultStore and only their
+    answers are read, so no feedback is formatted.
+
+    Args:
+        source (TextIO): The stream of graded rows, e.g. a batch output.
+        sink (TextIO): The stream to write the changed rows to.
+        diff (TableDiff): The conversions that changed.
+        delimiter (str): The field delimiter of both streams.
+        chunk_size (int): The number of regraded rows planned together.
+        stats (PlanStats): Counts the regraded rows and groups, if given.
+
+    Returns:
+        tuple: The number of rows read, regraded and changed.
+
+    Raises:
+        ValueError: If the header misses one of the required columns or the
+        result column.
+    """
+    reader = csv.DictReader(source, delimiter=delimiter)
+    header = reader.fieldnames or []
+    missing = [
+        column for column in REQUIRED_COLUMNS + (RESULT_COLUMN,) if column not in header
+    ]
+    if missing:
+        raise ValueError(f"Result file is missing the column(s): {', '.join(missing)}.")
+    fieldnames = [
+        column
+        for column in header
+        if column not in (RESULT_COLUMN, PREVIOUS_RESULT_COLUMN)
+    ]
+    writer = csv.DictWriter(
+        sink,
+        fieldnames=fieldnames + [PREVIOUS_RESULT_COLUMN, RESULT_COLUMN],
+        delimiter=delimiter,
+        lineterminator="\n",
+        extrasaction="ignore",
+    )
+    writer.writeheader()
+    read = regraded = changed = 0
+
+    def touched_rows() -> Iterator[dict]:
+        nonlocal read
+        for read, row in enumerate(reader, 1):
+            if diff.touches(row["from_unit"], row["to_unit"]):
+                yield row
+
+    touched = touched_rows()
+    for chunk in iter(lambda: list(itertools.islice(touched, chunk_size)), []):
+        questions = [tuple(row[column] for column in REQUIRED_COLUMNS) for row in chunk]
+        regraded += len(chunk)
+        for row, answer in zip(chunk, grade_questions(questions, stats)):
+            if answer.value != row[RESULT_COLUMN]:
+                row[PREVIOUS_RESULT_COLUMN] = row[RESULT_COLUMN]
+                row[RESULT_COLUMN] = answer.value
+                writer.writerow(row)
+                changed += 1
+    return read, regraded, changed
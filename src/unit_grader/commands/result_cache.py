@@ -0,0 +1,176 @@
+"""
+This module keeps the graded output of submission files in a local cache
+directory, so regrading an unchanged file returns its output right away.
+
+Each entry is keyed on a SHA-256 digest of the contents of the submission
+file, the version of the package, the fingerprint of the conversion table
+and the grading options that change the output (the field delimiter).
+Changing any of them misses the cache; options that only change how fast
+a file is graded, like the number of workers, do not.
+
+Entries are written to a temporary file and renamed into place, so readers
+never see a partial entry. When the cache grows above its size limit, the
+least recently used entries are removed.
+
+Main Classes:
+    - ResultCache: Keep graded outputs in a cache directory.
+
+Main Functions:
+    - result_key: Build the cache key of a submission file.
+"""
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from typing import Iterator, TextIO
+
+from .. import __version__
+from ..config.data import REGISTRY
+
+# Default size limit of the cache directory, in bytes
+DEFAULT_CACHE_BYTES: int = 1024 * 1024 * 1024
+
+# Prefix of the temporary files of entries being written
+TEMPORARY_PREFIX: str = ".tmp-"
+
+# Bytes read at a time when hashing or copying files
+BLOCK_SIZE: int = 1024 * 1024
+
+# Encoding of the cached outputs
+ENCODING: str = "utf-8"
+
+
+def result_key(input_path: str, *options: str) -> str:
+    """
+    Build the cache key of a submission file.
+
+    Args:
+        input_path (str): The path of the submission file.
+        *options (str): The grading options that change the output.
+
+    Returns:
+        str: The SHA-256 hex digest of the file contents, the package
+        version, the conversion table fingerprint and the options.
+    """
+    digest = hashlib.sha256()
+    for part in (__version__, REGISTRY.fingerprint(), *options):
+        digest.update(part.encode() + b"\0")
+    with open(input_path, "rb") as file:
+        for block in iter(lambda: file.read(BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    This class keeps graded outputs in a cache directory.
+
+    Attributes:
+        directory (str): The cache directory, created on first store.
+        max_bytes (int): The size limit of the cache directory.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        """
+        Use a cache directory.
+
+        Args:
+            directory (str): The cache directory.
+            max_bytes (int): The size limit of the cache directory.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, key: str) -> str:
+        """
+        Get the path of an entry.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str: The path of the entry in the cache directory.
+        """
+        return os.path.join(self.directory, key)
+
+    def load(self, key: str, sink: TextIO) -> bool:
+        """
+        Copy a cached output to a stream and mark it as recently used.
+
+        Args:
+            key (str): The cache key.
+            sink (TextIO): The stream to write the output to.
+
+        Returns:
+            bool: True if the output was cached, False otherwise.
+        """
+        path = self.path(key)
+        try:
+            with open(path, encoding=ENCODING, newline="") as entry:
+                os.utime(path)
+                shutil.copyfileobj(entry, sink, BLOCK_SIZE)
+        except FileNotFoundError:
+            return False
+        return True
+
+    @contextlib.contextmanager
+    def store(self, key: str) -> Iterator[TextIO]:
+        """
+        Write a new entry, then evict entries above the size limit.
+
+        The entry is only added if the block writing it succeeds.
+
+        Args:
+            key (str): The cache key.
+
+        Yields:
+            TextIO: The stream to write the output to.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(
+            prefix=TEMPORARY_PREFIX, dir=self.directory
+        )
+        try:
+            with open(descriptor, "w", encoding=ENCODING, newline="") as entry:
+                yield entry
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            os.remove(temporary)
+            raise
+        self.evict(keep=key)
+
+    def evict(self, keep: str = "") -> int:
+        """
+        Remove the least recently used entries until the cache fits its
+        size limit.
+
+        Args:
+            keep (str): The key of an entry that is never removed, such as
+                the one just written.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as scan:
+            for item in scan:
+                if item.name.startswith(TEMPORARY_PREFIX) or not item.is_file():
+                    continue
+                stat = item.stat()
+                total += stat.st_size
+                if item.name != keep:
+                    entries.append((stat.st_mtime, stat.st_size, item.path))
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+                removed += 1
+            total -= size
+        if removed:
+            logging.debug(f"result cache: evicted {removed} entries")
+        return removed
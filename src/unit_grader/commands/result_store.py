@@ -0,0 +1,289 @@
+"""
+This module keeps the grades of a whole batch of submissions in compact
+columns.
+
+A GradeResult per row costs about a hundred bytes once its answer,
+values and strings are counted, too much for runs of tens of millions of
+rows. A ResultStore keeps the same information in typed arrays instead,
+22 bytes per row:
+
+    - answers: The int8 AnswerCode of each row.
+    - errors: The int8 ErrorCode of each row.
+    - correct_values: The float64 correct answer, NaN if there is none.
+    - response_values: The float64 rounded response, NaN if there is none.
+    - reasons: The int32 index of the feedback in the interned message
+      table, -1 when the feedback follows from the values alone.
+
+Feedback that does not depend on the values only, like an unsupported
+unit or an invalid response, is formatted once per distinct message and
+interned. Answer members and feedback are only built when a row is read.
+
+The batch grader keeps the grades of each chunk in a ResultStore, which
+is also what its worker processes send back, and grade_results in
+batch_grader grades a whole iterable of submissions into one store:
+
+    store = grade_results(questions)
+    store.counts()  # {Answer.CORRECT: 41234567, ...}
+    for answer, message in store.graded():
+        ...
+
+Main Classes:
+    - ResultStore: Keep the grades of a batch in compact columns.
+"""
+import math
+from array import array
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from ..config.data import ERROR_MESSAGES
+from ..config.enums import Answer, AnswerCode, ErrorCode
+from .conversion_grader import GradeResult
+
+# The Answer member of each AnswerCode, by code
+ANSWERS: tuple = tuple(code.answer for code in AnswerCode)
+
+# The value of the Answer member of each AnswerCode, by code
+ANSWER_VALUES: tuple = tuple(answer.value for answer in ANSWERS)
+
+# The AnswerCode of each Answer member
+ANSWER_CODES: dict = {code.answer: int(code) for code in AnswerCode}
+
+# The reason of rows whose feedback follows from their values
+NO_REASON: int = -1
+
+
+class ResultStore:
+    """
+    This class keeps the grades of a batch of submissions in compact columns.
+
+    Rows are added in order, one GradeResult at a time with append, as
+    encoded values with extend, or a chunk of planned grades with record.
+
+    Attributes:
+        answers (array): The AnswerCode of each row.
+        errors (array): The ErrorCode of each row.
+        correct_values (array): The correct answer of each row, NaN if none.
+        response_values (array): The rounded response of each row, NaN if none.
+        reasons (array): The index of the feedback of each row in messages,
+            NO_REASON if it follows from the values.
+        messages (list): The interned feedback of the rows.
+    """
+
+    __slots__ = (
+        "answers",
+        "errors",
+        "correct_values",
+        "response_values",
+        "reasons",
+        "messages",
+        "_interned",
+    )
+
+    def __init__(self) -> None:
+        self.answers = array("b")
+        self.errors = array("b")
+        self.correct_values = array("d")
+        self.response_values = array("d")
+        self.reasons = array("i")
+        self.messages: list = []
+        self._interned: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.answers)
+
+    def __iter__(self) -> Iterator[Answer]:
+        """
+        Iterate over the Answer of each row.
+        """
+        return map(ANSWERS.__getitem__, self.answers)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes held by the columns, without the message table.
+        """
+        return sum(
+            len(column) * column.itemsize
+            for column in (
+                self.answers,
+                self.errors,
+                self.correct_values,
+                self.response_values,
+                self.reasons,
+            )
+        )
+
+    def encode(self, result: GradeResult) -> tuple:
+        """
+        Turn a grade result into the values of its row, interning its
+        feedback if needed.
+
+        Args:
+            result (GradeResult): The result of the grading.
+
+        Returns:
+            tuple: The answer code, error code, correct value, response
+            value and reason of the row.
+        """
+        reason = NO_REASON
+        if result.error is not ErrorCode.NONE and (
+            result.error is not ErrorCode.WRONG_ANSWER
+        ):
+            message = result.message()
+            reason = self._interned.get(message, NO_REASON)
+            if reason == NO_REASON:
+                reason = self._interned[message] = len(self.messages)
+                self.messages.append(message)
+        return (
+            ANSWER_CODES[result.answer],
+            int(result.error),
+            math.nan if result.correct_value is None else result.correct_value,
+            math.nan if result.response_value is None else result.response_value,
+            reason,
+        )
+
+    def append(self, result: GradeResult) -> None:
+        """
+        Add the grade of the next row.
+
+        Args:
+            result (GradeResult): The result of the grading.
+
+        Returns:
+            None
+        """
+        self.extend((self.encode(result),))
+
+    def extend(self, rows: Iterable[tuple]) -> None:
+        """
+        Add the values of the next rows, see encode.
+
+        Args:
+            rows (Iterable[tuple]): The values of each row.
+
+        Returns:
+            None
+        """
+        columns = tuple(zip(*rows))
+        if columns:
+            self.answers.extend(columns[0])
+            self.errors.extend(columns[1])
+            self.correct_values.extend(columns[2])
+            self.response_values.extend(columns[3])
+            self.reasons.extend(columns[4])
+
+    def record(self, plan: Iterable[tuple], size: int) -> None:
+        """
+        Add the grades of a chunk of submissions, see batch_grader.grade_plan.
+
+        Each result is encoded once for all the positions it grades.
+
+        Args:
+            plan (Iterable[tuple]): The positions of identical submissions of
+                the chunk and their GradeResult.
+            size (int): The number of submissions in the chunk.
+
+        Returns:
+            None
+        """
+        rows: list = [None] * size
+        for positions, result in plan:
+            row = self.encode(result)
+            for position in positions:
+                rows[position] = row
+        self.extend(rows)
+
+    def answer(self, index: int) -> Answer:
+        """
+        Get the result of the grading of a row.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            Answer: The result of the grading.
+        """
+        return ANSWERS[self.answers[index]]
+
+    def message(self, index: int) -> Optional[str]:
+        """
+        Format the feedback of a row, like GradeResult.message.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            str: The feedback explaining why the response is not correct.
+            None: If the response is correct.
+        """
+        reason = self.reasons[index]
+        if reason != NO_REASON:
+            return self.messages[reason]
+        if self.errors[index] == ErrorCode.WRONG_ANSWER:
+            return ERROR_MESSAGES[ErrorCode.WRONG_ANSWER].format(
+                correct_value=self.correct_values[index],
+                response_value=self.response_values[index],
+            )
+        return None
+
+    def graded(self) -> Iterator[tuple]:
+        """
+        Iterate over the answer value and feedback of each row, see message.
+
+        The feedback of a wrong answer is formatted once per distinct
+        correct and response values.
+
+        Yields:
+            tuple: The answer and the feedback (None if correct) of each row.
+        """
+        wrong_answer = ERROR_MESSAGES[ErrorCode.WRONG_ANSWER].format
+        wrong_answers: dict = {}
+        for code, error, correct_value, response_value, reason in zip(
+            self.answers,
+            self.errors,
+            self.correct_values,
+            self.response_values,
+            self.reasons,
+        ):
+            message = None
+            if reason != NO_REASON:
+                message = self.messages[reason]
+            elif error == ErrorCode.WRONG_ANSWER:
+                values = (correct_value, response_value)
+                message = wrong_answers.get(values)
+                if message is None:
+                    message = wrong_answers[values] = wrong_answer(
+                        correct_value=correct_value, response_value=response_value
+                    )
+            yield ANSWER_VALUES[code], message
+
+    def counts(self) -> dict:
+        """
+        Count the rows of each result.
+
+        Returns:
+            dict: The number of rows of each Answer.
+        """
+        counts = np.bincount(self.columns()["answers"], minlength=len(ANSWERS))
+        return dict(zip(ANSWERS, counts.tolist()))
+
+    def columns(self) -> dict:
+        """
+        View the columns as numpy arrays, without copying them.
+
+        No rows can be added while a view is alive.
+
+        Returns:
+            dict: The array of each column, by attribute name.
+        """
+        return {
+            name: np.frombuffer(getattr(self, name), dtype=dtype)
+            for name, dtype in (
+                ("answers", np.int8),
+                ("errors", np.int8),
+                ("correct_values", np.float64),
+                ("response_values", np.float64),
+                ("reasons", np.int32),
+            )
+        }
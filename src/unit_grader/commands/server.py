@@ -0,0 +1,124 @@
+"""
+This module provides a long-running grading server on a Unix socket.
+
+The conversion tables are loaded once and every connection can send any
+number of grading requests, one JSON object per line:
+
+    {"input_value": "100", "from_unit": "Kelvin",
+     "to_unit": "Celsius", "student_response": "-173.15", "id": 7}
+
+and receives one JSON reply per line, in the same order:
+
+    {"result": "correct", "id": 7}
+
+Requests that are not JSON objects, or that fail to be graded, get an
+{"error": ...} reply instead, see json_requests.
+Correct answers are kept in the shared answer cache, so repeated questions
+only cost a parse and compare of the student's response.
+
+Main Functions:
+    - create_server: Bind a grading server to a Unix socket.
+    - serve: Run a grading server until interrupted.
+"""
+import os
+import signal
+import socket
+import socketserver
+import stat
+import threading
+
+from ..client import DEFAULT_SOCKET_PATH
+from .json_requests import handle_line
+
+
+class GradingRequestHandler(socketserver.StreamRequestHandler):
+    """
+    This class answers the newline-delimited JSON requests of one connection.
+    """
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            reply = handle_line(line)
+            if reply is not None:
+                self.wfile.write(reply.encode())
+
+
+class GradingServer(socketserver.ThreadingUnixStreamServer):
+    """
+    This class serves grading requests on a Unix socket, one thread
+    per connection.
+    """
+
+    daemon_threads = True
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def create_server(socket_path: str = DEFAULT_SOCKET_PATH) -> GradingServer:
+    """
+    Bind a grading server to a Unix socket.
+
+    A socket file left behind by a previous server is replaced, one that
+    still accepts connections is left to the server using it.
+
+    Args:
+        socket_path (str): The path of the Unix socket.
+
+    Returns:
+        GradingServer: The bound server.
+
+    Raises:
+        FileExistsError: If the path exists and is not a socket, or another
+            server is listening on it.
+    """
+    if os.path.exists(socket_path):
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            raise FileExistsError(f"{socket_path} exists and is not a socket.")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            if probe.connect_ex(socket_path) == 0:
+                raise FileExistsError(f"{socket_path} is used by a running server.")
+        os.unlink(socket_path)
+    return GradingServer(socket_path, GradingRequestHandler)
+
+
+def interrupt(signum: int, frame: object) -> None:
+    """
+    Turn a termination signal into a KeyboardInterrupt.
+
+    Args:
+        signum (int): The received signal.
+        frame (object): The interrupted stack frame.
+
+    Returns:
+        None
+    """
+    raise KeyboardInterrupt
+
+
+def serve(socket_path: str = DEFAULT_SOCKET_PATH) -> None:
+    """
+    Run a grading server until interrupted.
+
+    SIGTERM is handled like Ctrl+C so the socket file is removed when a
+    process manager stops the server.
+
+    Args:
+        socket_path (str): The path of the Unix socket.
+
+    Returns:
+        None
+    """
+    main_thread = threading.current_thread() is threading.main_thread()
+    if main_thread:
+        previous_handler = signal.signal(signal.SIGTERM, interrupt)
+    try:
+        with create_server(socket_path) as server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if main_thread:
+            signal.signal(signal.SIGTERM, previous_handler)
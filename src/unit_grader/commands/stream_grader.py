@@ -0,0 +1,110 @@
+"""
+This module grades a stream of newline-delimited JSON requests.
+
+Requests and replies use the format of the grading server, one JSON
+object per line, and replies are written in request order:
+
+    {"input_value": "100", "from_unit": "Kelvin",
+     "to_unit": "Celsius", "student_response": "-173.15", "id": 7}
+    -> {"result": "correct", "id": 7}
+
+Replies are written and flushed in batches: when a batch is full, or as
+soon as no more input is waiting, so a producer that waits for each reply
+is answered right away and a busy pipeline pays one write per batch.
+
+Main Functions:
+    - grade_ndjson: Grade every request of a stream and write the replies.
+"""
+import io
+import json
+import select
+from typing import Callable, TextIO
+
+from ..utils.timings import TIMINGS
+from .json_requests import handle_line
+
+# Replies written at most in one flush
+DEFAULT_FLUSH_LINES: int = 1000
+
+
+def input_waiting(source: TextIO) -> Callable[[], bool]:
+    """
+    Build a check telling whether more input can be read without waiting.
+
+    Args:
+        source (TextIO): The stream of requests.
+
+    Returns:
+        Callable: Returns True if the stream has input ready. Streams that
+        are not backed by a file descriptor, like in-memory streams, are
+        always ready. Streams that cannot be polled, like pipes on
+        Windows, are never ready, so each reply is flushed right away.
+    """
+    try:
+        descriptor = source.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return lambda: True
+
+    def ready() -> bool:
+        try:
+            return bool(select.select([descriptor], [], [], 0)[0])
+        except (OSError, ValueError):  # e.g. pipes and files on Windows
+            return False
+
+    return ready
+
+
+def grade_ndjson(
+    source: TextIO, sink: TextIO, flush_lines: int = DEFAULT_FLUSH_LINES
+) -> int:
+    """
+    Grade every request of a newline-delimited JSON stream and write the replies.
+
+    Blank lines are skipped. Lines that are not JSON objects, or that fail
+    to be graded, get an {"error": ...} reply and the stream goes on.
+
+    Args:
+        source (TextIO): The stream to read requests from.
+        sink (TextIO): The stream to write replies to.
+        flush_lines (int): The maximum number of replies written in one flush.
+
+    Returns:
+        int: The number of replies.
+    """
+    ready = input_waiting(source)
+    pending: list = []
+    count = 0
+    for line in source:
+        try:
+            reply = handle_line(line)
+        except Exception as e:  # keep grading the rest of the stream
+            reply = json.dumps({"error": f"Grading failed: {e!r}"}) + "\n"
+        if reply is None:
+            continue
+        pending.append(reply)
+        if len(pending) >= flush_lines or not ready():
+            count += write_replies(sink, pending)
+    return count + write_replies(sink, pending)
+
+
+def write_replies(sink: TextIO, replies: list) -> int:
+    """
+    Write and flush a batch of replies, then empty the batch.
+
+    Args:
+        sink (TextIO): The stream to write replies to.
+        replies (list): The JSON replies, terminated by newlines.
+
+    Returns:
+        int: The number of replies written.
+    """
+    count = len(replies)
+    if count:
+        sink.write("".join(replies))
+        sink.flush()
+        replies.clear()
+    return count
+
+
+# Stream stages timed while timings are enabled, see utils.timings
+TIMINGS.register(globals(), {"handle_line": "handle", "write_replies": "write"})
@@ -8,5 +8,7 @@ The config package contains the following
     Modules:
         - data: Contains the data for unit, conversion, and help instructions.
         - enums: Contains the enums used in the conversion data.
+        - index: Contains the unit index used to validate units in O(1).
+        - registry: Contains the unit registry the conversion data is built from.
 
 """
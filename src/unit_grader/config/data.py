@@ -2,7 +2,11 @@
 This module contains the conversion data
 for the conversion calculator.
 """
-from ..config.enums import TemperatureUnits, UnitCategory, VolumeUnits
+from fractions import Fraction
+
+from ..config.enums import ErrorCode, TemperatureUnits, UnitCategory, VolumeUnits
+from ..config.index import UnitIndex
+from ..config.registry import UnitRegistry
 
 # Ask for unexpected exit
 UNEXPECTED_EXIT: str = "Unexpected exit. Please contact the maintainer."
@@ -19,142 +23,104 @@ UNIT_CONVERSION_INSTRUCTIONS: str = (
     " unit is case-sensitive."
 )
 
-# Units in each category
-UNITS: dict = {
-    UnitCategory.TEMPERATURE.value: [
-        TemperatureUnits.KELVIN.value,
-        TemperatureUnits.CELSIUS.value,
-        TemperatureUnits.FAHRENHEIT.value,
-        TemperatureUnits.RANKINE.value,
-    ],
-    UnitCategory.VOLUME.value: [
-        VolumeUnits.LITERS.value,
-        VolumeUnits.TABLESPOONS.value,
-        VolumeUnits.CUBIC_INCHES.value,
-        VolumeUnits.CUPS.value,
-        VolumeUnits.CUBIC_FEET.value,
-        VolumeUnits.GALLONS.value,
-    ],
+# Feedback message of each error code, formatted with the fields of a grade result
+ERROR_MESSAGES: dict = {
+    ErrorCode.INVALID_INPUT_VALUE: (
+        "Input Error: {input_value} as input_value needs to be a number. "
+        + HELP_INSTRUCTION
+    ),
+    ErrorCode.UNSUPPORTED_FROM_UNIT: (
+        "Input Error: {from_unit} as from_unit is not supported. "
+        + UNIT_CONVERSION_INSTRUCTIONS
+    ),
+    ErrorCode.UNSUPPORTED_TO_UNIT: (
+        "Input Error: {to_unit} as to_unit is not supported. "
+        + UNIT_CONVERSION_INSTRUCTIONS
+    ),
+    ErrorCode.CATEGORY_MISMATCH: (
+        "Input Error: Ensure the selected conversion units match their "
+        "respective categories for a valid conversion. " + UNIT_CONVERSION_INSTRUCTIONS
+    ),
+    ErrorCode.CONVERSION_FAILED: "Error: {detail}.",
+    ErrorCode.UNEXPECTED_ERROR: "Error: {detail}.",
+    ErrorCode.INVALID_RESPONSE: "{student_response} is not a valid numeric string.",
+    ErrorCode.WRONG_ANSWER: (
+        "{response_value} is not the correct answer. "
+        "The correct answer is {correct_value}."
+    ),
 }
 
+# Unit registry: each unit is defined once relative to the base unit
+# (the first unit) of its category
+REGISTRY: UnitRegistry = UnitRegistry()
+
+# Temperature units relative to Kelvin
+REGISTRY.define(UnitCategory.TEMPERATURE.value, TemperatureUnits.KELVIN.value)
+REGISTRY.define(
+    UnitCategory.TEMPERATURE.value, TemperatureUnits.CELSIUS.value, offset="273.15"
+)
+REGISTRY.define(
+    UnitCategory.TEMPERATURE.value,
+    TemperatureUnits.FAHRENHEIT.value,
+    scale=Fraction(5, 9),
+    offset=Fraction("459.67") * Fraction(5, 9),
+)
+REGISTRY.define(
+    UnitCategory.TEMPERATURE.value,
+    TemperatureUnits.RANKINE.value,
+    scale=Fraction(5, 9),
+)
+
+# Volume units relative to liters
+REGISTRY.define(UnitCategory.VOLUME.value, VolumeUnits.LITERS.value)
+REGISTRY.define(
+    UnitCategory.VOLUME.value,
+    VolumeUnits.TABLESPOONS.value,
+    divisor="67.628",
+)
+REGISTRY.define(
+    UnitCategory.VOLUME.value,
+    VolumeUnits.CUBIC_INCHES.value,
+    divisor="61.024",
+)
+REGISTRY.define(UnitCategory.VOLUME.value, VolumeUnits.CUPS.value, divisor="4.227")
+REGISTRY.define(UnitCategory.VOLUME.value, VolumeUnits.CUBIC_FEET.value, scale="28.317")
+REGISTRY.define(UnitCategory.VOLUME.value, VolumeUnits.GALLONS.value, scale="3.785")
+
+# Published volume factors that differ slightly from the per-liter definitions,
+# as (from_unit, to_unit, scale, divisor): the tables multiplied by the scale
+# or divided by the divisor. They are pinned so grades stay the same as before
+# the registry existed.
+PUBLISHED_VOLUME_FACTORS: tuple = (
+    (VolumeUnits.TABLESPOONS.value, VolumeUnits.CUBIC_INCHES.value, 1, "1.108"),
+    (VolumeUnits.TABLESPOONS.value, VolumeUnits.CUPS.value, 1, 16),
+    (VolumeUnits.TABLESPOONS.value, VolumeUnits.CUBIC_FEET.value, 1, 1915),
+    (VolumeUnits.TABLESPOONS.value, VolumeUnits.GALLONS.value, 1, 256),
+    (VolumeUnits.CUBIC_INCHES.value, VolumeUnits.TABLESPOONS.value, "1.108", 1),
+    (VolumeUnits.CUBIC_INCHES.value, VolumeUnits.CUPS.value, 1, "14.438"),
+    (VolumeUnits.CUBIC_INCHES.value, VolumeUnits.CUBIC_FEET.value, 1, 1728),
+    (VolumeUnits.CUBIC_INCHES.value, VolumeUnits.GALLONS.value, 1, 231),
+    (VolumeUnits.CUPS.value, VolumeUnits.CUBIC_INCHES.value, "14.438", 1),
+    (VolumeUnits.CUPS.value, VolumeUnits.TABLESPOONS.value, 16, 1),
+    (VolumeUnits.CUPS.value, VolumeUnits.CUBIC_FEET.value, 1, "119.7"),
+    (VolumeUnits.CUPS.value, VolumeUnits.GALLONS.value, 1, 16),
+    (VolumeUnits.CUBIC_FEET.value, VolumeUnits.CUBIC_INCHES.value, 1728, 1),
+    (VolumeUnits.CUBIC_FEET.value, VolumeUnits.TABLESPOONS.value, 1915, 1),
+    (VolumeUnits.CUBIC_FEET.value, VolumeUnits.CUPS.value, "119.7", 1),
+    (VolumeUnits.CUBIC_FEET.value, VolumeUnits.GALLONS.value, "7.481", 1),
+    (VolumeUnits.GALLONS.value, VolumeUnits.CUBIC_INCHES.value, 231, 1),
+    (VolumeUnits.GALLONS.value, VolumeUnits.CUBIC_FEET.value, 1, "7.48"),
+    (VolumeUnits.GALLONS.value, VolumeUnits.TABLESPOONS.value, 256, 1),
+    (VolumeUnits.GALLONS.value, VolumeUnits.CUPS.value, 16, 1),
+)
+for from_unit, to_unit, scale, divisor in PUBLISHED_VOLUME_FACTORS:
+    REGISTRY.pin(from_unit, to_unit, scale, divisor=divisor)
+
+# Units in each category
+UNITS: dict = REGISTRY.units
+
+# Index of every unit for O(1) validation
+UNIT_INDEX: UnitIndex = UnitIndex(UNITS)
+
 # Conversion data between units
-CONVERSION_DATA: dict = {
-    UnitCategory.TEMPERATURE.value: {
-        (
-            TemperatureUnits.CELSIUS.value,
-            TemperatureUnits.FAHRENHEIT.value,
-        ): lambda x: x * (9 / 5) + 32,
-        (
-            TemperatureUnits.CELSIUS.value,
-            TemperatureUnits.KELVIN.value,
-        ): lambda x: x + 273.15,
-        (
-            TemperatureUnits.CELSIUS.value,
-            TemperatureUnits.RANKINE.value,
-        ): lambda x: (x + 273.15) * (9 / 5),
-        (
-            TemperatureUnits.FAHRENHEIT.value,
-            TemperatureUnits.CELSIUS.value,
-        ): lambda x: (x - 32) * (5 / 9),
-        (
-            TemperatureUnits.FAHRENHEIT.value,
-            TemperatureUnits.KELVIN.value,
-        ): lambda x: (x + 459.67) * (5 / 9),
-        (
-            TemperatureUnits.FAHRENHEIT.value,
-            TemperatureUnits.RANKINE.value,
-        ): lambda x: x + 459.67,
-        (
-            TemperatureUnits.KELVIN.value,
-            TemperatureUnits.CELSIUS.value,
-        ): lambda x: x - 273.15,
-        (
-            TemperatureUnits.KELVIN.value,
-            TemperatureUnits.FAHRENHEIT.value,
-        ): lambda x: x * (9 / 5) - 459.67,
-        (
-            TemperatureUnits.KELVIN.value,
-            TemperatureUnits.RANKINE.value,
-        ): lambda x: x * (9 / 5),
-        (
-            TemperatureUnits.RANKINE.value,
-            TemperatureUnits.CELSIUS.value,
-        ): lambda x: (x - 491.67) * (5 / 9),
-        (
-            TemperatureUnits.RANKINE.value,
-            TemperatureUnits.FAHRENHEIT.value,
-        ): lambda x: x - 459.67,
-        (
-            TemperatureUnits.RANKINE.value,
-            TemperatureUnits.KELVIN.value,
-        ): lambda x: x * (5 / 9),
-    },
-    UnitCategory.VOLUME.value: {
-        (VolumeUnits.LITERS.value, VolumeUnits.TABLESPOONS.value): lambda x: x * 67.628,
-        (
-            VolumeUnits.LITERS.value,
-            VolumeUnits.CUBIC_INCHES.value,
-        ): lambda x: x * 61.024,
-        (VolumeUnits.LITERS.value, VolumeUnits.CUPS.value): lambda x: x * 4.227,
-        (VolumeUnits.LITERS.value, VolumeUnits.CUBIC_FEET.value): lambda x: x / 28.317,
-        (VolumeUnits.LITERS.value, VolumeUnits.GALLONS.value): lambda x: x / 3.785,
-        (VolumeUnits.TABLESPOONS.value, VolumeUnits.LITERS.value): lambda x: x / 67.628,
-        (
-            VolumeUnits.TABLESPOONS.value,
-            VolumeUnits.CUBIC_INCHES.value,
-        ): lambda x: x / 1.108,
-        (VolumeUnits.TABLESPOONS.value, VolumeUnits.CUPS.value): lambda x: x / 16,
-        (
-            VolumeUnits.TABLESPOONS.value,
-            VolumeUnits.CUBIC_FEET.value,
-        ): lambda x: x / 1915,
-        (
-            VolumeUnits.TABLESPOONS.value,
-            VolumeUnits.GALLONS.value,
-        ): lambda x: x / 256,
-        (
-            VolumeUnits.CUBIC_INCHES.value,
-            VolumeUnits.LITERS.value,
-        ): lambda x: x / 61.024,
-        (
-            VolumeUnits.CUBIC_INCHES.value,
-            VolumeUnits.TABLESPOONS.value,
-        ): lambda x: x * 1.108,
-        (VolumeUnits.CUBIC_INCHES.value, VolumeUnits.CUPS.value): lambda x: x / 14.438,
-        (
-            VolumeUnits.CUBIC_INCHES.value,
-            VolumeUnits.CUBIC_FEET.value,
-        ): lambda x: x / 1728,
-        (
-            VolumeUnits.CUBIC_INCHES.value,
-            VolumeUnits.GALLONS.value,
-        ): lambda x: x / 231,
-        (VolumeUnits.CUPS.value, VolumeUnits.LITERS.value): lambda x: x / 4.227,
-        (VolumeUnits.CUPS.value, VolumeUnits.CUBIC_INCHES.value): lambda x: x * 14.438,
-        (VolumeUnits.CUPS.value, VolumeUnits.TABLESPOONS.value): lambda x: x * 16,
-        (VolumeUnits.CUPS.value, VolumeUnits.CUBIC_FEET.value): lambda x: x / 119.7,
-        (VolumeUnits.CUPS.value, VolumeUnits.GALLONS.value): lambda x: x / 16,
-        (VolumeUnits.CUBIC_FEET.value, VolumeUnits.LITERS.value): lambda x: x * 28.317,
-        (
-            VolumeUnits.CUBIC_FEET.value,
-            VolumeUnits.CUBIC_INCHES.value,
-        ): lambda x: x * 1728,
-        (
-            VolumeUnits.CUBIC_FEET.value,
-            VolumeUnits.TABLESPOONS.value,
-        ): lambda x: x * 1915,
-        (VolumeUnits.CUBIC_FEET.value, VolumeUnits.CUPS.value): lambda x: x * 119.7,
-        (VolumeUnits.CUBIC_FEET.value, VolumeUnits.GALLONS.value): lambda x: x * 7.481,
-        (VolumeUnits.GALLONS.value, VolumeUnits.LITERS.value): lambda x: x * 3.785,
-        (
-            VolumeUnits.GALLONS.value,
-            VolumeUnits.CUBIC_INCHES.value,
-        ): lambda x: x * 231,
-        (VolumeUnits.GALLONS.value, VolumeUnits.CUBIC_FEET.value): lambda x: x / 7.48,
-        (
-            VolumeUnits.GALLONS.value,
-            VolumeUnits.TABLESPOONS.value,
-        ): lambda x: x * 256,
-        (VolumeUnits.GALLONS.value, VolumeUnits.CUPS.value): lambda x: x * 16,
-    },
-}
+CONVERSION_DATA: dict = REGISTRY.conversion_table()
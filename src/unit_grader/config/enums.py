@@ -1,7 +1,7 @@
 """
 This module contains the enums used in the conversion data.
 """
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class Answer(Enum):
@@ -14,6 +14,51 @@ class Answer(Enum):
     INVALID = "invalid"
 
 
+class AnswerCode(IntEnum):
+    """
+    This enum contains the compact integer codes of the grading results,
+    used when whole columns of submissions are graded at once.
+    """
+
+    CORRECT = 0
+    INCORRECT = 1
+    INVALID = 2
+
+    @property
+    def answer(self) -> Answer:
+        """
+        The grading result the code stands for.
+        """
+        return Answer[self.name]
+
+
+class ErrorCode(IntEnum):
+    """
+    This enum contains the reason a response was not graded as correct.
+    """
+
+    NONE = 0
+    INVALID_INPUT_VALUE = 1
+    UNSUPPORTED_FROM_UNIT = 2
+    UNSUPPORTED_TO_UNIT = 3
+    CATEGORY_MISMATCH = 4
+    CONVERSION_FAILED = 5
+    UNEXPECTED_ERROR = 6
+    INVALID_RESPONSE = 7
+    WRONG_ANSWER = 8
+
+
+class OutputFormat(str, Enum):
+    """
+    This enum contains the output formats of the single-grade command.
+    """
+
+    RICH = "rich"
+    JSON = "json"
+    PLAIN = "plain"
+    EXIT_CODE = "exit-code"
+
+
 class UnitCategory(Enum):
     """
     This enum contains the categories of units of measure.
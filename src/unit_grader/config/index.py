@@ -0,0 +1,164 @@
+"""
+This module contains the unit index used to validate units in O(1).
+
+The index is built once from the units of each category and maps every unit
+name to its category and to stable integer ids, so validation is a single
+dictionary lookup instead of a scan over every category list. Whole columns
+of unit names are dictionary-encoded into uint8 unit ids, see encode.
+"""
+from types import MappingProxyType
+from typing import Iterable, NamedTuple, Optional
+
+# The code of unknown units in encoded unit columns
+UNKNOWN_UNIT: int = 255
+
+
+class UnitEntry(NamedTuple):
+    """
+    This class contains the index entry of a unit.
+    """
+
+    category: str
+    category_id: int
+    unit_id: int
+
+
+class UnitIndex:
+    """
+    This class contains an immutable index of the units of each category.
+    """
+
+    __slots__ = ("categories", "units", "_convertible", "_entries")
+
+    def __init__(self, units: dict) -> None:
+        """
+        Build the index.
+
+        Args:
+            units (dict): The units of each category.
+        """
+        entries = {}
+        for category_id, (category, names) in enumerate(units.items()):
+            for name in names:
+                entries[name] = UnitEntry(category, category_id, len(entries))
+        self.categories: tuple = tuple(units)
+        self.units: tuple = tuple(entries)
+        self._convertible = None
+        self._entries = MappingProxyType(entries)
+
+    @property
+    def convertible(self):
+        """
+        The read-only boolean matrix where [i, j] tells whether the unit with
+        id i can be converted into the unit with id j.
+
+        It is built on first use so that scalar grading does not import numpy.
+        """
+        if self._convertible is None:
+            import numpy as np
+
+            category_ids = np.array(
+                [entry.category_id for entry in self._entries.values()],
+                dtype=np.intp,
+            )
+            convertible = category_ids[:, None] == category_ids[None, :]
+            convertible.setflags(write=False)
+            self._convertible = convertible
+        return self._convertible
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, unit: object) -> bool:
+        return self.lookup(unit) is not None
+
+    def lookup(self, unit: object) -> Optional[UnitEntry]:
+        """
+        Look up the index entry of a unit.
+
+        Args:
+            unit (object): The unit to look up.
+
+        Returns:
+            UnitEntry: The category and ids of the unit.
+            None: If the unit does not exist.
+        """
+        try:
+            return self._entries.get(unit)
+        except TypeError:  # unhashable values are never units
+            return None
+
+    def encode(self, units: Iterable):
+        """
+        Dictionary-encode a column of unit names into unit ids.
+
+        Each distinct name is looked up once, then every entry is mapped to
+        the id of its name, so a column repeating a few units millions of
+        times costs one dictionary lookup per entry.
+
+        Args:
+            units (Iterable): The unit names (or any values) of the column.
+
+        Returns:
+            np.ndarray: The uint8 unit id of each entry, UNKNOWN_UNIT for
+            entries that are not units.
+
+        Raises:
+            ValueError: If the index holds too many units for uint8 ids.
+        """
+        import numpy as np
+
+        if len(self) >= UNKNOWN_UNIT:
+            raise ValueError(
+                f"Cannot encode units of an index of {len(self)} units, "
+                f"at most {UNKNOWN_UNIT - 1} are supported."
+            )
+        units = list(units)
+        try:
+            names = dict.fromkeys(units)
+        except TypeError:  # unhashable values, look up one entry at a time
+            return np.fromiter(
+                (
+                    UNKNOWN_UNIT if entry is None else entry.unit_id
+                    for entry in map(self.lookup, units)
+                ),
+                dtype=np.uint8,
+                count=len(units),
+            )
+        for name in names:
+            entry = self._entries.get(name)
+            names[name] = UNKNOWN_UNIT if entry is None else entry.unit_id
+        return np.fromiter(
+            map(names.__getitem__, units), dtype=np.uint8, count=len(units)
+        )
+
+    def category_of(self, unit: object) -> Optional[str]:
+        """
+        Get the category of a unit.
+
+        Args:
+            unit (object): The unit to check.
+
+        Returns:
+            str: The category of the unit (e.g., 'temperature' or 'volume').
+            None: If the unit does not exist.
+        """
+        entry = self.lookup(unit)
+        return None if entry is None else entry.category
+
+    def can_convert(self, from_unit: object, to_unit: object) -> bool:
+        """
+        Check if one unit can be converted into another.
+
+        Args:
+            from_unit (object): The unit to convert from.
+            to_unit (object): The unit to convert to.
+
+        Returns:
+            bool: True if both units exist in the same category, False otherwise.
+        """
+        from_entry = self.lookup(from_unit)
+        to_entry = self.lookup(to_unit)
+        if from_entry is None or to_entry is None:
+            return False
+        return from_entry.category_id == to_entry.category_id
@@ -0,0 +1,275 @@
+"""
+This module contains the unit registry used to build the conversion data.
+
+Every supported conversion is an affine transform (y = scale * x + offset).
+The registry stores each unit once, as a transform into the base unit of its
+category, and composes any pair of units on demand. Coefficients are kept as
+exact fractions while composing and rounded to floats only once, so composed
+transforms are as precise as hand-written ones.
+
+Factors written as "one per" (1/1728 cubic feet per cubic inch) are applied
+as a true division by a divisor, like the published tables did: x / 1728 is
+not always the same float as x * (1 / 1728).
+"""
+import hashlib
+from fractions import Fraction
+from typing import NamedTuple, Optional, Union
+
+Number = Union[int, str, Fraction]
+
+
+class AffineTransform(NamedTuple):
+    """
+    This class contains the coefficients of a conversion
+    y = scale * x / divisor + offset.
+    """
+
+    scale: float
+    offset: float
+    divisor: float = 1.0
+
+    def __call__(self, value):
+        """
+        Apply the conversion to a number or a numpy array.
+
+        Args:
+            value (float | np.ndarray): The value(s) to convert.
+
+        Returns:
+            float | np.ndarray: The converted value(s).
+        """
+        scaled = value * self.scale
+        if self.divisor != 1:
+            scaled = scaled / self.divisor
+        if self.offset:
+            return scaled + self.offset
+        return scaled
+
+
+class UnitRegistry:
+    """
+    This class contains the units of measure and the conversions between them.
+    """
+
+    def __init__(self) -> None:
+        self._categories: dict = {}
+        self._definitions: dict = {}
+        self._pins: dict = {}
+        self._transforms: dict = {}
+
+    def define(
+        self,
+        category: str,
+        unit: str,
+        scale: Number = 1,
+        offset: Number = 0,
+        divisor: Number = 1,
+    ) -> None:
+        """
+        Define a unit relative to the base unit of its category.
+
+        The first unit defined in a category is its base unit. One unit is
+        scale / divisor base units, so a unit published as so many to the
+        base unit (67.628 tablespoons to the liter) is defined by its divisor.
+
+        Args:
+            category (str): The unit category (e.g. 'temperature' or 'volume').
+            unit (str): The name of the unit.
+            scale (Number): The base-unit amount of one unit.
+            offset (Number): The base-unit value of zero in this unit.
+            divisor (Number): The number of units the scale is shared by.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the unit is already defined or the scale or the
+                divisor is zero.
+        """
+        if unit in self._definitions:
+            raise ValueError(f"unit {unit} is already defined.")
+        if Fraction(scale) == 0 or Fraction(divisor) == 0:
+            raise ValueError(f"scale and divisor of unit {unit} cannot be zero.")
+        self._categories.setdefault(category, []).append(unit)
+        self._definitions[unit] = (
+            category,
+            Fraction(scale),
+            Fraction(offset),
+            Fraction(divisor),
+        )
+        self._transforms.clear()
+
+    def pin(
+        self,
+        from_unit: str,
+        to_unit: str,
+        scale: Number,
+        offset: Number = 0,
+        divisor: Number = 1,
+    ) -> None:
+        """
+        Pin the coefficients of one conversion instead of composing them.
+
+        This keeps published factors that do not exactly follow from the
+        unit definitions.
+
+        Args:
+            from_unit (str): The unit to convert from.
+            to_unit (str): The unit to convert to.
+            scale (Number): The scale of the conversion.
+            offset (Number): The offset of the conversion.
+            divisor (Number): The divisor of the conversion, for factors
+                published as a division (e.g. 1728 for x / 1728).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the units are unknown or in different categories,
+                or the divisor is zero.
+        """
+        self._check_pair(from_unit, to_unit)
+        if Fraction(divisor) == 0:
+            raise ValueError(f"divisor of {from_unit} to {to_unit} cannot be zero.")
+        self._pins[(from_unit, to_unit)] = (
+            Fraction(scale),
+            Fraction(offset),
+            Fraction(divisor),
+        )
+        self._transforms.pop((from_unit, to_unit), None)
+
+    @property
+    def units(self) -> dict:
+        """
+        The units of each category, in definition order.
+        """
+        return {category: list(units) for category, units in self._categories.items()}
+
+    def category_of(self, unit: str) -> Optional[str]:
+        """
+        Get the category of a unit.
+
+        Args:
+            unit (str): The name of the unit.
+
+        Returns:
+            str: The category of the unit.
+            None: If the unit is not defined.
+        """
+        definition = self._definitions.get(unit)
+        return None if definition is None else definition[0]
+
+    def transform(self, from_unit: str, to_unit: str) -> AffineTransform:
+        """
+        Get the conversion from one unit to another.
+
+        Args:
+            from_unit (str): The unit to convert from.
+            to_unit (str): The unit to convert to.
+
+        Returns:
+            AffineTransform: The conversion coefficients.
+
+        Raises:
+            ValueError: If the units are unknown or in different categories.
+        """
+        key = (from_unit, to_unit)
+        transform = self._transforms.get(key)
+        if transform is None:
+            self._check_pair(from_unit, to_unit)
+            if key in self._pins:
+                scale, offset, divisor = self._pins[key]
+            else:
+                _, from_scale, from_offset, from_divisor = self._definitions[from_unit]
+                _, to_scale, to_offset, to_divisor = self._definitions[to_unit]
+                scale = from_scale * to_divisor
+                divisor = from_divisor * to_scale
+                offset = (from_offset - to_offset) * to_divisor / to_scale
+            if scale == 1 and divisor > 1:  # one per divisor: divide
+                transform = AffineTransform(1.0, float(offset), float(divisor))
+            else:
+                transform = AffineTransform(float(scale / divisor), float(offset))
+            self._transforms[key] = transform
+        return transform
+
+    def conversion_table(self) -> dict:
+        """
+        Build the conversion between every pair of distinct units.
+
+        Returns:
+            dict: The AffineTransform of each (from_unit, to_unit) pair,
+            grouped by category.
+        """
+        return {
+            category: {
+                (from_unit, to_unit): self.transform(from_unit, to_unit)
+                for from_unit in units
+                for to_unit in units
+                if from_unit != to_unit
+            }
+            for category, units in self._categories.items()
+        }
+
+    def fingerprint(self) -> str:
+        """
+        Build a digest of the conversion table.
+
+        The digest changes whenever a unit or a conversion factor changes,
+        so results graded with one table can be told apart from another's.
+
+        Returns:
+            str: The SHA-256 hex digest of every conversion, in a stable order.
+        """
+        digest = hashlib.sha256()
+        for category, transforms in sorted(self.conversion_table().items()):
+            for (from_unit, to_unit), transform in sorted(transforms.items()):
+                coefficients = "\t".join(value.hex() for value in transform)
+                line = f"{category}\t{from_unit}\t{to_unit}\t{coefficients}\n"
+                digest.update(line.encode())
+        return digest.hexdigest()
+
+    def coefficients(self, category: str) -> tuple:
+        """
+        Get the conversion coefficients of a category as arrays.
+
+        Args:
+            category (str): The unit category.
+
+        Returns:
+            tuple: The units of the category, and the float64 scale, offset
+            and divisor matrices where [i, j] converts units[i] to units[j].
+        """
+        import numpy as np  # only the array engines need numpy
+
+        units = tuple(self._categories[category])
+        transforms = [[self.transform(f, t) for t in units] for f in units]
+        coefficients = np.array(transforms, dtype=np.float64).reshape(
+            len(units), len(units), len(AffineTransform._fields)
+        )
+        return units, coefficients[..., 0], coefficients[..., 1], coefficients[..., 2]
+
+    def _check_pair(self, from_unit: str, to_unit: str) -> None:
+        """
+        Check that two units are defined in the same category.
+
+        Args:
+            from_unit (str): The unit to convert from.
+            to_unit (str): The unit to convert to.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the units are unknown or in different categories.
+        """
+        from_category = self.category_of(from_unit)
+        to_category = self.category_of(to_unit)
+        if from_category is None or to_category is None:
+            raise ValueError(
+                f"from_unit {from_unit} or to_unit {to_unit} is not a valid unit."
+            )
+        if from_category != to_category:
+            raise ValueError(
+                f"from_unit {from_unit} and to_unit {to_unit} are not in the same"
+                " category."
+            )
@@ -0,0 +1,140 @@
+"""
+This module is the entry point of the unit-grader command.
+
+A plain single-grade invocation, i.e. only the --input-value, --from-unit,
+--to-unit, --student-response, --output and --verbose options, is graded
+right here without importing typer or numpy, so scripts that grade one
+answer per call start quickly. Every other invocation (help, version,
+subcommands, missing or repeated options) is handed over to the typer app
+in cli.
+
+An argument file, given as @FILE or --from-args-file FILE, holds one set
+of single-grade options per line. Its lines are graded in this process as
+well, see commands.args_file_grader.
+
+With --output json, plain or exit-code, rich is not imported either: the
+result is written as a single line (nothing for exit-code) and the exit
+code tells correct (0), incorrect (1) and invalid (3) answers apart. Exit
+code 2 is left for usage errors.
+
+The options are parsed by utils.options and results are rendered by
+utils.rendering, which the typer app and the commands share.
+
+Main Functions:
+    - grade_file: Grade every command line of an argument file.
+    - grade_single: Grade a student's response like the full command.
+    - main: Run the unit-grader command.
+"""
+import logging
+import os
+import sys
+from typing import Optional
+
+from . import __feedback_url__
+from .config.enums import OutputFormat
+from .utils.options import ARGS_FILE_OPTION, parse_args_file, parse_single_grade
+from .utils.rendering import (
+    enableLogging,
+    print_feedback,
+    print_grade_result,
+    write_grade_result,
+)
+
+# Environment variable naming a file to write the timings of each grading
+# stage to when the command exits, see utils.timings
+TIMINGS_ENV: str = "UNIT_GRADER_TIMINGS"
+
+
+def grade_file(args_file: str, verbose: bool, output: str) -> int:
+    """
+    Grade every command line of an argument file.
+
+    Args:
+        args_file (str): The path of the argument file, or - for stdin.
+        verbose (bool): A flag to indicate whether to enable verbose output.
+        output (str): The output format: rich, json, plain or exit-code.
+
+    Returns:
+        int: The exit code, see grade_args_file.
+    """
+    from .commands.args_file_grader import grade_args_file
+
+    enableLogging(verbose, output != OutputFormat.RICH.value)
+    logging.debug(f"args_file: {args_file}")
+    if args_file == "-":
+        return grade_args_file(sys.stdin, output)
+    with open(args_file, encoding="utf-8") as source:
+        return grade_args_file(source, output)
+
+
+def grade_single(
+    input_value: str,
+    from_unit: str,
+    to_unit: str,
+    student_response: str,
+    verbose: bool,
+    output: str = OutputFormat.RICH.value,
+) -> int:
+    """
+    Grade a student's response and print the result like the full command.
+
+    Args:
+        input_value (str): The input value provided in the question.
+        from_unit (str): The unit mentioned in the question.
+        to_unit (str): The target unit mentioned in the question.
+        student_response (str): The student's response.
+        verbose (bool): A flag to indicate whether to enable verbose output.
+        output (str): The output format: rich, json, plain or exit-code.
+
+    Returns:
+        int: The exit code, see write_grade_result. Always 0 for rich output.
+    """
+    from .commands.conversion_grader import grade
+    from .utils.timings import TIMINGS
+
+    quiet = output != OutputFormat.RICH.value
+    enableLogging(verbose, quiet)
+    logging.debug(f"input_value: {input_value}")
+    logging.debug(f"from_unit: {from_unit}")
+    logging.debug(f"to_unit: {to_unit}")
+    logging.debug(f"student_response: {student_response}")
+    with TIMINGS.stage("grade"):
+        result = grade(input_value, from_unit, to_unit, student_response)
+    with TIMINGS.stage("render"):
+        if quiet:
+            return write_grade_result(result, output)
+        print_grade_result(result)
+        print_feedback(__feedback_url__)
+    return 0
+
+
+def main(args: Optional[list] = None) -> Optional[int]:
+    """
+    Run the unit-grader command.
+
+    Args:
+        args (list): The command line arguments. Defaults to sys.argv[1:].
+            A first argument @FILE stands for --from-args-file FILE.
+
+    Returns:
+        int: The exit code of a plain single-grade or argument-file
+        invocation.
+        None: Otherwise, the typer app exits by itself.
+    """
+    if args is None:
+        args = sys.argv[1:]
+    if os.environ.get(TIMINGS_ENV):
+        from .utils.timings import dump_at_exit
+
+        dump_at_exit(os.environ[TIMINGS_ENV])
+    if args and args[0].startswith("@") and len(args[0]) > 1:
+        args = [ARGS_FILE_OPTION, args[0][1:]] + args[1:]
+    params = parse_single_grade(args)
+    if params is not None:
+        return grade_single(**params)
+    params = parse_args_file(args)
+    if params is not None:
+        return grade_file(**params)
+    from .cli import app
+
+    app(args=args, prog_name="unit-grader")
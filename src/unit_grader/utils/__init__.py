@@ -6,7 +6,21 @@ This file is required for Python to recognize this directory as a package.
 The utils package contains the following:
 
     Modules:
+        - cache: Contains a bounded LRU cache with hit, miss
+          and eviction counters.
         - common: Contains common functions used
           in the conversion calculator and grader.
+        - numeric: Contains the parsing of numeric strings,
+          one value or a whole column at a time.
+        - options: Contains the parsing of the single-grade
+          options without typer.
+        - profiler: Contains the profiler writing cProfile,
+          flame graph and memory allocation reports of a run.
+        - rendering: Contains the rendering of the result
+          of a single grading.
+        - tenths: Contains the rounding of values to integer
+          tenths, one value or a whole array at a time.
+        - timings: Contains the opt-in timers recording the
+          latency of each grading stage.
 
 """
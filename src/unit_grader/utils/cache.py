@@ -0,0 +1,113 @@
+"""
+This module contains a bounded least-recently-used cache with counters.
+
+Main Classes:
+    - LRUCache: Keep the results of the most recently used keys.
+    - CacheStats: Snapshot of the counters of a cache.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple
+
+
+class CacheStats(NamedTuple):
+    """
+    This class contains a snapshot of the counters of a cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class LRUCache:
+    """
+    This class keeps the results of the most recently used keys.
+
+    When the cache is full, the least recently used entry is evicted.
+    The cache can be shared by threads.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "evictions", "_entries", "_lock")
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of entries.
+
+        Raises:
+            ValueError: If maxsize is less than 1.
+        """
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be at least 1, got {maxsize}.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, compute: Callable[[], object]) -> object:
+        """
+        Get the value of a key, computing and storing it on a miss.
+
+        Values of unhashable keys are computed every time and never stored.
+
+        Args:
+            key (Hashable): The key of the value.
+            compute (Callable): Computes the value of the key.
+
+        Returns:
+            object: The cached or computed value.
+        """
+        try:
+            with self._lock:
+                value = self._entries[key]
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+        except KeyError:
+            pass
+        except TypeError:  # unhashable keys cannot be cached
+            return compute()
+        value = compute()
+        with self._lock:
+            self.misses += 1
+            if key in self._entries:  # stored by another thread meanwhile
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def stats(self) -> CacheStats:
+        """
+        Take a snapshot of the counters.
+
+        Returns:
+            CacheStats: The hits, misses, evictions, size and maximum size.
+        """
+        with self._lock:
+            return CacheStats(
+                self.hits, self.misses, self.evictions, len(self._entries), self.maxsize
+            )
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the counters.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -1,9 +1,30 @@
+import math
 from typing import Optional
 
-import numpy as np  # Import numpy for rounding
-from rich import print
+from ..config.data import UNIT_INDEX
+from .numeric import parse_number
 
-from ..config.data import UNITS
+
+def round_half_even(value: float, decimals: int) -> float:
+    """
+    Round a number to the given number of decimals, half to even.
+
+    This follows numpy.round exactly (scale by 10**decimals, round to the
+    nearest integer with ties to even, scale back), so results are identical
+    to the numpy-based grading without importing numpy.
+
+    Args:
+        value (float): The number to round.
+        decimals (int): The number of decimals to keep.
+
+    Returns:
+        float: The rounded number.
+    """
+    factor = 10.0**decimals
+    scaled = value * factor
+    if math.isfinite(scaled):
+        scaled = math.copysign(float(round(scaled)), scaled)
+    return scaled / factor
 
 
 def is_valid_numeric_string(numeric_string: str) -> bool:
@@ -16,13 +37,74 @@ def is_valid_numeric_string(numeric_string: str) -> bool:
     Returns:
         bool: True if the string is a valid numeric string, False otherwise.
     """
-    try:
-        float(numeric_string)  # Try to convert the string to a float
-        return True  # If successful, it's a valid numeric string
-    except TypeError:
-        return False
-    except ValueError:
-        return False
+    return parse_number(numeric_string) is not None
+
+
+def convert_value(
+    input_value: float,
+    from_unit: str,
+    to_unit: str,
+    category: str,
+    conversion_data: dict,
+) -> float:
+    """
+    Convert an input value from one unit to another, rounded to the tenths place.
+
+    Args:
+        input_value (float): The input value to be converted.
+        from_unit (str): The unit to convert from.
+        to_unit (str): The unit to convert to.
+        category (str): The unit category ('temperature' or 'volume').
+        conversion_data (dict): The conversion data.
+
+    Returns:
+        float: The converted value.
+
+    Raises:
+        ValueError: If the units or the conversion data are invalid.
+        Exception: Any error raised by the conversion function itself.
+    """
+    # Validate the input parameters
+    if category not in UNIT_INDEX.categories:
+        raise ValueError(f"category {category} is not a valid category.")
+
+    if (UNIT_INDEX.category_of(from_unit) != category) or (
+        UNIT_INDEX.category_of(to_unit) != category
+    ):
+        raise ValueError(
+            (
+                f"from_unit {from_unit} is not a "
+                f"valid unit or to_unit {to_unit} is not a valid unit."
+            )
+        )
+
+    # if from_unit == to_unit return the output
+    if from_unit == to_unit:
+        return round_half_even(input_value, 1)
+
+    # Define conversion factors for temperatures and volumes
+    if (from_unit, to_unit) not in conversion_data[category]:
+        raise ValueError(
+            (f"Conversion factor for {from_unit}" f"to {to_unit} does not exist.")
+        )
+
+    conversion_func = conversion_data[category][(from_unit, to_unit)]
+    if not callable(conversion_func):
+        raise ValueError(
+            (
+                f"Conversion function {conversion_func} "
+                f"for {from_unit} to {to_unit} is not callable."
+            )
+        )
+    """
+    Perform the conversion and avoid the
+    floating point precision issue by rounding the same way as numpy
+    checkout https://docs.python.org/3/
+    library/functions.html#round for rounding issue in python3
+    """
+
+    converted_value = round_half_even(conversion_func(input_value), 3)
+    return round_half_even(converted_value, 1)
 
 
 def convert_units(
@@ -46,50 +128,7 @@ def convert_units(
         float: The converted value.
         None: If the conversion cannot be performed.
     """
-    # Perform the conversion
     try:
-        # Validate the input parameters
-        if category not in UNITS:
-            raise ValueError(f"category {category} is not a valid category.")
-
-        if (from_unit not in UNITS[category]) or (to_unit not in UNITS[category]):
-            raise ValueError(
-                (
-                    f"from_unit {from_unit} is not a "
-                    f"valid unit or to_unit {to_unit} is not a valid unit."
-                )
-            )
-
-        # if from_unit == to_unit return the output
-        if from_unit == to_unit:
-            return np.round(input_value, 1)
-
-        # Define conversion factors for temperatures and volumes
-        if (from_unit, to_unit) not in conversion_data[category]:
-            raise ValueError(
-                (f"Conversion factor for {from_unit}" f"to {to_unit} does not exist.")
-            )
-
-        conversion_func = conversion_data[category][(from_unit, to_unit)]
-        if not callable(conversion_func):
-            raise ValueError(
-                (
-                    f"Conversion function {conversion_func} "
-                    f"for {from_unit} to {to_unit} is not callable."
-                )
-            )
-        """
-        Perform the conversion and avoid the
-        floating point precision issue using numpy for rounding
-        checkout https://docs.python.org/3/
-        library/functions.html#round for rounding issue in python3
-        """
-
-        converted_value = np.round((conversion_func(input_value)), 3)
-        return np.round(converted_value, 1)
-    except ValueError as e:
-        print(f"[bold red]Error: {e}.[/bold red]")
-        return None
-    except Exception as e:
-        print(f"[bold red]Error: {e}.[/bold red]")
+        return convert_value(input_value, from_unit, to_unit, category, conversion_data)
+    except Exception:
         return None  # Cannot convert for any reason
@@ -0,0 +1,118 @@
+"""
+This module parses the options of the single-grade command without typer.
+
+Only the options of a plain single-grade invocation and of an argument
+file are recognized. Anything else is left to the typer app in cli.
+
+Main Functions:
+    - parse_options: Parse the options of a command handled without typer.
+    - parse_single_grade: Recognize a plain single-grade invocation.
+    - parse_args_file: Recognize an argument-file invocation.
+"""
+import os
+from typing import Optional
+
+from ..config.enums import OutputFormat
+
+# Options of the single-grade command and the parameter they set
+SINGLE_GRADE_OPTIONS: dict = {
+    "--input-value": "input_value",
+    "-i": "input_value",
+    "--from-unit": "from_unit",
+    "-f": "from_unit",
+    "--to-unit": "to_unit",
+    "-t": "to_unit",
+    "--student-response": "student_response",
+    "-s": "student_response",
+}
+
+# Flags enabling verbose output
+VERBOSE_FLAGS: tuple = ("--verbose", "-v")
+
+# Option choosing the output format
+OUTPUT_OPTION: str = "--output"
+
+# Option naming a file of single-grade command lines, also given as @FILE
+ARGS_FILE_OPTION: str = "--from-args-file"
+
+
+def parse_options(args: list, options: dict) -> Optional[dict]:
+    """
+    Parse the options of a command handled without the typer app.
+
+    The --verbose and --output options are always accepted. Long options
+    may be given as --option=value.
+
+    Args:
+        args (list): The command line arguments, without the program name.
+        options (dict): The parameter set by each other accepted option.
+
+    Returns:
+        dict: The parameters that were given, with the verbose and output
+        parameters.
+        None: If an option is unknown, repeated, misses its value or has
+        an invalid output format.
+    """
+    params: dict = {"verbose": False}
+    position = 0
+    while position < len(args):
+        flag = args[position]
+        if flag in VERBOSE_FLAGS:
+            params["verbose"] = True
+            position += 1
+            continue
+        if flag.startswith("--") and "=" in flag:
+            flag, value = flag.split("=", 1)
+            position += 1
+        elif position + 1 < len(args):
+            value = args[position + 1]
+            position += 2
+        else:
+            return None
+        name = "output" if flag == OUTPUT_OPTION else options.get(flag)
+        if name is None or name in params:
+            return None
+        params[name] = value
+    output = params.setdefault("output", OutputFormat.RICH.value)
+    if output not in {format.value for format in OutputFormat}:
+        return None
+    return params
+
+
+def parse_single_grade(args: list) -> Optional[dict]:
+    """
+    Recognize a plain single-grade invocation.
+
+    Args:
+        args (list): The command line arguments, without the program name.
+
+    Returns:
+        dict: The input_value, from_unit, to_unit, student_response,
+        verbose and output parameters.
+        None: If the arguments need the full command line interface.
+    """
+    params = parse_options(args, SINGLE_GRADE_OPTIONS)
+    if params is None or not set(SINGLE_GRADE_OPTIONS.values()) <= params.keys():
+        return None
+    return params
+
+
+def parse_args_file(args: list) -> Optional[dict]:
+    """
+    Recognize an argument-file invocation, i.e. --from-args-file FILE.
+
+    Args:
+        args (list): The command line arguments, without the program name.
+
+    Returns:
+        dict: The args_file, verbose and output parameters.
+        None: If the arguments need the full command line interface,
+        including when the file does not exist.
+    """
+    params = parse_options(args, {ARGS_FILE_OPTION: "args_file"})
+    if params is None or "args_file" not in params:
+        return None
+    path = params["args_file"]
+    if path != "-" and not os.path.isfile(path):
+        return None
+    return params
@@ -0,0 +1,178 @@
+"""
+This module contains the profiler capturing where a grading run spends its
+time and memory.
+
+A Profiler runs cProfile and tracemalloc between start and stop and then
+writes three reports to its directory:
+
+    - profile.pstats: The cProfile statistics, for pstats or snakeviz.
+    - profile.collapsed: The call stacks in the collapsed format of
+      flamegraph.pl and speedscope, one "caller;callee microseconds" line
+      per stack.
+    - allocations.txt: The source lines allocating the most memory still
+      held when the profiler stopped, and the peak traced memory.
+
+    profiler = Profiler("out")
+    profiler.start()
+    grade_stream(source, sink)
+    profiler.stop()  # ["out/profile.pstats", ...]
+
+cProfile records the callers of each function but not whole stacks, so
+the collapsed stacks are rebuilt from the call graph: the time of a
+function called from several places is split among its callers in
+proportion to the time each caller spent in it.
+
+Main Classes:
+    - Profiler: Profile the time and memory of a run.
+
+Main Functions:
+    - collapse_stats: Rebuild the collapsed call stacks of cProfile statistics.
+    - frame_label: Label a function in a collapsed call stack.
+"""
+import cProfile
+import os
+import pstats
+import tracemalloc
+from collections import defaultdict
+from typing import List, Optional
+
+# The file names of the reports
+PSTATS_FILE: str = "profile.pstats"
+COLLAPSED_FILE: str = "profile.collapsed"
+ALLOCATIONS_FILE: str = "allocations.txt"
+
+# Allocation sites listed in the allocation report
+TOP_ALLOCATIONS: int = 25
+
+
+class Profiler:
+    """
+    This class profiles the time and memory of a run.
+
+    Attributes:
+        directory (str): The directory the reports are written to.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self._profile: Optional[cProfile.Profile] = None
+        self._traced = False
+
+    def start(self) -> None:
+        """
+        Start profiling calls and tracing memory allocations.
+
+        Returns:
+            None
+        """
+        self._traced = not tracemalloc.is_tracing()
+        if self._traced:
+            tracemalloc.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self) -> List[str]:
+        """
+        Stop profiling and write the reports.
+
+        Returns:
+            List[str]: The paths of the reports.
+
+        Raises:
+            RuntimeError: If the profiler was not started.
+            OSError: If the directory cannot be created or written to.
+        """
+        if self._profile is None:
+            raise RuntimeError("The profiler was not started.")
+        profile, self._profile = self._profile, None
+        profile.disable()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            )
+        )
+        _, peak = tracemalloc.get_traced_memory()
+        if self._traced:
+            tracemalloc.stop()
+
+        os.makedirs(self.directory, exist_ok=True)
+        paths = [
+            os.path.join(self.directory, name)
+            for name in (PSTATS_FILE, COLLAPSED_FILE, ALLOCATIONS_FILE)
+        ]
+        profile.dump_stats(paths[0])
+        with open(paths[1], "w", encoding="utf-8") as sink:
+            sink.writelines(
+                line + "\n" for line in collapse_stats(pstats.Stats(profile))
+            )
+        with open(paths[2], "w", encoding="utf-8") as sink:
+            sink.write(f"# Peak traced memory: {peak / 1024:.1f} KiB\n")
+            sink.write(f"# Top {TOP_ALLOCATIONS} allocation sites still held:\n")
+            for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+                sink.write(f"{stat}\n")
+        return paths
+
+
+def frame_label(function: tuple) -> str:
+    """
+    Label a function in a collapsed call stack.
+
+    Args:
+        function (tuple): The (file name, line number, function name) key of
+            the function in the cProfile statistics.
+
+    Returns:
+        str: "name (file.py:line)", or the name alone for built-ins, without
+        the ";" separating frames.
+    """
+    filename, line, name = function
+    if filename == "~":
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    return label.replace(";", ",")
+
+
+def collapse_stats(stats: pstats.Stats) -> List[str]:
+    """
+    Rebuild the collapsed call stacks of cProfile statistics.
+
+    Stacks start at the functions without a recorded caller. A callee gets
+    the share of its time spent under the caller on the stack, scaled by
+    the share of the caller's total time spent on that stack. Recursive calls
+    are folded into the outermost call of the function.
+
+    Args:
+        stats (pstats.Stats): The cProfile statistics.
+
+    Returns:
+        List[str]: One "frame;frame;frame microseconds" line per stack with
+        at least one microsecond of own time, sorted by stack.
+    """
+    entries = stats.stats
+    callees: dict = defaultdict(dict)
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller][function] = edge
+    stacks: dict = defaultdict(float)
+
+    def visit(function: tuple, path: tuple, own: float, total: float) -> None:
+        path = path + (function,)
+        stacks[path] += own
+        cumulative = entries[function][3]
+        share = total / cumulative if cumulative > 0 else 0.0
+        for callee, (_, _, callee_own, callee_total) in callees[function].items():
+            if callee not in path and callee_total * share >= 1e-6:
+                visit(callee, path, callee_own * share, callee_total * share)
+
+    for function, (_, _, own, total, callers) in entries.items():
+        if not callers:
+            visit(function, (), own, total)
+    lines = []
+    for path, seconds in stacks.items():
+        microseconds = round(seconds * 1e6)
+        if microseconds > 0:
+            lines.append(f"{';'.join(map(frame_label, path))} {microseconds}")
+    return sorted(lines)
@@ -0,0 +1,104 @@
+"""
+This module renders the result of a single grading.
+
+It only imports rich when a result is printed for people, so the
+launcher can write the machine-readable formats without it.
+
+Main Functions:
+    - enableLogging: Enable logging based on the verbosity level.
+    - print_feedback: Print the request for feedback.
+    - print_grade_result: Print the feedback and the result of the grading.
+    - write_grade_result: Write the result of a grading for scripts.
+"""
+import logging
+import sys
+
+from ..config.enums import OutputFormat
+
+# Exit codes of the machine-readable output formats, by grading result
+EXIT_CODES: dict = {"correct": 0, "incorrect": 1, "invalid": 3}
+
+
+def enableLogging(verbose: bool, quiet: bool = False) -> None:
+    """
+    Enable logging based on the verbosity level.
+
+    Args:
+        verbose (bool): A flag to indicate whether to enable verbose output.
+        quiet (bool): A flag to skip the announcement of verbose mode.
+
+    Returns:
+        None
+    """
+    lvl: int = logging.INFO
+    fmt: str = "[%(levelname)s] %(message)s"
+    if verbose:
+        if not quiet:
+            from rich import print
+
+            print("[green]Verbose mode is enabled.[/green]")
+        lvl = logging.DEBUG
+    logging.basicConfig(level=lvl, format=fmt)
+
+
+def print_feedback(feedback_url: str) -> None:
+    """
+    Print the request for feedback.
+
+    Args:
+        feedback_url (str): The URL of the feedback form.
+
+    Returns:
+        None
+    """
+    from rich import print
+
+    print(
+        f"\n[green bold]We would like your feedback! Please visit {feedback_url} to provide feedback.[/green bold]"
+    )
+
+
+def print_grade_result(result: object) -> None:
+    """
+    Print the feedback and the result of the grading.
+
+    Input errors are printed in red, other feedback as plain text.
+
+    Args:
+        result (GradeResult): The result of the grading.
+
+    Returns:
+        None
+    """
+    from rich import print as print_markup
+
+    from ..config.enums import Answer
+
+    message = result.message()
+    if message is not None:
+        if result.answer is Answer.INVALID:
+            print_markup(f"[bold red]{message}[/bold red]")
+        else:
+            print(f"\n{message}")
+    print_markup(f"\nGrade Result: [yellow bold]{result.answer.value}[/yellow bold]")
+
+
+def write_grade_result(result: object, output: str) -> int:
+    """
+    Write the result of the grading as a single line for scripts.
+
+    Args:
+        result (GradeResult): The result of the grading.
+        output (str): The output format: json, plain or exit-code.
+
+    Returns:
+        int: The exit code of the grading result.
+    """
+    if output == OutputFormat.JSON.value:
+        import json
+
+        line = json.dumps({"result": result.answer.value, "message": result.message()})
+        sys.stdout.write(line + "\n")
+    elif output == OutputFormat.PLAIN.value:
+        sys.stdout.write(result.answer.value + "\n")
+    return EXIT_CODES[result.answer.value]
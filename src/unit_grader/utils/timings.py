@@ -0,0 +1,314 @@
+"""
+This module contains opt-in timers recording the latency of each grading
+stage.
+
+Timings are disabled by default and cost nothing then: the functions of
+the hot grading path are only wrapped in timers while timings are enabled.
+Modules declare which of their functions make up a stage with register,
+and coarser stages, like rendering the output, are timed with the stage
+context manager, which is a shared no-op while timings are disabled.
+
+    TIMINGS.enable()
+    with TIMINGS.stage("render"):
+        print_grade_result(result)
+    TIMINGS.report()  # {"render": {"count": 1, "total_ms": ...}, ...}
+
+Each stage counts its calls and keeps a histogram of their latency in
+power-of-two microsecond buckets. Nested stages are timed separately, so
+the time of an outer stage includes the time of the stages it calls.
+
+Main Classes:
+    - StageStats: The call count and latency histogram of a stage.
+    - Timings: Record the latency of grading stages.
+
+Main Functions:
+    - dump_at_exit: Enable timings and write the report when Python exits.
+"""
+import atexit
+import functools
+import json
+import threading
+import time
+from typing import Callable, TextIO
+
+
+class StageStats:
+    """
+    This class contains the call count and latency histogram of a stage.
+
+    Bucket i of the histogram counts the calls that took less than 2**i
+    microseconds (and at least 2**(i-1) for i > 0).
+    """
+
+    __slots__ = ("count", "total", "maximum", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.buckets: list = []
+
+    def add(self, seconds: float) -> None:
+        """
+        Record one call.
+
+        Args:
+            seconds (float): The latency of the call.
+
+        Returns:
+            None
+        """
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+        bucket = int(seconds * 1e6).bit_length()
+        if bucket >= len(self.buckets):
+            self.buckets.extend([0] * (bucket + 1 - len(self.buckets)))
+        self.buckets[bucket] += 1
+
+    def to_dict(self) -> dict:
+        """
+        Summarize the stage.
+
+        Returns:
+            dict: The count, the total and maximum latency in milliseconds,
+            the mean latency in microseconds, and the non-empty histogram
+            buckets keyed by their upper bound ("<8us").
+        """
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1e3, 3),
+            "mean_us": round(self.total * 1e6 / max(self.count, 1), 3),
+            "max_us": round(self.maximum * 1e6, 3),
+            "histogram": {
+                f"<{2**bucket}us": calls
+                for bucket, calls in enumerate(self.buckets)
+                if calls
+            },
+        }
+
+
+class _NoTimer:
+    """
+    A context manager doing nothing, used while timings are disabled.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+class _StageTimer:
+    """
+    A context manager recording the latency of one call of a stage.
+    """
+
+    __slots__ = ("_timings", "_name", "_start")
+
+    def __init__(self, timings: "Timings", name: str) -> None:
+        self._timings = timings
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self._timings.record(self._name, time.perf_counter() - self._start)
+
+
+_NO_TIMER = _NoTimer()
+
+
+class Timings:
+    """
+    This class records the latency of grading stages.
+
+    Attributes:
+        enabled (bool): Whether stages are timed.
+        stages (dict): The StageStats of each stage, by name.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stages: dict = {}
+        self._registered: list = []
+        self._originals: list = []
+        self._lock = threading.Lock()
+
+    def register(self, namespace: dict, functions: dict) -> None:
+        """
+        Declare functions to time while timings are enabled.
+
+        The functions are looked up by name in the namespace, e.g. the
+        globals() of a module, and replaced there by timed wrappers, so
+        every caller resolving them through that namespace is timed.
+
+        Args:
+            namespace (dict): The namespace holding the functions.
+            functions (dict): The stage name of each function name.
+
+        Returns:
+            None
+        """
+        self._registered.append((namespace, functions))
+        if self.enabled:
+            self._wrap(namespace, functions)
+
+    def enable(self) -> None:
+        """
+        Start timing every registered function and stage.
+
+        Returns:
+            None
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        for namespace, functions in self._registered:
+            self._wrap(namespace, functions)
+
+    def disable(self) -> None:
+        """
+        Stop timing and restore the registered functions.
+
+        Returns:
+            None
+        """
+        self.enabled = False
+        for namespace, name, original in reversed(self._originals):
+            namespace[name] = original
+        self._originals.clear()
+
+    def reset(self) -> None:
+        """
+        Forget every recorded call.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.stages.clear()
+
+    def stage(self, name: str):
+        """
+        Time a block of code as one call of a stage.
+
+        Args:
+            name (str): The name of the stage.
+
+        Returns:
+            A context manager timing the block, or doing nothing while
+            timings are disabled.
+        """
+        if not self.enabled:
+            return _NO_TIMER
+        return _StageTimer(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Record one call of a stage.
+
+        Args:
+            name (str): The name of the stage.
+            seconds (float): The latency of the call.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            stats.add(seconds)
+
+    def report(self) -> dict:
+        """
+        Summarize every stage.
+
+        Returns:
+            dict: The summary of each stage, see StageStats.to_dict, sorted
+            by name.
+        """
+        with self._lock:
+            return {name: self.stages[name].to_dict() for name in sorted(self.stages)}
+
+    def dump(self, sink: TextIO) -> None:
+        """
+        Write the report as a JSON line.
+
+        Args:
+            sink (TextIO): The stream to write the report to.
+
+        Returns:
+            None
+        """
+        sink.write(json.dumps({"timings": self.report()}) + "\n")
+        sink.flush()
+
+    def _wrap(self, namespace: dict, functions: dict) -> None:
+        """
+        Replace functions of a namespace by timed wrappers.
+
+        Args:
+            namespace (dict): The namespace holding the functions.
+            functions (dict): The stage name of each function name.
+
+        Returns:
+            None
+        """
+        for name, stage in functions.items():
+            original = namespace[name]
+            self._originals.append((namespace, name, original))
+            namespace[name] = self._timed(original, stage)
+
+    def _timed(self, function: Callable, stage: str) -> Callable:
+        """
+        Wrap a function in a timer.
+
+        Args:
+            function (Callable): The function to time.
+            stage (str): The name of its stage.
+
+        Returns:
+            Callable: The timed function.
+        """
+        record = self.record
+        clock = time.perf_counter
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(stage, clock() - start)
+
+        return timed
+
+
+# The timings shared by every module
+TIMINGS: Timings = Timings()
+
+
+def dump_at_exit(path: str) -> None:
+    """
+    Enable timings and write the report to a file when Python exits.
+
+    Args:
+        path (str): The path of the report.
+
+    Returns:
+        None
+    """
+    TIMINGS.enable()
+
+    def dump() -> None:
+        with open(path, "w", encoding="utf-8") as sink:
+            TIMINGS.dump(sink)
+
+    atexit.register(dump)
@@ -0,0 +1,168 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the args_file_grader.py file
+in the unit_grader/commands directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * parse_invocation
+    * grade_args_file
+
+"""
+import io
+import json
+import logging
+
+import pytest
+
+from unit_grader.commands.args_file_grader import grade_args_file, parse_invocation
+
+ARGS_FILE = (
+    "# submissions of the first quiz\n"
+    "unit-grader -i 100 -f Kelvin -t Celsius -s -173.15\n"
+    "--input-value=32 --from-unit Celsius --to-unit Kelvin -s 305.1 -v\n"
+    "\n"
+    "/usr/local/bin/unit-grader -i dog -f Kelvin -t Celsius -s 1 --output json\n"
+    "-i 100 -f 'Kelvin' -t \"Celsius\" -s -173.15  # quoted\n"
+)
+
+test_cases_parse_invocation = [
+    ("-i 100 -f Kelvin -t Celsius -s -173.15", ("100", "Kelvin", "Celsius", "-173.15")),
+    ("unit-grader -s 1 -t cups -f liters -i 2", ("2", "liters", "cups", "1")),
+    (
+        '-i 100 -f Kelvin -t "Degrees Celsius" -s 1',
+        ("100", "Kelvin", "Degrees Celsius", "1"),
+    ),
+    ("", None),
+    ("   \n", None),
+    ("# a comment", None),
+]
+
+
+@pytest.mark.parametrize("line, question", test_cases_parse_invocation)
+def test_parse_invocation(line: str, question: tuple) -> None:
+    """
+    Test the parse_invocation function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the question is parsed with or without the program name,
+    and that blank lines and comments are skipped.
+    """
+    assert parse_invocation(line) == question
+
+
+test_cases_parse_invocation_invalid = [
+    ('-i "100 -f Kelvin', "Invalid command line: No closing quotation."),
+    ("-i 100 -f Kelvin -t Celsius", "Not a single-grade command: -i 100"),
+    ("unit-grader batch file.csv", "Not a single-grade command: unit-grader batch"),
+]
+
+
+@pytest.mark.parametrize("line, message", test_cases_parse_invocation_invalid)
+def test_parse_invocation_invalid(line: str, message: str) -> None:
+    """
+    Test the parse_invocation function with lines that are not single-grade
+    commands.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised.
+    """
+    with pytest.raises(ValueError, match=message):
+        parse_invocation(line)
+
+
+# output, written, exit_code
+test_cases_grade_args_file = [
+    ("plain", "correct\nincorrect\ninvalid\ncorrect\n", 3),
+    ("exit-code", "", 3),
+]
+
+
+@pytest.mark.parametrize("output, written, exit_code", test_cases_grade_args_file)
+def test_grade_args_file(
+    output: str, written: str, exit_code: int, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Test the grade_args_file function with the plain and exit-code outputs.
+
+    Expected Behavior:
+    -------------------
+    Ensure that one line is written per command in line order, whatever
+    the chunk size, and the highest exit code is returned.
+    """
+    for chunk_size in (1, 2, 100):
+        assert grade_args_file(io.StringIO(ARGS_FILE), output, chunk_size) == exit_code
+        assert capsys.readouterr().out == written
+
+
+def test_grade_args_file_json(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test the grade_args_file function with the json output.
+
+    Expected Behavior:
+    -------------------
+    Ensure that each result is written like the single-grade command.
+    """
+    assert grade_args_file(io.StringIO(ARGS_FILE), "json") == 3
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["result"] for line in lines] == [
+        "correct",
+        "incorrect",
+        "invalid",
+        "correct",
+    ]
+    assert lines[1]["message"].startswith("305.1 is not the correct answer.")
+
+
+def test_grade_args_file_rich(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test the grade_args_file function with the rich output.
+
+    Expected Behavior:
+    -------------------
+    Ensure that each grade is printed and the feedback request only once.
+    """
+    assert grade_args_file(io.StringIO(ARGS_FILE)) == 0
+    output = capsys.readouterr().out
+    assert output.count("Grade Result:") == 4
+    assert output.count("We would like your feedback!") == 1
+
+
+# output, written
+test_cases_grade_args_file_invalid_line = [
+    (
+        "json",
+        '{"result": "correct", "message": null}\n'
+        '{"error": "Line 2: Not a single-grade command: -i 1 -f x"}\n',
+    ),
+    ("plain", "correct\nerror\n"),
+    ("exit-code", ""),
+]
+
+
+@pytest.mark.parametrize("output, written", test_cases_grade_args_file_invalid_line)
+def test_grade_args_file_invalid_line(
+    output: str,
+    written: str,
+    capsys: pytest.CaptureFixture,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    Test the grade_args_file function with a line that is not a
+    single-grade command.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the line is logged as an error, keeps its place in the
+    output, and the usage error exit code is returned even when an answer
+    is invalid.
+    """
+    source = io.StringIO(
+        "-i 100 -f Kelvin -t Celsius -s -173.15\n-i 1 -f x\n-i dog -f a -t b -s 1\n"
+    )
+    assert grade_args_file(source, output) == 2
+    assert capsys.readouterr().out.startswith(written)
+    assert caplog.record_tuples == [
+        ("root", logging.ERROR, "Line 2: Not a single-grade command: -i 1 -f x")
+    ]
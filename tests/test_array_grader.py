@@ -0,0 +1,203 @@
+"""
+-------------------------------------------------------------------
+This module contains unit tests for the array_grader.py file
+in the unit_grader/commands directory.
+-------------------------------------------------------------------
+The following functions are tested:
+    * parse_numeric_column
+    * group_units
+    * grade_array
+    * decode_answers
+
+"""
+import numpy as np
+import pytest
+
+from unit_grader.commands.array_grader import (
+    decode_answers,
+    grade_array,
+    group_units,
+    parse_numeric_column,
+)
+from unit_grader.commands.conversion_grader import grade_response
+from unit_grader.config.data import CONVERSION_DATA, UNIT_INDEX, UNITS
+from unit_grader.config.enums import Answer, AnswerCode, UnitCategory
+from unit_grader.config.enums import TemperatureUnits as T
+from unit_grader.config.enums import VolumeUnits as V
+from unit_grader.utils.common import convert_units
+
+
+def build_corpus() -> list:
+    """
+    Build submissions covering every unit pair with correct, off-by-a-tenth,
+    boundary and invalid responses, plus invalid questions.
+    """
+    values = ["-50.223", "0", "0.05", "32", "37.777", "100", "1234.5678", "1e6"]
+    rows = []
+    for category, units in UNITS.items():
+        for from_unit in units:
+            for to_unit in units:
+                for value in values:
+                    correct = convert_units(
+                        float(value), from_unit, to_unit, category, CONVERSION_DATA
+                    )
+                    for response in (
+                        str(correct),
+                        str(correct + 0.1),
+                        str(correct + 0.05),
+                        str(correct - 0.049),
+                        "dog",
+                    ):
+                        rows.append((value, from_unit, to_unit, response))
+    rows += [
+        ("dog", T.KELVIN.value, T.CELSIUS.value, "1"),
+        ("100", "Dummy", T.CELSIUS.value, "1"),
+        ("100", T.KELVIN.value, "kelvin", "1"),
+        ("100", T.KELVIN.value, V.GALLONS.value, "1"),
+        (None, None, None, None),
+        ("nan", T.KELVIN.value, T.CELSIUS.value, "nan"),
+        ("inf", T.KELVIN.value, T.RANKINE.value, "inf"),
+        (" 1_000 ", V.CUPS.value, V.LITERS.value, "236.6"),
+    ]
+    return rows
+
+
+def test_grade_array_matches_grade_response(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test the grade_array function against grade_response on the whole corpus.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every row gets the same grade as the scalar path.
+    """
+    corpus = build_corpus()
+    expected = [grade_response(*row) for row in corpus]
+    input_values, from_units, to_units, responses = map(list, zip(*corpus))
+    codes = grade_array(input_values, from_units, to_units, responses)
+    assert codes.dtype == np.int8
+    assert decode_answers(codes) == expected
+    assert set(expected) == set(Answer)
+    capsys.readouterr()
+
+
+def test_grade_array_numeric_columns() -> None:
+    """
+    Test the grade_array function with numeric numpy columns.
+
+    Expected Behavior:
+    -------------------
+    Ensure that numeric arrays are graded without string parsing.
+    """
+    codes = grade_array(
+        np.array([100, 100, 32]),
+        [T.KELVIN.value, V.CUPS.value, T.FAHRENHEIT.value],
+        [T.CELSIUS.value, V.LITERS.value, T.CELSIUS.value],
+        np.array([-173.15, 23.6, 0.0]),
+    )
+    assert codes.tolist() == [
+        AnswerCode.CORRECT,
+        AnswerCode.INCORRECT,
+        AnswerCode.CORRECT,
+    ]
+
+
+def test_grade_array_empty() -> None:
+    """
+    Test the grade_array function with empty columns.
+
+    Expected Behavior:
+    -------------------
+    Ensure that an empty int8 array is returned.
+    """
+    codes = grade_array([], [], [], [])
+    assert codes.dtype == np.int8
+    assert codes.size == 0
+
+
+def test_grade_array_mismatched_lengths() -> None:
+    """
+    Test the grade_array function with columns of different lengths.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        grade_array(["1"], [T.KELVIN.value], [T.CELSIUS.value], [])
+
+
+# conversion data without usable conversion functions
+mock_conversion_data = {
+    UnitCategory.TEMPERATURE.value: {
+        (T.CELSIUS.value, T.KELVIN.value): 1,
+        (T.CELSIUS.value, T.FAHRENHEIT.value): lambda x: x.missing,
+    },
+}
+
+test_cases_grade_array_broken_conversion_data = [
+    (T.CELSIUS.value, T.KELVIN.value),
+    (T.CELSIUS.value, T.FAHRENHEIT.value),
+    (V.CUPS.value, V.LITERS.value),
+]
+
+
+@pytest.mark.parametrize(
+    "from_unit, to_unit",
+    test_cases_grade_array_broken_conversion_data,
+)
+def test_grade_array_broken_conversion_data(from_unit: str, to_unit: str) -> None:
+    """
+    Test the grade_array function when a conversion is missing, not callable
+    or raises.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the rows of that unit pair are invalid.
+    """
+    codes = grade_array(["1"], [from_unit], [to_unit], ["1"], mock_conversion_data)
+    assert codes.tolist() == [AnswerCode.INVALID]
+
+
+def test_parse_numeric_column() -> None:
+    """
+    Test the parse_numeric_column function with valid and invalid strings.
+
+    Expected Behavior:
+    -------------------
+    Ensure that invalid entries are flagged and parsed as NaN.
+    """
+    parsed, valid = parse_numeric_column(["1.5", "dog", None, "-2"])
+    assert valid.tolist() == [True, False, False, True]
+    assert parsed[[0, 3]].tolist() == [1.5, -2.0]
+    assert np.isnan(parsed[[1, 2]]).all()
+
+
+def test_group_units() -> None:
+    """
+    Test the group_units function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that row indexes are grouped by unit pair, in order, and rows
+    with unknown or mismatched units are left out.
+    """
+    kelvin, celsius, rankine = T.KELVIN.value, T.CELSIUS.value, T.RANKINE.value
+    from_units = [kelvin, celsius, kelvin, kelvin, "dog", V.CUPS.value, kelvin]
+    to_units = [celsius, celsius, celsius, rankine, kelvin, kelvin, None]
+    groups = group_units(UNIT_INDEX.encode(from_units), UNIT_INDEX.encode(to_units))
+    assert {pair: rows.tolist() for pair, rows in groups.items()} == {
+        (kelvin, celsius): [0, 2],
+        (kelvin, rankine): [3],
+        (celsius, celsius): [1],
+    }
+
+
+def test_answer_code_answer() -> None:
+    """
+    Test the AnswerCode.answer property.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every code maps to the Answer of the same name.
+    """
+    assert [code.answer for code in AnswerCode] == list(Answer)
@@ -0,0 +1,232 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the async_grader.py file
+in the unit_grader/commands directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * AsyncGrader
+    * resolve
+    * default_grader
+    * grade
+
+"""
+import asyncio
+
+import pytest
+import pytest_mock
+
+from unit_grader.commands.async_grader import (
+    AsyncGrader,
+    default_grader,
+    grade,
+    resolve,
+)
+from unit_grader.commands.conversion_grader import grade as grade_now
+from unit_grader.config.enums import Answer
+
+QUESTIONS = [
+    ("100", "Kelvin", "Celsius", "-173.15"),
+    ("100", "Kelvin", "Celsius", "-173"),
+    ("100", "Kelvin", "Celsius", "-173.15"),
+    ("100", "Kelvin", "Celsius", "dog"),
+    ("100", "cups", "liters", "23.66"),
+    ("100", "Kelvin", "Test", "1"),
+]
+
+
+def test_async_grader_batches_concurrent_requests() -> None:
+    """
+    Test the AsyncGrader class with concurrent requests.
+
+    Expected Behavior:
+    -------------------
+    Ensure that concurrent requests are graded in one batch and each gets
+    the result of the synchronous grade.
+    """
+
+    async def main() -> tuple:
+        grader = AsyncGrader(max_delay=0.01)
+        results = await asyncio.gather(*(grader.grade(*q) for q in QUESTIONS))
+        return grader, results
+
+    grader, results = asyncio.run(main())
+    assert [result.answer for result in results] == [
+        Answer.CORRECT,
+        Answer.INCORRECT,
+        Answer.CORRECT,
+        Answer.INCORRECT,
+        Answer.CORRECT,
+        Answer.INVALID,
+    ]
+    assert [result.message() for result in results] == [
+        grade_now(*question).message() for question in QUESTIONS
+    ]
+    assert (grader.stats.rows, grader.stats.groups) == (6, 3)
+    assert results[0] is not results[2]  # identical requests get their own copy
+
+
+def test_async_grader_max_batch() -> None:
+    """
+    Test the AsyncGrader class with more requests than fit in a batch.
+
+    Expected Behavior:
+    -------------------
+    Ensure that full batches are graded right away and the rest after
+    the delay.
+    """
+
+    async def main() -> tuple:
+        grader = AsyncGrader(max_delay=0.01, max_batch=4)
+        results = await asyncio.gather(*(grader.grade(*q) for q in QUESTIONS))
+        return grader, results
+
+    grader, results = asyncio.run(main())
+    assert len(results) == 6
+    assert (grader.stats.rows, grader.stats.groups) == (6, 1 + 2)
+
+
+def test_async_grader_unhashable_request() -> None:
+    """
+    Test the AsyncGrader class with a request that cannot be batched.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every request of the batch is still graded.
+    """
+
+    async def main() -> list:
+        grader = AsyncGrader()
+        return await asyncio.gather(
+            grader.grade("100", "Kelvin", "Celsius", "-173.15"),
+            grader.grade("100", ["Kelvin"], "Celsius", "-173.15"),
+        )
+
+    results = asyncio.run(main())
+    assert [result.answer for result in results] == [Answer.CORRECT, Answer.INVALID]
+
+
+def test_async_grader_failing_request(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the AsyncGrader class when grading a request raises.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the failing request gets the exception and the other
+    requests of the batch are still graded, instead of waiting forever.
+    """
+    mocker.patch(
+        "unit_grader.commands.async_grader.grade_plan",
+        side_effect=OverflowError("too large"),
+    )
+    mocker.patch(
+        "unit_grader.commands.async_grader.grade_now",
+        side_effect=[OverflowError("too large"), grade_now(*QUESTIONS[0])],
+    )
+
+    async def main() -> list:
+        grader = AsyncGrader()
+        return await asyncio.gather(
+            grader.grade("1e999", "Kelvin", "Celsius", "1"),
+            grader.grade(*QUESTIONS[0]),
+            return_exceptions=True,
+        )
+
+    failed, result = asyncio.run(main())
+    assert isinstance(failed, OverflowError)
+    assert result.answer is Answer.CORRECT
+
+
+def test_async_grader_cancelled_request() -> None:
+    """
+    Test the AsyncGrader class when a request is cancelled before grading.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the cancelled request is skipped and the others are graded.
+    """
+
+    async def main() -> tuple:
+        grader = AsyncGrader(max_delay=0.01)
+        cancelled = asyncio.ensure_future(grader.grade(*QUESTIONS[0]))
+        graded = asyncio.ensure_future(grader.grade(*QUESTIONS[1]))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await graded, cancelled
+
+    result, cancelled = asyncio.run(main())
+    assert result.answer is Answer.INCORRECT
+    assert cancelled.cancelled()
+
+
+def test_async_grader_flush_without_requests() -> None:
+    """
+    Test the flush method without pending requests.
+
+    Expected Behavior:
+    -------------------
+    Ensure that nothing is graded.
+    """
+    grader = AsyncGrader()
+    grader.flush()
+    assert grader.stats.rows == 0
+
+
+# max_delay, max_batch, message
+test_cases_async_grader_invalid = [
+    (-1, 10, "delay must not be negative"),
+    (0.1, 0, "size must be at least 1"),
+]
+
+
+@pytest.mark.parametrize(
+    "max_delay, max_batch, message", test_cases_async_grader_invalid
+)
+def test_async_grader_invalid(max_delay: float, max_batch: int, message: str) -> None:
+    """
+    Test the AsyncGrader class with invalid settings.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised.
+    """
+    with pytest.raises(ValueError, match=message):
+        AsyncGrader(max_delay, max_batch)
+
+
+def test_resolve_done_future() -> None:
+    """
+    Test the resolve function on a future that is already done.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the result of the future is kept.
+    """
+
+    async def main() -> object:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result("first")
+        resolve(future, grade_now(*QUESTIONS[0]))
+        return future.result()
+
+    assert asyncio.run(main()) == "first"
+
+
+def test_grade() -> None:
+    """
+    Test the grade coroutine.
+
+    Expected Behavior:
+    -------------------
+    Ensure that requests are graded by one default grader per event loop.
+    """
+
+    async def main() -> tuple:
+        results = await asyncio.gather(*(grade(*q) for q in QUESTIONS[:2]))
+        return results, default_grader(), default_grader()
+
+    results, first, again = asyncio.run(main())
+    assert [result.answer for result in results] == [Answer.CORRECT, Answer.INCORRECT]
+    assert first is again
+    assert first.stats.rows == 2
+    _, other, _ = asyncio.run(main())
+    assert other is not first
@@ -0,0 +1,246 @@
+"""
+-------------------------------------------------------------------
+This module contains unit tests for the batch_checkpoint.py file
+in the unit_grader/commands directory.
+-------------------------------------------------------------------
+The following functions are tested:
+    * OffsetLines
+    * load_checkpoint
+    * save_checkpoint
+    * grade_file
+    * check_resumable
+
+"""
+import io
+import json
+
+import pytest
+import pytest_mock
+
+from unit_grader.commands import batch_checkpoint
+from unit_grader.commands.batch_checkpoint import (
+    Checkpoint,
+    OffsetLines,
+    check_resumable,
+    grade_file,
+    load_checkpoint,
+    save_checkpoint,
+)
+from unit_grader.commands.batch_grader import grade_stream
+from unit_grader.config.data import REGISTRY
+
+HEADER = "student,input_value,from_unit,to_unit,student_response\n"
+
+
+def submissions(rows: int) -> str:
+    """
+    Build a CSV submission file with a quoted field spanning two lines.
+    """
+    lines = [HEADER, '"ann\nsmith",100,Kelvin,Celsius,-173.15\n']
+    for row in range(rows - 1):
+        lines.append(f"s{row},{row % 7},Celsius,Kelvin,{row % 7 + 273.15 + row % 2}\n")
+    return "".join(lines)
+
+
+@pytest.fixture
+def files(tmp_path) -> tuple:
+    """
+    Write a submission file of 25 rows and the output of an uninterrupted run.
+    """
+    input_path = tmp_path / "submissions.csv"
+    input_path.write_text(submissions(25), encoding="utf-8")
+    sink = io.StringIO()
+    grade_stream(io.StringIO(submissions(25)), sink)
+    return str(input_path), str(tmp_path / "graded.csv"), sink.getvalue()
+
+
+def test_offset_lines() -> None:
+    """
+    Test the OffsetLines class.
+
+    Expected Behavior:
+    -------------------
+    Ensure that lines are decoded and the offset counts their bytes,
+    also after a seek.
+    """
+    lines = OffsetLines(io.BytesIO("é,1\r\nb,2\n".encode()))
+    iterator = iter(lines)
+    assert next(iterator) == "é,1\r\n"
+    assert lines.offset == 6
+    lines.seek(0)
+    assert list(iterator) == ["é,1\r\n", "b,2\n"]
+    assert lines.offset == 10
+
+
+def test_save_and_load_checkpoint(tmp_path) -> None:
+    """
+    Test the save_checkpoint and load_checkpoint functions.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a saved checkpoint is loaded unchanged, replacing the
+    previous one, and that a missing checkpoint loads as None.
+    """
+    path = str(tmp_path / "run.checkpoint")
+    assert load_checkpoint(path) is None
+    save_checkpoint(path, Checkpoint(1, 2, 3, "old"))
+    save_checkpoint(path, Checkpoint(10, 20, 30, "hash"))
+    assert load_checkpoint(path) == Checkpoint(10, 20, 30, "hash")
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["run.checkpoint"]
+
+
+test_cases_load_checkpoint_invalid = ["not json", "[1, 2]", '{"rows": 1}']
+
+
+@pytest.mark.parametrize("content", test_cases_load_checkpoint_invalid)
+def test_load_checkpoint_invalid(content: str, tmp_path) -> None:
+    """
+    Test the load_checkpoint function with a file that is not a checkpoint.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised.
+    """
+    path = tmp_path / "run.checkpoint"
+    path.write_text(content)
+    with pytest.raises(ValueError, match="is not a checkpoint file"):
+        load_checkpoint(str(path))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_grade_file(workers: int, files: tuple, tmp_path) -> None:
+    """
+    Test the grade_file function without interruption.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the output is the one of grade_stream and the final
+    checkpoint points at the end of both files.
+    """
+    input_path, output_path, expected = files
+    checkpoint_path = str(tmp_path / "run.checkpoint")
+    assert grade_file(
+        input_path, output_path, checkpoint_path, workers=workers, chunk_size=4
+    ) == (25, 0)
+    with open(output_path, encoding="utf-8", newline="") as output:
+        assert output.read() == expected
+    assert load_checkpoint(checkpoint_path) == Checkpoint(
+        len(submissions(25).encode()),
+        25,
+        len(expected.encode()),
+        REGISTRY.fingerprint(),
+    )
+    assert grade_file(
+        input_path, output_path, checkpoint_path, resume=True, chunk_size=4
+    ) == (0, 25)
+    with open(output_path, encoding="utf-8", newline="") as output:
+        assert output.read() == expected
+
+
+# interval, checkpoints saved before the interruption
+test_cases_grade_file_resume = [(0, 3), (3600, 0)]
+
+
+@pytest.mark.parametrize("interval, saved", test_cases_grade_file_resume)
+def test_grade_file_resume(
+    interval: float,
+    saved: int,
+    files: tuple,
+    tmp_path,
+    mocker: pytest_mock.MockFixture,
+) -> None:
+    """
+    Test the grade_file function resuming an interrupted run.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the resumed run grades only the rows after the last
+    checkpoint, drops the rows written after it, and ends with the output
+    of an uninterrupted run.
+    """
+    input_path, output_path, expected = files
+    checkpoint_path = str(tmp_path / "run.checkpoint")
+    calls: list = []
+
+    def save_then_crash(path: str, checkpoint: Checkpoint) -> None:
+        calls.append(checkpoint)
+        if len(calls) > saved:
+            raise KeyboardInterrupt
+        save_checkpoint(path, checkpoint)
+
+    mocker.patch.object(batch_checkpoint, "save_checkpoint", save_then_crash)
+    with pytest.raises(KeyboardInterrupt):
+        grade_file(
+            input_path, output_path, checkpoint_path, interval=interval, chunk_size=4
+        )
+    assert len(calls) == saved + 1
+    mocker.stopall()
+    with open(output_path, "a", encoding="utf-8") as output:
+        output.write("s99,1,Celsius,Kelvin,274")  # a row cut short by the crash
+    done = 4 * saved
+    assert grade_file(
+        input_path, output_path, checkpoint_path, resume=True, chunk_size=4
+    ) == (25 - done, done)
+    with open(output_path, encoding="utf-8", newline="") as output:
+        assert output.read() == expected
+
+
+def test_grade_file_unmapped(
+    files: tuple, tmp_path, mocker: pytest_mock.MockFixture
+) -> None:
+    """
+    Test the grade_file function with an input file that cannot be mapped.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the file is read as a stream and graded the same.
+    """
+    input_path, output_path, expected = files
+    mocker.patch.object(batch_checkpoint, "MappedLines", side_effect=OSError)
+    checkpoint_path = str(tmp_path / "run.checkpoint")
+    assert grade_file(input_path, output_path, checkpoint_path) == (25, 0)
+    with open(output_path, encoding="utf-8", newline="") as output:
+        assert output.read() == expected
+
+
+def test_grade_file_missing_columns(tmp_path) -> None:
+    """
+    Test the grade_file function with a file missing a required column.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised and no checkpoint is written.
+    """
+    input_path = tmp_path / "submissions.csv"
+    input_path.write_text("input_value,from_unit,to_unit\n1,Kelvin,Celsius\n")
+    checkpoint_path = tmp_path / "run.checkpoint"
+    with pytest.raises(ValueError, match="student_response"):
+        grade_file(str(input_path), str(tmp_path / "out.csv"), str(checkpoint_path))
+    assert not checkpoint_path.exists()
+
+
+test_cases_check_resumable = [
+    ({"table_hash": "other"}, "conversion table changed"),
+    ({"input_offset": 10**9}, "submissions.csv is shorter"),
+    ({"output_offset": 10**9}, "graded.csv is shorter"),
+    ({"output": "missing.csv"}, "missing.csv of the checkpoint does not exist"),
+]
+
+
+@pytest.mark.parametrize("changes, message", test_cases_check_resumable)
+def test_check_resumable(changes: dict, message: str, files: tuple, tmp_path) -> None:
+    """
+    Test the check_resumable function with checkpoints that do not match.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised.
+    """
+    input_path, output_path, _ = files
+    checkpoint_path = str(tmp_path / "run.checkpoint")
+    grade_file(input_path, output_path, checkpoint_path)
+    fields = json.loads((tmp_path / "run.checkpoint").read_text())
+    output = str(tmp_path / changes.pop("output", "graded.csv"))
+    checkpoint = Checkpoint(**{**fields, **changes})
+    with pytest.raises(ValueError, match=message):
+        check_resumable(checkpoint, REGISTRY.fingerprint(), input_path, output)
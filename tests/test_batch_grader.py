@@ -0,0 +1,518 @@
+"""
+-------------------------------------------------------------------
+This module contains unit tests for the batch_grader.py file
+in the unit_grader/commands directory.
+-------------------------------------------------------------------
+The following functions are tested:
+    * resolve_delimiter
+    * PlanStats
+    * plan_questions
+    * chunk_questions
+    * match_responses
+    * grade_rows
+    * record_grades
+    * grade_plan
+    * grade_questions
+    * grade_results
+    * grade_chunk
+    * grade_rows_parallel
+    * grade_stream
+
+"""
+import io
+
+import pytest
+import pytest_mock
+
+from unit_grader.commands import batch_grader
+from unit_grader.commands.batch_grader import (
+    CSV_DELIMITER,
+    RESULT_COLUMN,
+    TSV_DELIMITER,
+    VECTORIZE_MIN_ROWS,
+    PlanStats,
+    chunk_questions,
+    grade_chunk,
+    grade_plan,
+    grade_questions,
+    grade_results,
+    grade_rows,
+    grade_rows_parallel,
+    grade_stream,
+    match_responses,
+    plan_questions,
+    record_grades,
+    resolve_delimiter,
+)
+from unit_grader.commands.conversion_grader import GradeResult, grade
+from unit_grader.config.data import UNIT_INDEX
+from unit_grader.config.enums import Answer
+
+# Test resolve_delimiter
+test_cases_resolve_delimiter = [
+    ("submissions.csv", None, CSV_DELIMITER),
+    ("submissions.TSV", None, TSV_DELIMITER),
+    ("<stdin>", None, CSV_DELIMITER),
+    ("submissions.csv", ";", ";"),
+    ("submissions.csv", "\\t", TSV_DELIMITER),
+    ("submissions.csv", "tab", TSV_DELIMITER),
+]
+
+
+@pytest.mark.parametrize(
+    "file_name, delimiter, expected",
+    test_cases_resolve_delimiter,
+)
+def test_resolve_delimiter(file_name: str, delimiter: str, expected: str) -> None:
+    """
+    Test the resolve_delimiter function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that an explicit delimiter wins and .tsv files default to tabs.
+    """
+    assert resolve_delimiter(file_name, delimiter) == expected
+
+
+# Test grade_rows
+def test_grade_rows_keeps_passthrough_columns(
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """
+    Test the grade_rows function on correct, incorrect and invalid rows.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every row keeps its columns, gets graded in order,
+    and that feedback messages are written to stderr only.
+    """
+    rows = [
+        {
+            "id": "1",
+            "input_value": "100",
+            "from_unit": "Kelvin",
+            "to_unit": "Celsius",
+            "student_response": "-173.15",
+        },
+        {
+            "id": "2",
+            "input_value": "100",
+            "from_unit": "Kelvin",
+            "to_unit": "Celsius",
+            "student_response": "-173",
+        },
+        {"id": "3", "input_value": "dog"},
+    ]
+    graded = list(grade_rows(rows))
+    assert [row["id"] for row in graded] == ["1", "2", "3"]
+    assert [row[RESULT_COLUMN] for row in graded] == [
+        Answer.CORRECT.value,
+        Answer.INCORRECT.value,
+        Answer.INVALID.value,
+    ]
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "not the correct answer" in captured.err
+
+
+def test_record_grades(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the record_grades function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every row gets its grade, and the feedback of the chunk is
+    written to stderr in a single write, or not at all without feedback.
+    """
+    stderr = mocker.patch.object(batch_grader.sys, "stderr", io.StringIO())
+    write = mocker.spy(stderr, "write")
+    chunk = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+    questions = [
+        ("100", "Kelvin", "Celsius", "-173.15"),
+        ("100", "Kelvin", "Celsius", "1"),
+        ("100", "Kelvn", "Celsius", "1"),
+    ]
+    assert record_grades(chunk, grade_questions(questions)) is chunk
+    assert [row[RESULT_COLUMN] for row in chunk] == ["correct", "incorrect", "invalid"]
+    feedback = [grade(*question).message() for question in questions[1:]]
+    assert stderr.getvalue() == "\n".join(feedback) + "\n"
+    assert write.call_count == 1
+    record_grades([{}], grade_questions(questions[:1]))
+    assert write.call_count == 1
+
+
+# Test grade_stream
+def test_grade_stream_csv() -> None:
+    """
+    Test the grade_stream function with a CSV stream.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the graded rows are written with the result column appended.
+    """
+    source = io.StringIO(
+        "student,input_value,from_unit,to_unit,student_response\n"
+        "ann,100,cups,liters,23.66\n"
+        "bob,100,Kelvin,gallons,1\n"
+    )
+    sink = io.StringIO()
+    count = grade_stream(source, sink)
+    assert count == 2
+    assert sink.getvalue() == (
+        "student,input_value,from_unit,to_unit,student_response,result\n"
+        "ann,100,cups,liters,23.66,correct\n"
+        "bob,100,Kelvin,gallons,1,invalid\n"
+    )
+
+
+def test_grade_stream_tsv_replaces_result_column() -> None:
+    """
+    Test the grade_stream function with a TSV stream that already has results.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the stale result column is replaced instead of duplicated.
+    """
+    source = io.StringIO(
+        "input_value\tfrom_unit\tto_unit\tstudent_response\tresult\n"
+        "100\tKelvin\tCelsius\t-173.15\tincorrect\n"
+    )
+    sink = io.StringIO()
+    count = grade_stream(source, sink, TSV_DELIMITER)
+    assert count == 1
+    assert sink.getvalue() == (
+        "input_value\tfrom_unit\tto_unit\tstudent_response\tresult\n"
+        "100\tKelvin\tCelsius\t-173.15\tcorrect\n"
+    )
+
+
+test_cases_grade_stream_missing_columns = [
+    ("", "input_value, from_unit, to_unit, student_response"),
+    ("input_value,from_unit,to_unit\n1,Kelvin,Celsius\n", "student_response"),
+]
+
+
+@pytest.mark.parametrize(
+    "content, missing",
+    test_cases_grade_stream_missing_columns,
+)
+def test_grade_stream_missing_columns(content: str, missing: str) -> None:
+    """
+    Test the grade_stream function when required columns are missing.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError naming the missing columns is raised.
+    """
+    with pytest.raises(ValueError, match=missing):
+        grade_stream(io.StringIO(content), io.StringIO())
+
+
+# Test parallel grading
+def test_grade_questions() -> None:
+    """
+    Test the grade_questions function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that each question gets its answer and feedback, in order, in a
+    ResultStore.
+    """
+    store = grade_questions(
+        [("100", "Kelvin", "Celsius", "-173.15"), ("100", "Kelvin", "Celsius", "1")]
+    )
+    assert list(store.graded()) == [
+        (Answer.CORRECT.value, None),
+        (
+            Answer.INCORRECT.value,
+            "1.0 is not the correct answer. The correct answer is -173.2.",
+        ),
+    ]
+
+
+# Test planning
+def test_plan_questions() -> None:
+    """
+    Test the plan_questions function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that submissions are grouped by question, on the unit ids, then
+    by response, in order of first use, and that questions naming an
+    unknown unit are grouped apart under the units as read.
+    """
+    questions = [
+        ("100", "Kelvin", "Celsius", "-173.15"),
+        ("1", "cups", "liters", "0.2"),
+        ("100", "Kelvin", "Celsius", "1"),
+        ("100", "Kelvn", "Celsius", "1"),
+        ("100", "Kelvin", "Celsius", "-173.15"),
+        ("100", "Kelvin", None, "1"),
+        ("100", "Kelvn", "Celsius", "2"),
+    ]
+    kelvin, celsius, cups, liters = (
+        UNIT_INDEX.lookup(unit).unit_id
+        for unit in ("Kelvin", "Celsius", "cups", "liters")
+    )
+    assert plan_questions(questions) == (
+        {
+            ("100", kelvin, celsius): {"-173.15": [0, 4], "1": [2]},
+            ("1", cups, liters): {"0.2": [1]},
+        },
+        {
+            ("100", "Kelvn", "Celsius"): {"1": [3], "2": [6]},
+            ("100", "Kelvin", None): {"1": [5]},
+        },
+    )
+
+
+def test_chunk_questions() -> None:
+    """
+    Test the chunk_questions function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that rows are split into chunks with the question tuple of each
+    row, in order.
+    """
+    rows = [
+        {
+            "id": str(number),
+            "input_value": "100",
+            "from_unit": "Kelvin",
+            "to_unit": "Celsius",
+            "student_response": str(number),
+        }
+        for number in range(3)
+    ]
+    chunks = list(chunk_questions(rows, 2))
+    assert [chunk for chunk, _ in chunks] == [rows[:2], rows[2:]]
+    assert [questions for _, questions in chunks] == [
+        [("100", "Kelvin", "Celsius", "0"), ("100", "Kelvin", "Celsius", "1")],
+        [("100", "Kelvin", "Celsius", "2")],
+    ]
+
+
+def test_match_responses() -> None:
+    """
+    Test the match_responses function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that only valid responses rounding to the correct tenths match,
+    with their parsed value.
+    """
+    responses = ["-173.15", "-173.2", "-173.1", "dog", None, "inf", "-173.24"]
+    assert match_responses(responses, -1732) == [
+        -173.15,
+        -173.2,
+        None,
+        None,
+        None,
+        None,
+        -173.24,
+    ]
+
+
+def build_questions() -> list:
+    """
+    Build submissions with large and small groups, repeated responses,
+    and invalid or non-finite questions.
+    """
+    responses = [str(-173.15 + step / 100) for step in range(-30, 30)]
+    responses += ["dog", "", "-173.15", "-173.15", "1e400", "nan", None]
+    questions = [("100", "Kelvin", "Celsius", response) for response in responses]
+    questions += [("1e400", "Kelvin", "Celsius", r) for r in responses]
+    questions += [("100", "Kelvin", "Test", r) for r in responses]
+    questions += [("1", "cups", "liters", "0.2"), ("2", "cups", "liters", "0.5")]
+    return questions
+
+
+def test_grade_questions_matches_grade() -> None:
+    """
+    Test the grade_questions function against grade.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every submission gets the answer and feedback of grade,
+    in order, whether its group is compared in a vectorized pass or not.
+    """
+    questions = build_questions()
+    expected = [
+        (result.answer.value, result.message())
+        for result in (grade(*question, cache=None) for question in questions)
+    ]
+    assert list(grade_questions(questions).graded()) == expected
+
+
+# chunk_size
+test_cases_grade_results = [1, 3, 10_000]
+
+
+@pytest.mark.parametrize("chunk_size", test_cases_grade_results)
+def test_grade_results(chunk_size: int) -> None:
+    """
+    Test the grade_results function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the rows read back like grade_questions, in order, from an
+    iterator of submissions, and the plan stats count every row.
+    """
+    questions = build_questions()
+    stats = PlanStats()
+    store = grade_results(iter(questions), chunk_size, stats)
+    assert list(store.graded()) == list(grade_questions(questions).graded())
+    assert stats.rows == len(questions)
+
+
+def test_grade_plan_matches_grade() -> None:
+    """
+    Test the grade_plan function against grade.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every submission is yielded once, with identical submissions
+    together, and gets the result and rounded values of grade.
+    """
+    questions = build_questions()
+    seen = []
+    for positions, result in grade_plan(questions):
+        seen += positions
+        for position in positions:
+            expected = grade(*questions[position], cache=None)
+            fields = [name for name in GradeResult.__slots__ if name != "detail"]
+            assert repr([getattr(result, name) for name in fields]) == repr(
+                [getattr(expected, name) for name in fields]
+            )  # NaN values compare by repr
+            assert result.message() == expected.message()
+    assert sorted(seen) == list(range(len(questions)))
+
+
+def test_grade_questions_stats() -> None:
+    """
+    Test the grade_questions function with plan stats.
+
+    Expected Behavior:
+    -------------------
+    Ensure that rows, groups, distinct responses and vectorized responses
+    are counted, and that only large groups of valid questions are
+    vectorized.
+    """
+    questions = build_questions()
+    stats = PlanStats()
+    grade_questions(questions, stats)
+    grade_questions(questions[:2], stats)
+    distinct = len({question[3] for question in questions[:67]})
+    assert distinct >= VECTORIZE_MIN_ROWS
+    assert (stats.rows, stats.groups, stats.responses, stats.vectorized) == (
+        len(questions) + 2,
+        5 + 1,
+        3 * distinct + 2 + 2,
+        distinct,
+    )
+    assert stats.reuse_ratio == pytest.approx((len(questions) + 2) / 6)
+    assert repr(stats).startswith("PlanStats(rows=205, groups=6, ")
+
+
+def test_plan_stats_empty() -> None:
+    """
+    Test the PlanStats class without rows.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the reuse ratio of an empty plan is 0.
+    """
+    assert PlanStats().reuse_ratio == 0.0
+
+
+def test_grade_chunk() -> None:
+    """
+    Test the grade_chunk function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the chunk is graded and its plan stats returned.
+    """
+    store, stats = grade_chunk([("100", "Kelvin", "Celsius", "-173.15")] * 3)
+    assert list(store.graded()) == [(Answer.CORRECT.value, None)] * 3
+    assert (stats.rows, stats.groups, stats.responses) == (3, 1, 1)
+
+
+def test_grade_stream_stats() -> None:
+    """
+    Test the grade_stream function with plan stats, in chunks.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the stats of every chunk are added up, with or without
+    worker processes.
+    """
+    content = "input_value,from_unit,to_unit,student_response\n" + (
+        "100,cups,liters,23.66\n100,Kelvin,gallons,1\n100,liters,cups,dog\n" * 5
+    )
+    for workers in (1, 2):
+        stats = PlanStats()
+        grade_stream(
+            io.StringIO(content),
+            io.StringIO(),
+            workers=workers,
+            chunk_size=6,
+            stats=stats,
+        )
+        assert (stats.rows, stats.groups, stats.responses) == (15, 9, 9)
+
+
+def test_grade_rows_parallel_keeps_order(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test the grade_rows_parallel function on more chunks than workers.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the rows are graded like grade_rows and yielded in input order.
+    """
+    responses = ["-173.15", "-173", "dog", "-173.2", "x"] * 7
+    rows = [
+        {
+            "id": str(i),
+            "input_value": "100",
+            "from_unit": "Kelvin",
+            "to_unit": "Celsius",
+            "student_response": response,
+        }
+        for i, response in enumerate(responses)
+    ]
+    expected = list(grade_rows([dict(row) for row in rows]))
+    serial_feedback = capsys.readouterr().err
+    graded = list(grade_rows_parallel(rows, workers=2, chunk_size=3))
+    assert graded == expected
+    assert capsys.readouterr().err == serial_feedback
+
+
+def test_grade_stream_workers() -> None:
+    """
+    Test the grade_stream function with worker processes.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the output is identical to grading in a single process.
+    """
+    content = "input_value,from_unit,to_unit,student_response\n" + (
+        "100,cups,liters,23.66\n100,Kelvin,gallons,1\n100,liters,cups,dog\n" * 5
+    )
+    serial, parallel = io.StringIO(), io.StringIO()
+    assert grade_stream(io.StringIO(content), serial) == 15
+    count = grade_stream(io.StringIO(content), parallel, workers=2, chunk_size=4)
+    assert count == 15
+    assert parallel.getvalue() == serial.getvalue()
+
+
+def test_grade_rows_parallel_empty() -> None:
+    """
+    Test the grade_rows_parallel function without rows.
+
+    Expected Behavior:
+    -------------------
+    Ensure that nothing is yielded.
+    """
+    assert list(grade_rows_parallel([], workers=2)) == []
@@ -0,0 +1,166 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the bench.py file
+in the unit_grader/commands directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * micro_benchmarks
+    * generate_submissions
+    * batch_benchmark
+    * run_benchmarks
+    * load_results
+    * compare_results
+
+"""
+import csv
+import io
+
+import pytest
+import pytest_mock
+
+from unit_grader.commands.bench import (
+    Regression,
+    batch_benchmark,
+    compare_results,
+    generate_submissions,
+    load_results,
+    micro_benchmarks,
+    run_benchmarks,
+)
+from unit_grader.commands.conversion_grader import grade
+from unit_grader.config.data import CONVERSION_DATA
+
+
+def test_micro_benchmarks_cover_every_pair() -> None:
+    """
+    Test the micro_benchmarks function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every conversion pair is benchmarked and every benchmark runs.
+    """
+    benchmarks = dict(micro_benchmarks())
+    for conversions in CONVERSION_DATA.values():
+        for from_unit, to_unit in conversions:
+            assert f"convert/{from_unit}->{to_unit}" in benchmarks
+    assert benchmarks["convert/Kelvin->Celsius"]() == -173.2
+    for func in benchmarks.values():
+        func()
+
+
+def test_generate_submissions() -> None:
+    """
+    Test the generate_submissions function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the file is reproducible and mixes correct responses
+    with other ones.
+    """
+    lines = list(generate_submissions(200, seed=3))
+    assert lines == list(generate_submissions(200, seed=3))
+    rows = list(csv.DictReader(lines))
+    assert len(rows) == 200
+    answers = {
+        grade(
+            row["input_value"],
+            row["from_unit"],
+            row["to_unit"],
+            row["student_response"],
+        ).answer
+        for row in rows
+    }
+    assert len(answers) == 2
+
+
+def test_run_benchmarks() -> None:
+    """
+    Test the run_benchmarks function with small settings.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every group reports a positive time per operation.
+    """
+    names = []
+    results = run_benchmarks(
+        batch_rows=(50,), number=2, repeat=1, progress=names.append
+    )
+    assert list(results["results"]) == names
+    assert "batch/50-rows" in names
+    assert "startup/single-grade" in names
+    assert all(seconds > 0 for seconds in results["results"].values())
+    assert {"version", "python", "platform"} <= set(results)
+
+
+def test_batch_benchmark_repeat(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the batch_benchmark function with repeats.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the file is graded once per repeat, each time with an
+    empty answer cache, and the best time per row is returned.
+    """
+    grade_stream = mocker.patch("unit_grader.commands.bench.grade_stream")
+    cache = mocker.patch("unit_grader.commands.bench.ANSWER_CACHE")
+    clock = mocker.patch("unit_grader.commands.bench.time")
+    clock.perf_counter.side_effect = [0.0, 3.0, 10.0, 12.0, 20.0, 24.0]
+    assert batch_benchmark(100, repeat=3) == pytest.approx(0.02)
+    assert grade_stream.call_count == cache.clear.call_count == 3
+
+
+def test_run_benchmarks_unknown_suite() -> None:
+    """
+    Test the run_benchmarks function with an unknown group.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised.
+    """
+    with pytest.raises(ValueError, match="macro"):
+        run_benchmarks(("micro", "macro"))
+
+
+test_cases_load_results_invalid = [
+    ("not json", "not valid JSON"),
+    ("[]", "no results object"),
+    ('{"results": 1}', "no results object"),
+    ('{"results": {"a": 0}}', "a must take a positive number of seconds, got 0"),
+    ('{"results": {"a": -1.5}}', "got -1.5"),
+    ('{"results": {"a": "fast"}}', "got 'fast'"),
+    ('{"results": {"a": true}}', "got True"),
+]
+
+
+@pytest.mark.parametrize("content, message", test_cases_load_results_invalid)
+def test_load_results_invalid(content: str, message: str) -> None:
+    """
+    Test the load_results function with files that are not results.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised.
+    """
+    with pytest.raises(ValueError, match=message):
+        load_results(io.StringIO(content))
+
+
+def test_compare_results() -> None:
+    """
+    Test the compare_results function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that only benchmarks slower than the threshold are reported,
+    largest slowdown first.
+    """
+    baseline = load_results(
+        io.StringIO('{"results": {"a": 1.0, "b": 1.0, "c": 1.0, "gone": 1.0}}')
+    )
+    current = {"results": {"a": 1.05, "b": 1.5, "c": 1.2, "new": 9.0}}
+    regressions = compare_results(current, baseline, threshold=0.1)
+    assert regressions == [Regression("b", 1.0, 1.5), Regression("c", 1.0, 1.2)]
+    assert regressions[0].slowdown == pytest.approx(0.5)
+    assert compare_results(current, baseline, threshold=1.0) == []
+    zero = {"results": {"a": 0.0, "b": None}}
+    assert compare_results(current, zero) == []  # not a baseline, skipped
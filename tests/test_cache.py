@@ -0,0 +1,127 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the cache.py file
+in the unit_grader/utils directory.
+-----------------------------------------------------------------
+The following classes are tested:
+    * LRUCache
+
+"""
+import threading
+
+import pytest
+
+from unit_grader.utils.cache import CacheStats, LRUCache
+
+
+def test_lru_cache_hits_and_misses() -> None:
+    """
+    Test the LRUCache.get method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that values are computed once per key and counted.
+    """
+    cache = LRUCache(4)
+    calls = []
+    for key in ["a", "b", "a", "a"]:
+        assert cache.get(key, lambda: calls.append(key) or key.upper()) == key.upper()
+    assert calls == ["a", "b"]
+    assert cache.stats() == CacheStats(hits=2, misses=2, evictions=0, size=2, maxsize=4)
+    assert len(cache) == 2
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """
+    Test the LRUCache eviction.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the least recently used key is evicted when the cache is full.
+    """
+    cache = LRUCache(2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)  # b is now the least recently used
+    cache.get("c", lambda: 3)
+    assert cache.get("a", lambda: -1) == 1
+    assert cache.get("b", lambda: -2) == -2
+    assert cache.stats() == CacheStats(hits=2, misses=4, evictions=2, size=2, maxsize=2)
+
+
+def test_lru_cache_unhashable_key() -> None:
+    """
+    Test the LRUCache with an unhashable key.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the value is computed without being stored or counted.
+    """
+    cache = LRUCache(2)
+    assert cache.get((["a"],), lambda: 1) == 1
+    assert cache.stats() == CacheStats(0, 0, 0, 0, 2)
+
+
+def test_lru_cache_clear() -> None:
+    """
+    Test the LRUCache.clear method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the entries and the counters are reset.
+    """
+    cache = LRUCache(1)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.clear()
+    assert cache.stats() == CacheStats(0, 0, 0, 0, 1)
+
+
+def test_lru_cache_threads() -> None:
+    """
+    Test the LRUCache shared by threads.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the counters add up and the size stays bounded.
+    """
+    cache = LRUCache(8)
+
+    def work() -> None:
+        for i in range(2000):
+            cache.get(i % 16, lambda: i % 16)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 8000
+    assert stats.size <= 8
+    assert stats.misses - stats.evictions >= stats.size
+
+
+def test_lru_cache_key_stored_during_compute() -> None:
+    """
+    Test the LRUCache when the key is stored while its value is computed.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the stored value is kept and the entry is not duplicated.
+    """
+    cache = LRUCache(2)
+    assert cache.get("a", lambda: cache.get("a", lambda: 1) + 1) == 1
+    assert cache.stats() == CacheStats(0, 2, 0, 1, 2)
+
+
+def test_lru_cache_invalid_size() -> None:
+    """
+    Test the LRUCache with a size less than one.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised.
+    """
+    with pytest.raises(ValueError, match="at least 1"):
+        LRUCache(0)
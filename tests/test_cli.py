@@ -4,10 +4,19 @@
     ------------------------------------------------
     The following functions are tested:
         * grade_conversion
+        * batch
+        * serve
+        * stream
+        * bench
         * version_callback
         * enable_verbose
 
 """
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 import pytest_mock
 from typer import Exit
@@ -21,6 +30,7 @@ from unit_grader.cli import (
     app_name,
 )
 from unit_grader.config.enums import Answer
+from unit_grader.utils.timings import TIMINGS
 import logging
 
 LOGGER = logging.getLogger(__name__)
@@ -197,3 +207,664 @@ def test_handle_feedback_valid_feedback_url(
         "We would like your feedback! Please visit www.google.com to provide feedback."
         in output
     )
+
+
+# input_value, output, exit_code
+test_cases_grade_conversion_output = [
+    ("32", "json", 0),
+    ("31", "plain", 1),
+    ("dog", "exit-code", 3),
+]
+
+
+@pytest.mark.parametrize(
+    "input_value, output, exit_code", test_cases_grade_conversion_output
+)
+def test_grade_conversion_output(input_value: str, output: str, exit_code: int) -> None:
+    """
+    Test the grade_conversion CLI command with a machine-readable output format.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a single line (none for exit-code) is written without the
+    feedback request, and the exit code tells the answers apart.
+    """
+    result = runner.invoke(
+        app,
+        ["-i", input_value, "-f", "Celsius", "-t", "Kelvin", "-s", "305.2"]
+        + ["--output", output, "-v"],
+    )
+    assert result.exit_code == exit_code
+    assert "Verbose mode is enabled." not in result.output
+    assert "feedback" not in result.output
+    if output == "json":
+        assert json.loads(result.output) == {"result": "correct", "message": None}
+    elif output == "plain":
+        assert result.output == "incorrect\n"
+    else:
+        assert result.output == ""
+
+
+def test_grade_conversion_args_file(tmp_path) -> None:
+    """
+    Test the grade_conversion CLI command with an argument file.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every line is graded in order with the exit code of the
+    results.
+    """
+    args_file = tmp_path / "args.txt"
+    args_file.write_text(
+        "unit-grader -i 32 -f Celsius -t Kelvin -s 305.2\n"
+        "unit-grader -i dog -f Celsius -t Kelvin -s 305.2\n"
+    )
+    result = runner.invoke(
+        app, ["--from-args-file", str(args_file), "--output", "plain", "-v"]
+    )
+    assert result.exit_code == 3
+    assert result.output == "correct\ninvalid\n"
+
+
+def test_grade_conversion_args_file_with_options(tmp_path) -> None:
+    """
+    Test the grade_conversion CLI command with an argument file and grading
+    options.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the command fails with a usage error.
+    """
+    args_file = tmp_path / "args.txt"
+    args_file.write_text("")
+    result = runner.invoke(app, ["--from-args-file", str(args_file), "-i", "32"])
+    assert result.exit_code == 2
+    assert "'--from-args-file'" in result.output
+
+
+@pytest.mark.parametrize("output", ["rich", "plain"])
+def test_grade_conversion_timings(output: str) -> None:
+    """
+    Test the grade_conversion CLI command with --timings.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the timings of the grading stages are written as JSON
+    when the command ends.
+    """
+    try:
+        result = runner.invoke(
+            app,
+            ["--timings", "-i", "32", "-f", "Celsius", "-t", "Kelvin", "-s", "305.2"]
+            + ["--output", output],
+        )
+    finally:
+        TIMINGS.disable()
+        TIMINGS.reset()
+    assert result.exit_code == 0
+    report = json.loads(result.output.strip().splitlines()[-1])["timings"]
+    assert {"grade", "render", "parse", "round"} <= report.keys()
+
+
+def test_grade_conversion_profile(tmp_path) -> None:
+    """
+    Test the grade_conversion CLI command with --profile.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the profile reports are written to the directory when the
+    command ends and listed on stderr.
+    """
+    directory = tmp_path / "profile"
+    result = runner.invoke(
+        app,
+        ["--profile", str(directory), "-i", "32", "-f", "Celsius", "-t", "Kelvin"]
+        + ["-s", "305.2", "--output", "plain"],
+    )
+    assert result.exit_code == 0
+    assert sorted(os.listdir(directory)) == [
+        "allocations.txt",
+        "profile.collapsed",
+        "profile.pstats",
+    ]
+    assert f"Wrote {directory / 'profile.pstats'}" in result.output
+
+
+def test_grade_conversion_profile_file(tmp_path) -> None:
+    """
+    Test the grade_conversion CLI command with --profile naming a file.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the command fails with a usage error.
+    """
+    path = tmp_path / "profile"
+    path.write_text("")
+    result = runner.invoke(
+        app, ["--profile", str(path), "-i", "32", "-f", "Celsius", "-t", "Kelvin"]
+    )
+    assert result.exit_code == 2
+    assert "'--profile'" in result.output
+
+
+def test_grade_conversion_missing_option() -> None:
+    """
+    Test the grade_conversion CLI command when a required option is missing.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the command fails with a usage error naming the option.
+    """
+    result = runner.invoke(
+        app,
+        ["--input-value", "32", "--from-unit", "Celsius", "--to-unit", "Kelvin"],
+    )
+    assert result.exit_code == 2
+    assert "Missing option '--student-response'" in result.output
+
+
+def test_batch(tmp_path, caplog: pytest.LogCaptureFixture) -> None:
+    """
+    Test the batch CLI command with a TSV file.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every row is graded and written to the output file, and
+    that the plan stats are logged in verbose mode.
+    """
+    caplog.set_level(logging.DEBUG)
+    input_file = tmp_path / "submissions.tsv"
+    input_file.write_text(
+        "id\tinput_value\tfrom_unit\tto_unit\tstudent_response\n"
+        "1\t100\tKelvin\tCelsius\t-173.15\n"
+        "2\t100\tKelvin\tCelsius\tdog\n"
+    )
+    output_file = tmp_path / "graded.tsv"
+    result = runner.invoke(
+        app, ["batch", str(input_file), "--output-file", str(output_file), "-v"]
+    )
+    assert result.exit_code == 0
+    assert output_file.read_text() == (
+        "id\tinput_value\tfrom_unit\tto_unit\tstudent_response\tresult\n"
+        "1\t100\tKelvin\tCelsius\t-173.15\tcorrect\n"
+        "2\t100\tKelvin\tCelsius\tdog\tincorrect\n"
+    )
+    assert "plan: PlanStats(rows=2, groups=1, responses=2," in caplog.text
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["batch", "--timings"],
+        ["--timings", "batch"],
+        ["--timings", "batch", "--timings"],
+    ],
+)
+def test_batch_timings(tmp_path, options: list) -> None:
+    """
+    Test the batch CLI command with --timings.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the option is accepted before and after the command name,
+    and that the timings are written once when the command ends.
+    """
+    input_file = tmp_path / "submissions.csv"
+    input_file.write_text(
+        "input_value,from_unit,to_unit,student_response\n100,Kelvin,Celsius,1\n"
+    )
+    output_file = tmp_path / "graded.csv"
+    try:
+        result = runner.invoke(app, options + [str(input_file), "-o", str(output_file)])
+    finally:
+        TIMINGS.disable()
+        TIMINGS.reset()
+    assert result.exit_code == 0
+    reports = [line for line in result.output.splitlines() if '"timings"' in line]
+    assert len(reports) == 1
+    assert {"plan", "record"} <= json.loads(reports[0])["timings"].keys()
+
+
+@pytest.mark.parametrize("command", [["table"], ["stream"]])
+def test_command_profile(tmp_path, command: list) -> None:
+    """
+    Test the --profile option after the name of a command.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the profile reports are written when the command ends, and
+    that a file is rejected.
+    """
+    directory = tmp_path / "profile"
+    result = runner.invoke(app, command + ["--profile", str(directory)], input="")
+    assert result.exit_code == 0
+    assert "profile.pstats" in os.listdir(directory)
+    assert f"Wrote {directory / 'profile.pstats'}" in result.output
+    path = tmp_path / "file"
+    path.write_text("")
+    result = runner.invoke(app, command + ["--profile", str(path)], input="")
+    assert result.exit_code == 2
+    assert "'--profile'" in result.output
+
+
+def test_batch_checkpoint(tmp_path, caplog: pytest.LogCaptureFixture) -> None:
+    """
+    Test the batch CLI command with a checkpoint and --resume.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the checkpoint is written, and that a resumed run of a
+    finished job grades no row and keeps the output.
+    """
+    caplog.set_level(logging.INFO)
+    input_file = tmp_path / "submissions.csv"
+    input_file.write_text(
+        "input_value,from_unit,to_unit,student_response\n100,Kelvin,Celsius,-173.15\n"
+    )
+    output_file = tmp_path / "graded.csv"
+    checkpoint_file = tmp_path / "run.checkpoint"
+    args = ["batch", str(input_file), "-o", str(output_file)]
+    args += ["--checkpoint", str(checkpoint_file)]
+    result = runner.invoke(app, args + ["-w", "2"])
+    assert result.exit_code == 0
+    assert json.loads(checkpoint_file.read_text())["rows"] == 1
+    graded = output_file.read_text()
+    assert graded.endswith("-173.15,correct\n")
+    result = runner.invoke(app, args + ["--resume"])
+    assert result.exit_code == 0
+    assert output_file.read_text() == graded
+    assert "Resumed after 1 rows graded before." in caplog.text
+
+
+# args, hint
+test_cases_batch_checkpoint_invalid = [
+    (["--resume"], "'--resume'"),
+    (["--checkpoint", "{checkpoint}"], "'--checkpoint'"),
+    (["-o", "{output}", "--checkpoint", "{checkpoint}", "--resume"], "INPUT_FILE"),
+]
+
+
+@pytest.mark.parametrize("args, hint", test_cases_batch_checkpoint_invalid)
+def test_batch_checkpoint_invalid(args: list, hint: str, tmp_path) -> None:
+    """
+    Test the batch CLI command with checkpoint options that cannot be used.
+
+    Expected Behavior:
+    -------------------
+    Ensure that --resume needs a checkpoint, a checkpoint needs files, and
+    a checkpoint of another conversion table is refused.
+    """
+    input_file = tmp_path / "submissions.csv"
+    input_file.write_text("input_value,from_unit,to_unit,student_response\n")
+    checkpoint_file = tmp_path / "run.checkpoint"
+    checkpoint_file.write_text(
+        '{"input_offset": 0, "rows": 0, "output_offset": 0, "table_hash": "old"}'
+    )
+    names = {"checkpoint": checkpoint_file, "output": tmp_path / "graded.csv"}
+    args = [arg.format(**names) for arg in args]
+    result = runner.invoke(app, ["batch", str(input_file)] + args)
+    assert result.exit_code == 2
+    assert hint in result.output
+
+
+def test_batch_cache(tmp_path, caplog: pytest.LogCaptureFixture) -> None:
+    """
+    Test the batch CLI command with a result cache.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a file graded again unchanged is copied from the cache
+    with the same output, to a file or to stdout.
+    """
+    caplog.set_level(logging.INFO)
+    input_file = tmp_path / "submissions.csv"
+    input_file.write_text(
+        "input_value,from_unit,to_unit,student_response\n100,Kelvin,Celsius,-173.15\n"
+    )
+    args = ["batch", str(input_file), "--cache-dir", str(tmp_path / "cache")]
+    first = runner.invoke(app, args + ["-o", str(tmp_path / "first.csv")])
+    assert first.exit_code == 0
+    assert "Graded 1 rows" in caplog.text
+    assert "result cache" not in caplog.text
+    second = runner.invoke(app, args)
+    assert second.exit_code == 0
+    assert "Copied the graded rows from the result cache" in caplog.text
+    assert second.stdout == (tmp_path / "first.csv").read_text()
+    assert second.stdout.endswith("-173.15,correct\n")
+
+
+# args, hint
+test_cases_batch_cache_invalid = [
+    (["{input}", "--checkpoint", "{checkpoint}"], "'--cache-dir'"),
+    ([], "'--cache-dir'"),
+    (["{empty}"], "INPUT_FILE"),
+]
+
+
+@pytest.mark.parametrize("args, hint", test_cases_batch_cache_invalid)
+def test_batch_cache_invalid(args: list, hint: str, tmp_path) -> None:
+    """
+    Test the batch CLI command with a result cache that cannot be used.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the cache needs an input file without checkpoint, and
+    that an invalid file is not cached.
+    """
+    input_file = tmp_path / "submissions.csv"
+    input_file.write_text("input_value\n1\n")
+    empty_file = tmp_path / "empty.csv"
+    empty_file.write_text("")
+    names = {
+        "input": input_file,
+        "empty": empty_file,
+        "checkpoint": tmp_path / "run.checkpoint",
+    }
+    args = [arg.format(**names) for arg in args]
+    cache_dir = tmp_path / "cache"
+    result = runner.invoke(
+        app,
+        ["batch"]
+        + args
+        + ["-o", str(tmp_path / "out.csv")]
+        + ["--cache-dir", str(cache_dir)],
+    )
+    assert result.exit_code == 2
+    assert hint in result.output
+    assert not cache_dir.exists() or os.listdir(cache_dir) == []
+
+
+def test_batch_workers(tmp_path) -> None:
+    """
+    Test the batch CLI command with worker processes.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the rows are graded in input order.
+    """
+    input_file = tmp_path / "submissions.csv"
+    input_file.write_text(
+        "id,input_value,from_unit,to_unit,student_response\n"
+        + "".join(f"{i},100,Kelvin,Celsius,-173.{i}\n" for i in range(10))
+    )
+    output_file = tmp_path / "graded.csv"
+    result = runner.invoke(
+        app, ["batch", str(input_file), "-o", str(output_file), "--workers", "2"]
+    )
+    assert result.exit_code == 0
+    lines = output_file.read_text().splitlines()
+    assert [line.split(",")[0] for line in lines[1:]] == [str(i) for i in range(10)]
+    assert lines[3].endswith(",-173.2,correct")
+
+
+def test_batch_invalid_workers(tmp_path) -> None:
+    """
+    Test the batch CLI command with less than one worker.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the command fails with a usage error.
+    """
+    result = runner.invoke(app, ["batch", "--workers", "0"], input="")
+    assert result.exit_code == 2
+    assert "--workers" in result.output
+
+
+def test_batch_stdin() -> None:
+    """
+    Test the batch CLI command reading submissions from stdin.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the graded rows are written to stdout.
+    """
+    result = runner.invoke(
+        app,
+        ["batch", "--delimiter", ";"],
+        input="input_value;from_unit;to_unit;student_response\n100;cups;liters;23.66\n",
+    )
+    assert result.exit_code == 0
+    assert "100;cups;liters;23.66;correct" in result.output
+
+
+def test_batch_missing_columns(tmp_path) -> None:
+    """
+    Test the batch CLI command when the file misses required columns.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the command fails with a usage error.
+    """
+    input_file = tmp_path / "submissions.csv"
+    input_file.write_text("input_value,from_unit\n1,Kelvin\n")
+    result = runner.invoke(app, ["batch", str(input_file)])
+    assert result.exit_code == 2
+    assert "to_unit, student_response" in result.output
+
+
+def test_stream() -> None:
+    """
+    Test the stream CLI command.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every JSON request on stdin gets a JSON reply on stdout,
+    in order, without the feedback banner.
+    """
+    requests = [
+        {
+            "input_value": "100",
+            "from_unit": "Kelvin",
+            "to_unit": "Celsius",
+            "student_response": "-173.15",
+            "id": 1,
+        },
+        {
+            "input_value": "100",
+            "from_unit": "cups",
+            "to_unit": "liters",
+            "student_response": "1",
+            "id": 2,
+        },
+    ]
+    result = runner.invoke(
+        app,
+        ["stream", "--flush-lines", "1"],
+        input="".join(json.dumps(request) + "\n" for request in requests),
+    )
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {"result": "correct", "id": 1},
+        {"result": "incorrect", "id": 2},
+    ]
+
+
+def test_table_and_regrade(tmp_path, caplog: pytest.LogCaptureFixture) -> None:
+    """
+    Test the table and regrade CLI commands.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the snapshot of the table is written, and that the rows
+    whose conversion changed since an older snapshot are regraded.
+    """
+    caplog.set_level(logging.INFO)
+    snapshot_file = tmp_path / "table.json"
+    result = runner.invoke(app, ["table", "-o", str(snapshot_file)])
+    assert result.exit_code == 0
+    snapshot = json.loads(snapshot_file.read_text())
+    for conversion in snapshot["conversions"]:
+        if conversion[:2] == ["gallons", "cubic-feet"]:
+            conversion[4] = 7.5
+    snapshot_file.write_text(json.dumps(snapshot))
+    results_file = tmp_path / "graded.tsv"
+    results_file.write_text(
+        "input_value\tfrom_unit\tto_unit\tstudent_response\tresult\n"
+        "10\tgallons\tcubic-feet\t1.3\tincorrect\n"
+        "10\tcubic-feet\tgallons\t1.3\tincorrect\n"
+    )
+    output_file = tmp_path / "changes.tsv"
+    result = runner.invoke(
+        app,
+        ["regrade", str(results_file), "--since", str(snapshot_file)]
+        + ["-o", str(output_file), "-v"],
+    )
+    assert result.exit_code == 0
+    assert output_file.read_text() == (
+        "input_value\tfrom_unit\tto_unit\tstudent_response\tprevious_result\tresult\n"
+        "10\tgallons\tcubic-feet\t1.3\tincorrect\tcorrect\n"
+    )
+    assert "Regraded 1 of 2 rows, 1 results changed" in caplog.text
+
+
+# snapshot, results, hint
+test_cases_regrade_invalid = [
+    ("[]", "input_value,from_unit,to_unit,student_response,result\n", "'--since'"),
+    ('{"units": {}, "conversions": []}', "input_value\n", "RESULTS_FILE"),
+]
+
+
+@pytest.mark.parametrize("snapshot, results, hint", test_cases_regrade_invalid)
+def test_regrade_invalid(snapshot: str, results: str, hint: str, tmp_path) -> None:
+    """
+    Test the regrade CLI command with an invalid snapshot or result file.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the command fails with a usage error.
+    """
+    snapshot_file = tmp_path / "table.json"
+    snapshot_file.write_text(snapshot)
+    results_file = tmp_path / "graded.csv"
+    results_file.write_text(results)
+    result = runner.invoke(
+        app,
+        ["regrade", str(results_file), "--since", str(snapshot_file)]
+        + ["-o", str(tmp_path / "changes.csv")],
+    )
+    assert result.exit_code == 2
+    assert hint in result.output
+
+
+def test_serve(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the serve CLI command.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the server is started on the given socket.
+    """
+    mock_serve = mocker.patch("unit_grader.commands.server.serve")
+    result = runner.invoke(app, ["serve", "--socket", "/tmp/grader.sock"])
+    assert result.exit_code == 0
+    assert "Grading server listening on /tmp/grader.sock" in result.output
+    mock_serve.assert_called_once_with("/tmp/grader.sock")
+
+
+def test_serve_socket_path_taken(tmp_path) -> None:
+    """
+    Test the serve CLI command when the socket path is a regular file.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the command fails with a usage error.
+    """
+    socket_path = tmp_path / "grader.sock"
+    socket_path.write_text("")
+    result = runner.invoke(app, ["serve", "--socket", str(socket_path)])
+    assert result.exit_code == 2
+    assert "is not a socket" in result.output
+
+
+def test_cli_does_not_import_server() -> None:
+    """
+    Test the imports of the CLI app.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the socket server is only imported by the serve command,
+    so the other commands work where Unix sockets are missing.
+    """
+    code = (
+        "import sys\n"
+        "import unit_grader.cli\n"
+        "print('unit_grader.commands.server' in sys.modules)\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert completed.stdout == "False\n"
+
+
+def test_bench(tmp_path, mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the bench CLI command against a baseline.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the results are written as JSON and that regressions
+    make the command fail.
+    """
+    mocker.patch(
+        "unit_grader.commands.bench.run_benchmarks",
+        return_value={"results": {"grade/cached": 2.0, "parse/valid": 1.0}},
+    )
+    baseline_file = tmp_path / "baseline.json"
+    baseline_file.write_text('{"results": {"grade/cached": 1.0, "parse/valid": 1.0}}')
+    output_file = tmp_path / "results.json"
+    result = runner.invoke(app, ["bench", "--suite", "micro", "-o", str(output_file)])
+    assert result.exit_code == 0
+    assert json.loads(output_file.read_text())["results"]["grade/cached"] == 2.0
+    result = runner.invoke(
+        app, ["bench", "-o", str(output_file), "--baseline", str(baseline_file)]
+    )
+    assert result.exit_code == 1
+    assert "Regression: grade/cached 1s -> 2s (+100%)" in result.output
+    result = runner.invoke(
+        app,
+        ["bench", "-o", str(output_file), "--baseline", str(baseline_file)]
+        + ["--threshold", "1.5"],
+    )
+    assert result.exit_code == 0
+
+
+def test_bench_small_run(tmp_path) -> None:
+    """
+    Test the bench CLI command running the batch group.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the progress is reported and the results are written.
+    """
+    output_file = tmp_path / "results.json"
+    result = runner.invoke(
+        app,
+        ["bench", "--suite", "batch", "--rows", "20", "--repeat", "1"]
+        + ["-o", str(output_file)],
+    )
+    assert result.exit_code == 0
+    assert "Running batch/20-rows" in result.output
+    assert list(json.loads(output_file.read_text())["results"]) == ["batch/20-rows"]
+
+
+test_cases_bench_invalid = [
+    (["--suite", "macro"], "'--suite'"),
+    (["--baseline", "{baseline}"], "'--baseline'"),
+]
+
+
+@pytest.mark.parametrize("args, hint", test_cases_bench_invalid)
+def test_bench_invalid(args: list, hint: str, tmp_path) -> None:
+    """
+    Test the bench CLI command with an unknown group or an invalid baseline.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the command fails with a usage error.
+    """
+    baseline_file = tmp_path / "baseline.json"
+    baseline_file.write_text("[]")
+    args = [arg.format(baseline=baseline_file) for arg in args]
+    result = runner.invoke(app, ["bench", "--suite", "micro", "--number", "1"] + args)
+    assert result.exit_code == 2
+    assert hint in result.output
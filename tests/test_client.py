@@ -0,0 +1,169 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the client.py file
+in the unit_grader directory.
+-----------------------------------------------------------------
+The following classes are tested:
+    * GraderClient
+
+"""
+import socket
+import threading
+
+import pytest
+
+from unit_grader.client import GraderClient
+from unit_grader.commands.server import create_server
+from unit_grader.config.enums import Answer
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    """
+    Run a grading server on a temporary socket in a background thread.
+    """
+    path = str(tmp_path / "grader.sock")
+    server = create_server(path)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+test_cases_client_grade = [
+    ("100", "Kelvin", "Celsius", "-173.15", Answer.CORRECT),
+    ("100", "Kelvin", "Celsius", "-173", Answer.INCORRECT),
+    ("dog", "Kelvin", "Celsius", "-173.15", Answer.INVALID),
+]
+
+
+@pytest.mark.parametrize(
+    "input_value, from_unit, to_unit, student_response, expected",
+    test_cases_client_grade,
+)
+def test_client_grade(
+    socket_path: str,
+    input_value: str,
+    from_unit: str,
+    to_unit: str,
+    student_response: str,
+    expected: Answer,
+) -> None:
+    """
+    Test the GraderClient.grade method against a running server.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the server's grade is returned as an Answer.
+    """
+    with GraderClient(socket_path) as client:
+        assert client.grade(input_value, from_unit, to_unit, student_response) == (
+            expected
+        )
+
+
+def test_client_request_pipelines(socket_path: str) -> None:
+    """
+    Test the GraderClient.request method with many requests.
+
+    Expected Behavior:
+    -------------------
+    Ensure that one reply is returned per request, in order.
+    """
+    payloads = [
+        {
+            "input_value": "100",
+            "from_unit": "cups",
+            "to_unit": "liters",
+            "student_response": response,
+            "id": number,
+        }
+        for number, response in enumerate(["23.66", "1", "23.7"])
+    ]
+    with GraderClient(socket_path) as client:
+        replies = list(client.request(payloads))
+    assert replies == [
+        {"result": "correct", "id": 0},
+        {"result": "incorrect", "id": 1},
+        {"result": "correct", "id": 2},
+    ]
+
+
+def test_client_request_large_batch(socket_path: str) -> None:
+    """
+    Test the GraderClient.request method with more requests than the socket
+    buffers hold.
+
+    Expected Behavior:
+    -------------------
+    Ensure that sending and reading are interleaved, so every reply is
+    returned in order instead of both sides blocking.
+    """
+    payloads = (
+        {
+            "input_value": "100",
+            "from_unit": "Kelvin",
+            "to_unit": "Celsius",
+            "student_response": "-173.15",
+            "id": number,
+        }
+        for number in range(50_000)
+    )
+    with GraderClient(socket_path) as client:
+        ids = [reply["id"] for reply in client.request(payloads)]
+    assert ids == list(range(50_000))
+
+
+def fake_server(socket_path: str, reply: bytes) -> threading.Thread:
+    """
+    Serve a single connection that answers with a fixed reply.
+    """
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(1)
+
+    def answer() -> None:
+        connection, _ = listener.accept()
+        with connection, listener:
+            connection.recv(4096)
+            connection.sendall(reply)
+
+    thread = threading.Thread(target=answer, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_client_grade_error_reply(tmp_path) -> None:
+    """
+    Test the GraderClient.grade method when the server replies with an error.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError with the server's message is raised.
+    """
+    path = str(tmp_path / "fake.sock")
+    thread = fake_server(path, b'{"error": "Request must be a JSON object."}\n')
+    with GraderClient(path) as client:
+        with pytest.raises(ValueError, match="JSON object"):
+            client.grade("100", "Kelvin", "Celsius", "-173.15")
+    thread.join()
+
+
+def test_client_connection_closed(tmp_path) -> None:
+    """
+    Test the GraderClient.request method when the server hangs up.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ConnectionError is raised.
+    """
+    path = str(tmp_path / "fake.sock")
+    thread = fake_server(path, b"")
+    with GraderClient(path) as client:
+        with pytest.raises(ConnectionError):
+            client.grade("100", "Kelvin", "Celsius", "-173.15")
+    thread.join()
@@ -5,15 +5,20 @@
     The following functions are tested:
         * is_valid_numeric_string
         * convert_units
+        * convert_value
+        * round_half_even
 
 """
+import numpy as np
 import pytest
 
 from unit_grader.config.data import CONVERSION_DATA
 from unit_grader.config.enums import TemperatureUnits, UnitCategory, VolumeUnits
 from unit_grader.utils.common import (
     convert_units,
+    convert_value,
     is_valid_numeric_string,
+    round_half_even,
 )
 
 # is_valid_numeric_string
@@ -885,3 +890,69 @@ def test_convert_units_different_valid_from_unit_to_unit(
     """
     result = convert_units(input_value, from_unit, to_unit, category, conversion_data)
     assert result == expected
+
+
+def test_round_half_even_matches_numpy() -> None:
+    """
+    Test the round_half_even function against numpy.round.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every value, including ties, signed zeros and non-finite
+    values, rounds exactly like numpy.round.
+    """
+    values = np.concatenate(
+        [
+            np.arange(-20_000, 20_000) / 1000,
+            np.random.default_rng(0).uniform(-1e6, 1e6, 20_000),
+            [-0.0, 0.05, -0.05, 0.25, 1e308, np.inf, -np.inf, np.nan],
+        ]
+    )
+    for decimals in (1, 3):
+        with np.errstate(over="ignore"):
+            expected = np.round(values, decimals)
+        rounded = np.array(
+            [round_half_even(value, decimals) for value in values.tolist()]
+        )
+        np.testing.assert_array_equal(rounded, expected)
+        np.testing.assert_array_equal(np.signbit(rounded), np.signbit(expected))
+
+
+test_cases_convert_value_errors = [
+    (TemperatureUnits.CELSIUS.value, TemperatureUnits.KELVIN.value, "Volume"),
+    (VolumeUnits.LITERS.value, TemperatureUnits.KELVIN.value, "temperature"),
+]
+
+
+@pytest.mark.parametrize(
+    "from_unit, to_unit, category", test_cases_convert_value_errors
+)
+def test_convert_value_raises(from_unit: str, to_unit: str, category: str) -> None:
+    """
+    Test the convert_value function with invalid units or category.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError explains why the value cannot be converted.
+    """
+    with pytest.raises(ValueError, match="is not a valid"):
+        convert_value(25.0, from_unit, to_unit, category, CONVERSION_DATA)
+
+
+def test_convert_units_prints_nothing(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that convert_units has no output when the conversion fails.
+
+    Expected Behavior:
+    -------------------
+    Ensure that None is returned and nothing is printed.
+    """
+    result = convert_units(
+        25.0,
+        TemperatureUnits.CELSIUS.value,
+        TemperatureUnits.KELVIN.value,
+        "Volume",
+        CONVERSION_DATA,
+    )
+    assert result is None
+    assert capsys.readouterr() == ("", "")
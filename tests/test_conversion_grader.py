@@ -6,19 +6,46 @@
     The following functions are tested:
         * check_unit_existence
         * validate_input
+        * check_input
+        * grade
         * grade_response
+        * check_entries
+        * parse_question
+        * solve_question
+        * solve_cached
+        * grade_solved
+        * GradeResult
 
 """
+from typing import Optional
+
 import pytest
 import pytest_mock
 
 from unit_grader.commands.conversion_grader import (
+    GradeResult,
+    Question,
+    check_entries,
+    check_input,
     check_unit_existence,
+    grade,
     grade_response,
+    grade_solved,
+    parse_question,
+    solve_cached,
+    solve_question,
     validate_input,
 )
-from unit_grader.config.data import UNITS
-from unit_grader.config.enums import Answer, TemperatureUnits, UnitCategory, VolumeUnits
+from unit_grader.config.data import UNIT_INDEX, UNITS
+from unit_grader.utils.cache import LRUCache
+from unit_grader.utils.numeric import parse_number
+from unit_grader.config.enums import (
+    Answer,
+    ErrorCode,
+    TemperatureUnits,
+    UnitCategory,
+    VolumeUnits,
+)
 
 # Define the function names for patching
 check_unit_existence_function_name = (
@@ -124,6 +151,33 @@ def test_check_unit_existence_nonexistent(
     assert result == expected
 
 
+# Test check_unit_existence on a dictionary other than UNITS
+test_cases_check_unit_existence_custom_dictionary = [
+    ("m", "length"),
+    ("kg", "mass"),
+    (TemperatureUnits.KELVIN.value, None),
+]
+
+
+@pytest.mark.parametrize(
+    "unit_to_check, expected",
+    test_cases_check_unit_existence_custom_dictionary,
+)
+def test_check_unit_existence_custom_dictionary(
+    unit_to_check: str, expected: str
+) -> None:
+    """
+    Test the check_unit_existence function on a custom dictionary.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the dictionary is searched instead of the unit index.
+    """
+    dictionary = {"length": ["m", "cm"], "mass": ["kg"]}
+    result = check_unit_existence(dictionary, unit_to_check)
+    assert result == expected
+
+
 # Test validate_input
 
 
@@ -524,3 +578,364 @@ def test_grade_response_correct_response(
     # Test correct response
     result = grade_response(input_value, from_unit, to_unit, user_response)
     assert result == expected
+
+
+test_cases_grade = [
+    (
+        ("100", "Kelvin", "Celsius", "-173.15"),
+        Answer.CORRECT,
+        ErrorCode.NONE,
+        None,
+    ),
+    (
+        ("100", "Kelvin", "Celsius", "-173"),
+        Answer.INCORRECT,
+        ErrorCode.WRONG_ANSWER,
+        "-173.0 is not the correct answer. The correct answer is -173.2.",
+    ),
+    (
+        ("100", "Kelvin", "Kelvin", "101"),
+        Answer.INCORRECT,
+        ErrorCode.WRONG_ANSWER,
+        "101.0 is not the correct answer. The correct answer is 100.0.",
+    ),
+    (
+        ("100", "Kelvin", "Celsius", "dog"),
+        Answer.INCORRECT,
+        ErrorCode.INVALID_RESPONSE,
+        "dog is not a valid numeric string.",
+    ),
+    (
+        ("100", "Kelvin", "Celsius", "0\x1f"),
+        Answer.INCORRECT,
+        ErrorCode.INVALID_RESPONSE,
+        "0\x1f is not a valid numeric string.",
+    ),
+    (
+        ("dog", "Kelvin", "Celsius", "1"),
+        Answer.INVALID,
+        ErrorCode.INVALID_INPUT_VALUE,
+        "Input Error: dog as input_value needs to be a number.",
+    ),
+    (
+        ("1\x1f", "Kelvin", "Celsius", "1"),
+        Answer.INVALID,
+        ErrorCode.INVALID_INPUT_VALUE,
+        "Input Error: 1\x1f as input_value needs to be a number.",
+    ),
+    (
+        ("100", "Test", "Celsius", "1"),
+        Answer.INVALID,
+        ErrorCode.UNSUPPORTED_FROM_UNIT,
+        "Input Error: Test as from_unit is not supported.",
+    ),
+    (
+        ("100", "Kelvin", "Test", "1"),
+        Answer.INVALID,
+        ErrorCode.UNSUPPORTED_TO_UNIT,
+        "Input Error: Test as to_unit is not supported.",
+    ),
+    (
+        ("100", "cups", "Celsius", "1"),
+        Answer.INVALID,
+        ErrorCode.CATEGORY_MISMATCH,
+        "Input Error: Ensure the selected conversion units match",
+    ),
+]
+
+
+@pytest.mark.parametrize("question, answer, error, message", test_cases_grade)
+def test_grade(
+    question: tuple,
+    answer: Answer,
+    error: ErrorCode,
+    message: str,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """
+    Test the grade function on correct, incorrect and invalid responses.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the answer, error code and feedback are returned
+    and that nothing is printed.
+    """
+    result = grade(*question)
+    assert result.answer is answer
+    assert result.error is error
+    if message is None:
+        assert result.message() is None
+    else:
+        assert result.message().startswith(message)
+    assert capsys.readouterr() == ("", "")
+
+
+def test_grade_rounded_values() -> None:
+    """
+    Test the values kept by the grade function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the correct answer and the response are rounded to the tenths.
+    """
+    result = grade("100", "Kelvin", "Celsius", "-173.15")
+    assert (result.correct_value, result.response_value) == (-173.2, -173.2)
+    assert result.student_response == "-173.15"
+    assert not hasattr(result, "__dict__")
+
+
+def test_grade_conversion_failed(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the grade function when the conversion raises an error.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the response is invalid and the error is kept as detail.
+    """
+    mocker.patch(
+        "unit_grader.commands.conversion_grader.convert_value",
+        side_effect=ZeroDivisionError("division by zero"),
+    )
+    result = grade("100", "Kelvin", "Celsius", "-173.15", cache=None)
+    assert result.answer is Answer.INVALID
+    assert result.error is ErrorCode.CONVERSION_FAILED
+    assert result.message() == "Error: division by zero."
+    result = grade("100", "Kelvin", "Celsius", "dog", cache=None)
+    assert result.answer is Answer.INCORRECT
+    assert result.error is ErrorCode.INVALID_RESPONSE
+
+
+def test_grade_unexpected_error(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the grade function when validating the input raises an error.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the response is invalid and the error is kept as detail.
+    """
+    mocker.patch(
+        "unit_grader.commands.conversion_grader.check_entries",
+        side_effect=Exception("This is a deliberate exception"),
+    )
+    result = grade("100", "Kelvin", "Celsius", "-173.15", cache=None)
+    assert result.answer is Answer.INVALID
+    assert result.error is ErrorCode.UNEXPECTED_ERROR
+    assert result.message() == "Error: This is a deliberate exception."
+
+
+def test_check_input() -> None:
+    """
+    Test the check_input function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the category is returned with the error code of the input.
+    """
+    assert check_input("Kelvin", "Celsius", "1") == (
+        UnitCategory.TEMPERATURE.value,
+        ErrorCode.NONE,
+    )
+    assert check_input("Kelvin", "cups", "1") == (None, ErrorCode.CATEGORY_MISMATCH)
+
+
+def test_grade_result_defaults() -> None:
+    """
+    Test a GradeResult created with only an answer.
+
+    Expected Behavior:
+    -------------------
+    Ensure that it has no error, no values and no message.
+    """
+    result = GradeResult(Answer.CORRECT)
+    assert result.error is ErrorCode.NONE
+    assert result.correct_value is None
+    assert result.message() is None
+
+
+def test_solve_question() -> None:
+    """
+    Test the solve_question function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the error code, correct answer and error are returned.
+    """
+    assert solve_question("100", "Kelvin", "Celsius") == (ErrorCode.NONE, -173.2, None)
+    assert solve_question("dog", "Kelvin", "Celsius") == (
+        ErrorCode.INVALID_INPUT_VALUE,
+        None,
+        None,
+    )
+    question = parse_question("100", "Kelvin", "Celsius")
+    assert solve_question("100", "Kelvin", "Celsius", question) == (
+        ErrorCode.NONE,
+        -173.2,
+        None,
+    )
+
+
+def test_grade_parses_each_field_once(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the number of times the grade function parses numbers.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the input value and the response are parsed once each,
+    whether the question is solved or found in the cache.
+    """
+    parse = mocker.patch(
+        "unit_grader.commands.conversion_grader.parse_number",
+        side_effect=parse_number,
+    )
+    cache = LRUCache(2)
+    for _ in range(2):
+        parse.reset_mock()
+        assert grade("100", "Kelvin", "Celsius", "-173.15", cache).answer is (
+            Answer.CORRECT
+        )
+        assert parse.call_count == 2
+
+
+# from_unit, to_unit, expected
+test_cases_check_entries = [
+    ("Kelvin", "Celsius", (UnitCategory.TEMPERATURE.value, ErrorCode.NONE)),
+    ("Kelvn", "Celsius", (None, ErrorCode.UNSUPPORTED_FROM_UNIT)),
+    ("Kelvin", "Celsus", (None, ErrorCode.UNSUPPORTED_TO_UNIT)),
+    ("Kelvin", "cups", (None, ErrorCode.CATEGORY_MISMATCH)),
+]
+
+
+@pytest.mark.parametrize("from_unit, to_unit, expected", test_cases_check_entries)
+def test_check_entries(from_unit: str, to_unit: str, expected: tuple) -> None:
+    """
+    Test the check_entries function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the category of valid units is returned, and the error code
+    of invalid ones, like check_units.
+    """
+    from_entry, to_entry = UNIT_INDEX.lookup(from_unit), UNIT_INDEX.lookup(to_unit)
+    assert check_entries(from_entry, to_entry) == expected
+
+
+def test_solve_cached() -> None:
+    """
+    Test the solve_cached function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that valid questions are solved once and cached under their key,
+    and invalid questions or a missing cache solve every time.
+    """
+    cache = LRUCache(2)
+    question = parse_question("100", "Kelvin", "Celsius")
+    solution = solve_cached("100", "Kelvin", "Celsius", question, cache)
+    assert solution == (ErrorCode.NONE, -173.2, None)
+    assert solve_cached("1e2", "Kelvin", "Celsius", question, cache) is solution
+    invalid = parse_question("dog", "Kelvin", "Celsius")
+    assert solve_cached("dog", "Kelvin", "Celsius", invalid, cache) == (
+        ErrorCode.INVALID_INPUT_VALUE,
+        None,
+        None,
+    )
+    assert solve_cached("100", "Kelvin", "Celsius", question, None) == solution
+    assert len(cache) == 1
+
+
+def test_grade_solved() -> None:
+    """
+    Test the grade_solved function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that responses are graded against the given solution, like grade.
+    """
+    solution = (ErrorCode.NONE, -173.2, None)
+    result = grade_solved(solution, "100", "Kelvin", "Celsius", "-173.15")
+    assert result.answer is Answer.CORRECT
+    assert result.response_value == -173.2
+    result = grade_solved(solution, "100", "Kelvin", "Celsius", "1")
+    assert result.message() == grade("100", "Kelvin", "Celsius", "1").message()
+    invalid = (ErrorCode.UNSUPPORTED_FROM_UNIT, None, None)
+    result = grade_solved(invalid, "100", "Kelvn", "Celsius", "1")
+    assert result.answer is Answer.INVALID
+
+
+def test_grade_caches_questions(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the grade function with an answer cache.
+
+    Expected Behavior:
+    -------------------
+    Ensure that each valid question is solved once, however its input value
+    is written, invalid questions are not cached, and every response is
+    still graded on its own.
+    """
+    cache = LRUCache(2)
+    solve = mocker.patch(
+        "unit_grader.commands.conversion_grader.solve_question",
+        side_effect=solve_question,
+    )
+    responses = ["-173.15", "-173", "dog", "-173.2"]
+    answers = [grade("100", "Kelvin", "Celsius", r, cache).answer for r in responses]
+    assert answers == [
+        Answer.CORRECT,
+        Answer.INCORRECT,
+        Answer.INCORRECT,
+        Answer.CORRECT,
+    ]
+    assert solve.call_count == 1
+    for input_value in (" 100", "100.0", "1e2", "1_00"):
+        result = grade(input_value, "Kelvin", "Celsius", "-173.15", cache)
+        assert result.answer is Answer.CORRECT
+        assert result.input_value == input_value
+    assert solve.call_count == 1
+    assert grade("dog", "Kelvin", "Celsius", "1", cache).answer is Answer.INVALID
+    assert grade("dog", "Kelvin", "Celsius", "1", cache).answer is Answer.INVALID
+    assert grade("1", "cups", "liters", "0.2", cache).answer is Answer.CORRECT
+    assert solve.call_count == 4
+    assert cache.stats() == (7, 2, 0, 2, 2)
+
+
+# input_value, from_unit, to_unit, key
+test_cases_parse_question = [
+    ("100", "Kelvin", "Celsius", (100.0).hex()),
+    (" 1e2 ", "Kelvin", "Celsius", (100.0).hex()),
+    ("-0", "Kelvin", "Celsius", (-0.0).hex()),
+    ("0", "Kelvin", "Celsius", (0.0).hex()),
+    ("dog", "Kelvin", "Celsius", None),
+    ("100", "Kelvn", "Celsius", None),
+    ("100", "Kelvin", ["Celsius"], None),
+]
+
+
+@pytest.mark.parametrize(
+    "input_value, from_unit, to_unit, key", test_cases_parse_question
+)
+def test_parse_question(
+    input_value: str, from_unit: str, to_unit: str, key: Optional[str]
+) -> None:
+    """
+    Test the parse_question function and the Question.key property.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the input value is parsed and the units looked up, that
+    equal input values share a key with the ids of both units, -0 and 0
+    stay apart, and invalid questions have no key.
+    """
+    question = parse_question(input_value, from_unit, to_unit)
+    assert question == Question(
+        parse_number(input_value),
+        UNIT_INDEX.lookup(from_unit),
+        UNIT_INDEX.lookup(to_unit),
+    )
+    if key is None:
+        assert question.key is None
+    else:
+        assert question.key == (
+            key,
+            UNIT_INDEX.lookup(from_unit).unit_id,
+            UNIT_INDEX.lookup(to_unit).unit_id,
+        )
@@ -0,0 +1,150 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the index.py file
+in the unit_grader/config directory.
+-----------------------------------------------------------------
+The following classes are tested:
+    * UnitIndex
+
+"""
+import numpy as np
+import pytest
+
+from unit_grader.config.data import UNIT_INDEX, UNITS
+from unit_grader.config.enums import TemperatureUnits as T
+from unit_grader.config.enums import UnitCategory
+from unit_grader.config.enums import VolumeUnits as V
+from unit_grader.config.index import UNKNOWN_UNIT, UnitEntry, UnitIndex
+
+
+def test_unit_index_covers_units() -> None:
+    """
+    Test the unit index built from the conversion data.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every unit is indexed with its category and stable ids.
+    """
+    assert UNIT_INDEX.categories == tuple(UNITS)
+    assert UNIT_INDEX.units == tuple(unit for units in UNITS.values() for unit in units)
+    assert len(UNIT_INDEX) == 10
+    assert UNIT_INDEX.lookup(T.KELVIN.value) == UnitEntry(
+        UnitCategory.TEMPERATURE.value, 0, 0
+    )
+    assert UNIT_INDEX.lookup(V.GALLONS.value) == UnitEntry(
+        UnitCategory.VOLUME.value, 1, 9
+    )
+
+
+test_cases_unit_index_unknown = ["kelvin", "", None, ["Kelvin"], T.KELVIN]
+
+
+@pytest.mark.parametrize("unit", test_cases_unit_index_unknown)
+def test_unit_index_unknown_unit(unit: object) -> None:
+    """
+    Test the unit index with unknown, unhashable and non-string units.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the unit is not found.
+    """
+    assert UNIT_INDEX.lookup(unit) is None
+    assert UNIT_INDEX.category_of(unit) is None
+    assert unit not in UNIT_INDEX
+
+
+test_cases_unit_index_can_convert = [
+    (T.KELVIN.value, T.CELSIUS.value, True),
+    (V.CUPS.value, V.CUPS.value, True),
+    (T.KELVIN.value, V.CUPS.value, False),
+    (T.KELVIN.value, "Dummy", False),
+    ("Dummy", T.KELVIN.value, False),
+]
+
+
+@pytest.mark.parametrize(
+    "from_unit, to_unit, expected", test_cases_unit_index_can_convert
+)
+def test_unit_index_can_convert(from_unit: str, to_unit: str, expected: bool) -> None:
+    """
+    Test the UnitIndex.can_convert method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that only units of the same category can be converted.
+    """
+    assert UNIT_INDEX.can_convert(from_unit, to_unit) is expected
+
+
+def test_unit_index_convertible_matrix() -> None:
+    """
+    Test the convertibility matrix of the unit index.
+
+    Expected Behavior:
+    -------------------
+    Ensure that it matches can_convert for every pair and is read-only.
+    """
+    matrix = UNIT_INDEX.convertible
+    expected = np.array(
+        [
+            [UNIT_INDEX.can_convert(f, t) for t in UNIT_INDEX.units]
+            for f in UNIT_INDEX.units
+        ]
+    )
+    np.testing.assert_array_equal(matrix, expected)
+    with pytest.raises(ValueError):
+        matrix[0, 0] = False
+
+
+# units, ids
+test_cases_unit_index_encode = [
+    (
+        [T.KELVIN.value, V.CUPS.value, T.KELVIN.value, "kelvin", None],
+        [0, 7, 0, UNKNOWN_UNIT, UNKNOWN_UNIT],
+    ),
+    ([V.GALLONS.value, ["Kelvin"], ("Kelvin", [])], [9, UNKNOWN_UNIT, UNKNOWN_UNIT]),
+    ([], []),
+]
+
+
+@pytest.mark.parametrize("units, ids", test_cases_unit_index_encode)
+def test_unit_index_encode(units: list, ids: list) -> None:
+    """
+    Test the encode method of the unit index.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every unit is encoded as its uint8 unit id, and any other
+    value, even unhashable ones, as UNKNOWN_UNIT.
+    """
+    encoded = UNIT_INDEX.encode(iter(units))
+    assert encoded.dtype == np.uint8
+    assert encoded.tolist() == ids
+
+
+def test_unit_index_encode_too_many_units() -> None:
+    """
+    Test the encode method of an index with more units than uint8 ids.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised.
+    """
+    index = UnitIndex({"count": [str(unit) for unit in range(UNKNOWN_UNIT)]})
+    with pytest.raises(ValueError, match="at most 254"):
+        index.encode(["1"])
+
+
+def test_unit_index_is_immutable() -> None:
+    """
+    Test that the unit index cannot be changed after it is built.
+
+    Expected Behavior:
+    -------------------
+    Ensure that new attributes and entries are rejected.
+    """
+    index = UnitIndex({"length": ["m"]})
+    with pytest.raises(AttributeError):
+        index.extra = 1
+    with pytest.raises(TypeError):
+        index._entries["cm"] = None
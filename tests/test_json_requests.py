@@ -0,0 +1,113 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the json_requests.py file
+in the unit_grader/commands directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * handle_request
+    * handle_line
+
+"""
+from typing import Optional
+
+import pytest
+import pytest_mock
+
+from unit_grader.commands.json_requests import handle_line, handle_request
+
+test_cases_handle_request = [
+    (
+        {
+            "input_value": "100",
+            "from_unit": "Kelvin",
+            "to_unit": "Celsius",
+            "student_response": "-173.15",
+            "id": 7,
+        },
+        {"result": "correct", "id": 7},
+    ),
+    (
+        {
+            "input_value": 100,
+            "from_unit": "cups",
+            "to_unit": "liters",
+            "student_response": 23.5,
+        },
+        {"result": "incorrect"},
+    ),
+    (
+        {
+            "input_value": "100",
+            "from_unit": ["Kelvin"],
+            "to_unit": "Celsius",
+            "student_response": "-173.15",
+        },
+        {"result": "invalid"},
+    ),
+    ({}, {"result": "invalid"}),
+    ([1, 2], {"error": "Request must be a JSON object."}),
+]
+
+
+@pytest.mark.parametrize("payload, expected", test_cases_handle_request)
+def test_handle_request(payload: object, expected: dict) -> None:
+    """
+    Test the handle_request function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that requests are graded, ids echoed and non-objects rejected.
+    """
+    assert handle_request(payload) == expected
+
+
+test_cases_handle_line = [
+    (
+        '{"input_value": "100", "from_unit": "Kelvin", "to_unit": "Celsius", '
+        '"student_response": "-173.15", "id": 7}\n',
+        '{"result": "correct", "id": 7}\n',
+    ),
+    (b'{"id": "a"}\n', '{"result": "invalid", "id": "a"}\n'),
+    (
+        "not json\n",
+        '{"error": "Invalid JSON: Expecting value: line 1 column 1 (char 0)"}\n',
+    ),
+    (
+        "[" * 100_000,
+        '{"error": "Invalid JSON: maximum recursion depth exceeded while decoding'
+        ' a JSON array from a unicode string"}\n',
+    ),
+    ("   \n", None),
+]
+
+
+@pytest.mark.parametrize("line, expected", test_cases_handle_line)
+def test_handle_line(line: object, expected: Optional[str]) -> None:
+    """
+    Test the handle_line function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that JSON lines get a JSON reply line, blank lines none, and
+    lines that are not JSON an error reply.
+    """
+    assert handle_line(line) == expected
+
+
+def test_handle_line_grading_failed(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the handle_line function when grading a request fails.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the failure is replied as an error with the request id,
+    not as invalid JSON.
+    """
+    mocker.patch(
+        "unit_grader.commands.json_requests.grade",
+        side_effect=OverflowError("too large"),
+    )
+    assert handle_line('{"id": 3}') == (
+        '{"error": "Grading failed: OverflowError(\'too large\')", "id": 3}\n'
+    )
+    assert handle_line("[]") == '{"error": "Request must be a JSON object."}\n'
@@ -0,0 +1,181 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the launcher.py file
+in the unit_grader directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * main
+
+"""
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+import pytest_mock
+
+from unit_grader.config.enums import Answer
+from unit_grader.utils.timings import TIMINGS
+from unit_grader.launcher import main
+
+SINGLE_GRADE = ["-i", "100", "-f", "Kelvin", "-t", "Celsius", "-s", "-173.15"]
+
+
+def test_main_single_grade_output(
+    capsys: pytest.CaptureFixture, mocker: pytest_mock.MockFixture
+) -> None:
+    """
+    Test the main function with a machine-readable output format.
+
+    Expected Behavior:
+    -------------------
+    Ensure that only the result line is printed and its exit code returned,
+    even in verbose mode.
+    """
+    mocker.patch("logging.basicConfig")
+    args = ["-i", "100", "-f", "Kelvin", "-t", "Celsius", "-s", "-173"]
+    assert main(args + ["--output", "plain", "-v"]) == 1
+    assert capsys.readouterr().out == "incorrect\n"
+
+
+def test_main_single_grade(
+    capsys: pytest.CaptureFixture, mocker: pytest_mock.MockFixture
+) -> None:
+    """
+    Test the main function with a plain single-grade invocation.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the grade and the feedback request are printed.
+    """
+    mocker.patch("logging.basicConfig")
+    assert main(SINGLE_GRADE + ["-v"]) == 0
+    output = capsys.readouterr().out
+    assert "Verbose mode is enabled." in output
+    assert f"Grade Result: {Answer.CORRECT.value}" in output
+    assert "We would like your feedback!" in output
+
+
+def test_main_args_file(
+    tmp_path, capsys: pytest.CaptureFixture, mocker: pytest_mock.MockFixture
+) -> None:
+    """
+    Test the main function with an argument file.
+
+    Expected Behavior:
+    -------------------
+    Ensure that @FILE and --from-args-file FILE grade every line, from a
+    file or from stdin.
+    """
+    mocker.patch("logging.basicConfig")
+    args_file = tmp_path / "args.txt"
+    args_file.write_text(" ".join(SINGLE_GRADE) + "\n-i 1 -f Kelvin -t Celsius -s 1\n")
+    assert main([f"@{args_file}", "--output", "plain"]) == 1
+    assert capsys.readouterr().out == "correct\nincorrect\n"
+    mocker.patch("sys.stdin", io.StringIO(" ".join(SINGLE_GRADE) + "\n"))
+    assert main(["--from-args-file", "-", "--output=json"]) == 0
+    assert json.loads(capsys.readouterr().out)["result"] == "correct"
+
+
+def test_main_args_file_missing(tmp_path, mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the main function with an argument file that does not exist.
+
+    Expected Behavior:
+    -------------------
+    Ensure that @FILE is handed to the typer app as --from-args-file FILE.
+    """
+    mock_app = mocker.patch("unit_grader.cli.app")
+    path = str(tmp_path / "missing.txt")
+    main([f"@{path}", "-v"])
+    mock_app.assert_called_once_with(
+        args=["--from-args-file", path, "-v"], prog_name="unit-grader"
+    )
+
+
+def test_main_timings_env(
+    tmp_path, capsys: pytest.CaptureFixture, mocker: pytest_mock.MockFixture
+) -> None:
+    """
+    Test the main function with the timings environment variable.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the timings of the grading stages are written to the file
+    it names at exit.
+    """
+    path = tmp_path / "timings.json"
+    mocker.patch.dict("os.environ", {"UNIT_GRADER_TIMINGS": str(path)})
+    register = mocker.patch("atexit.register")
+    try:
+        assert main(SINGLE_GRADE + ["--output", "plain"]) == 0
+        register.call_args.args[0]()
+    finally:
+        TIMINGS.disable()
+        TIMINGS.reset()
+    assert capsys.readouterr().out == "correct\n"
+    report = json.loads(path.read_text())["timings"]
+    assert report["grade"]["count"] == report["render"]["count"] == 1
+
+
+def test_main_full_cli(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the main function with an invocation the fast path does not handle.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the arguments are handed to the typer app.
+    """
+    mock_app = mocker.patch("unit_grader.cli.app")
+    mocker.patch("sys.argv", ["unit-grader", "--version"])
+    main()
+    mock_app.assert_called_once_with(args=["--version"], prog_name="unit-grader")
+
+
+def run_python(code: str) -> str:
+    """
+    Run code in a fresh interpreter and return its output.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return completed.stdout
+
+
+def test_single_grade_import_budget() -> None:
+    """
+    Test the start-up cost of a single-grade invocation.
+
+    Expected Behavior:
+    -------------------
+    Ensure that neither typer nor numpy is imported. The start-up time
+    itself is measured by the startup benchmarks, see commands.bench.
+    """
+    code = (
+        "import sys\n"
+        "from unit_grader.launcher import main\n"
+        f"main({SINGLE_GRADE!r})\n"
+        "print(sorted({'numpy', 'typer'} & set(sys.modules)))\n"
+    )
+    output = run_python(code)
+    assert f"Grade Result: {Answer.CORRECT.value}" in output
+    assert output.rstrip().endswith("[]")
+
+
+def test_single_grade_output_imports() -> None:
+    """
+    Test the imports of a single-grade invocation with json output.
+
+    Expected Behavior:
+    -------------------
+    Ensure that rich is not imported and a single line is written.
+    """
+    code = (
+        "import sys\n"
+        "from unit_grader.launcher import main\n"
+        f"code = main({SINGLE_GRADE + ['--output', 'json']!r})\n"
+        "print(code, sorted({'numpy', 'rich', 'typer'} & set(sys.modules)))\n"
+    )
+    output = run_python(code)
+    assert output == '{"result": "correct", "message": null}\n0 []\n'
@@ -0,0 +1,155 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the mapped_reader.py file
+in the unit_grader/commands directory.
+-----------------------------------------------------------------
+The following classes and functions are tested:
+    * MappedLines
+    * advise
+    * map_lines
+
+"""
+import io
+import mmap
+import os
+
+import pytest
+import pytest_mock
+
+from unit_grader.commands import mapped_reader
+from unit_grader.commands.mapped_reader import MappedLines, advise, map_lines
+
+CONTENT = 'é,1\r\n"multi\nline",2\nlast,3'
+
+
+def test_mapped_lines(tmp_path) -> None:
+    """
+    Test the MappedLines class.
+
+    Expected Behavior:
+    -------------------
+    Ensure that lines are split at newlines only, keep their terminator,
+    are decoded, and the offset counts their bytes, also after a seek.
+    The map is closed once every line was read.
+    """
+    path = tmp_path / "submissions.csv"
+    path.write_bytes(CONTENT.encode())
+    with open(path, "rb") as file:
+        lines = MappedLines(file)
+        iterator = iter(lines)
+        assert next(iterator) == "é,1\r\n"
+        assert lines.offset == 6
+        lines.seek(0)
+        assert list(iterator) == ["é,1\r\n", '"multi\n', 'line",2\n', "last,3"]
+        assert lines.offset == len(CONTENT.encode())
+        assert list(lines) == []
+
+
+def test_mapped_lines_current_position(tmp_path) -> None:
+    """
+    Test the MappedLines class on a file that was partly read.
+
+    Expected Behavior:
+    -------------------
+    Ensure that lines are read from the current position of the file.
+    """
+    path = tmp_path / "submissions.csv"
+    path.write_text("a,1\nb,2\n", encoding="utf-8")
+    with open(path, encoding="utf-8") as file:
+        file.readline()
+        with MappedLines(file, file.encoding) as lines:
+            assert lines.offset == 4
+            assert list(lines) == ["b,2\n"]
+
+
+def test_mapped_lines_empty(tmp_path) -> None:
+    """
+    Test the MappedLines class on an empty file.
+
+    Expected Behavior:
+    -------------------
+    Ensure that no line is read, also after a seek.
+    """
+    path = tmp_path / "empty.csv"
+    path.write_bytes(b"")
+    with open(path, "rb") as file:
+        lines = MappedLines(file)
+        lines.seek(0)
+        lines.release()
+        assert list(lines) == []
+        lines.close()
+
+
+def test_mapped_lines_release(tmp_path, mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the release of the pages behind the current line.
+
+    Expected Behavior:
+    -------------------
+    Ensure that whole pages behind the current line are dropped from the
+    mapping while the file is read, and every line is still read.
+    """
+    mocker.patch.object(mapped_reader, "RELEASE_BYTES", mmap.PAGESIZE)
+    advised = mocker.patch.object(mapped_reader, "advise", wraps=advise)
+    path = tmp_path / "submissions.csv"
+    rows = [f"s{row},{row},Celsius,Kelvin,{row}\n" for row in range(3000)]
+    path.write_text("".join(rows), encoding="utf-8")
+    with open(path, "rb") as file:
+        assert list(MappedLines(file)) == rows
+    released = [call.args[2:] for call in advised.call_args_list[1:]]
+    assert len(released) >= os.path.getsize(path) // mmap.PAGESIZE - 1
+    assert all(start % mmap.PAGESIZE == 0 for start, _ in released)
+    assert [start for start, _ in released[1:]] == [
+        start + length for start, length in released[:-1]
+    ]
+
+
+def test_advise_unsupported(tmp_path) -> None:
+    """
+    Test the advise function with advice the platform does not know.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the advice is ignored.
+    """
+    path = tmp_path / "submissions.csv"
+    path.write_bytes(b"a,1\n")
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        assert advise(mapped, "MADV_SEQUENTIAL") is True
+        assert advise(mapped, "MADV_UNKNOWN") is False
+
+
+def test_map_lines(tmp_path) -> None:
+    """
+    Test the map_lines function on a regular file.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the file is read through a memory map.
+    """
+    path = tmp_path / "submissions.csv"
+    path.write_bytes(CONTENT.encode())
+    with open(path, encoding="utf-8") as file, map_lines(file) as lines:
+        assert isinstance(lines, MappedLines)
+        assert "".join(lines) == CONTENT
+
+
+@pytest.mark.parametrize("kind", ["memory", "pipe"])
+def test_map_lines_unmapped(kind: str) -> None:
+    """
+    Test the map_lines function on files that cannot be mapped.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the file itself is returned.
+    """
+    if kind == "memory":
+        file = io.StringIO("a,1\n")
+    else:
+        read_end, write_end = os.pipe()
+        os.close(write_end)
+        file = os.fdopen(read_end, encoding="utf-8")
+    with file:
+        assert map_lines(file) is file
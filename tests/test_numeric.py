@@ -0,0 +1,130 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the numeric.py file
+in the unit_grader/utils directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * is_number
+    * parse_number
+    * parse_numbers
+
+"""
+import math
+from typing import Optional
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from unit_grader.utils.numeric import is_number, parse_number, parse_numbers
+
+
+def python_float(value: object) -> Optional[float]:
+    """
+    Parse a value with float(), or return None if float() rejects it.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def same_number(left: Optional[float], right: Optional[float]) -> bool:
+    """
+    Compare two parsed values, NaN included.
+    """
+    if left is None or right is None:
+        return left is right
+    return left == right or (math.isnan(left) and math.isnan(right))
+
+
+# Characters that exercise every part of the float grammar
+FLOAT_ALPHABET = "0123456789_.eE+- \t\ninfatyINFATY١　xj\x00\x1c\x1f"
+
+
+@given(st.text(alphabet=FLOAT_ALPHABET, max_size=10) | st.text(max_size=10))
+def test_parse_number_matches_float(value: str) -> None:
+    """
+    Test the parse_number function against float() on generated strings.
+
+    Expected Behavior:
+    -------------------
+    Ensure that exactly the strings float() accepts are parsed, to the same value.
+    """
+    assert same_number(parse_number(value), python_float(value))
+    assert is_number(value) is (python_float(value) is not None)
+
+
+test_cases_parse_number = [
+    ("-173.15", -173.15),
+    (" 1_000.5e-1\n", 100.05),
+    (".5", 0.5),
+    ("5.", 5.0),
+    ("-Infinity", -math.inf),
+    ("١٢", 12.0),
+    ("1__0", None),
+    ("1e", None),
+    (".", None),
+    ("", None),
+    ("dog", None),
+    ("0\x1f", None),
+    ("\x1c1", None),
+    ("\x0b1\u3000", 1.0),
+    (12, 12.0),
+    (10**400, None),
+    (b"2.5", 2.5),
+    (None, None),
+    ([1], None),
+]
+
+
+@pytest.mark.parametrize("value, expected", test_cases_parse_number)
+def test_parse_number(value: object, expected: Optional[float]) -> None:
+    """
+    Test the parse_number function with strings and other values.
+
+    Expected Behavior:
+    -------------------
+    Ensure that valid values are parsed and invalid ones give None.
+    """
+    assert same_number(parse_number(value), expected)
+
+
+test_cases_parse_numbers = [
+    ["1.5", "dog", None, "-2", " nan ", "1_0", b"3", "1\x1f", 10**400],
+    np.array(["1.5", "dog", "", "-2"]),
+    np.array(["1.5", None, 7], dtype=object),
+    [],
+]
+
+
+@pytest.mark.parametrize("values", test_cases_parse_numbers)
+def test_parse_numbers(values) -> None:
+    """
+    Test the parse_numbers function on columns of mixed values.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the validity mask and the values match parse_number.
+    """
+    parsed, valid = parse_numbers(values)
+    expected = [parse_number(value) for value in values]
+    assert valid.tolist() == [value is not None for value in expected]
+    assert parsed.dtype == np.float64
+    for number, value in zip(parsed.tolist(), expected):
+        assert same_number(number, math.nan if value is None else value)
+
+
+def test_parse_numbers_numeric_array() -> None:
+    """
+    Test the parse_numbers function on a numeric array.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the array is converted to float64 and every entry is valid.
+    """
+    parsed, valid = parse_numbers(np.array([1, 2, 3], dtype=np.int32))
+    assert parsed.dtype == np.float64
+    assert parsed.tolist() == [1.0, 2.0, 3.0]
+    assert valid.all()
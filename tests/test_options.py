@@ -0,0 +1,106 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the options.py file
+in the unit_grader/utils directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * parse_single_grade
+    * parse_args_file
+
+"""
+import pytest
+
+from unit_grader.utils.options import parse_args_file, parse_single_grade
+
+SINGLE_GRADE = ["-i", "100", "-f", "Kelvin", "-t", "Celsius", "-s", "-173.15"]
+
+test_cases_single_grade = [
+    (SINGLE_GRADE, False, "rich"),
+    (SINGLE_GRADE + ["-v"], False, "rich"),
+    (["--verbose"] + SINGLE_GRADE, True, "rich"),
+    (SINGLE_GRADE + ["--output", "json"], False, "json"),
+    (["--output=exit-code", "-v"] + SINGLE_GRADE, True, "exit-code"),
+    (
+        [
+            "--input-value=100",
+            "--from-unit",
+            "Kelvin",
+            "--to-unit=Celsius",
+            "--student-response=-173.15",
+        ],
+        False,
+        "rich",
+    ),
+]
+
+
+@pytest.mark.parametrize("args, verbose, output", test_cases_single_grade)
+def test_parse_single_grade(args: list, verbose: bool, output: str) -> None:
+    """
+    Test the parse_single_grade function with plain single-grade invocations.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every option is recognized, in any order and form.
+    """
+    assert parse_single_grade(args) == {
+        "input_value": "100",
+        "from_unit": "Kelvin",
+        "to_unit": "Celsius",
+        "student_response": "-173.15",
+        "verbose": verbose or "-v" in args,
+        "output": output,
+    }
+
+
+test_cases_full_cli = [
+    [],
+    ["--help"],
+    ["--version"],
+    ["batch", "submissions.csv"],
+    SINGLE_GRADE[:6],
+    SINGLE_GRADE[:7],
+    SINGLE_GRADE + ["-i", "1"],
+    SINGLE_GRADE + ["--no-such-option", "1"],
+    SINGLE_GRADE + ["--output", "xml"],
+    SINGLE_GRADE + ["--output", "json", "--output", "plain"],
+]
+
+
+@pytest.mark.parametrize("args", test_cases_full_cli)
+def test_parse_single_grade_needs_full_cli(args: list) -> None:
+    """
+    Test the parse_single_grade function with other invocations.
+
+    Expected Behavior:
+    -------------------
+    Ensure that None is returned so the typer app handles them.
+    """
+    assert parse_single_grade(args) is None
+
+
+def test_parse_args_file(tmp_path) -> None:
+    """
+    Test the parse_args_file function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that argument-file invocations are recognized, and that other
+    invocations and missing files are left to the typer app.
+    """
+    args_file = tmp_path / "args.txt"
+    args_file.write_text("")
+    path = str(args_file)
+    assert parse_args_file(["--from-args-file", path]) == {
+        "args_file": path,
+        "verbose": False,
+        "output": "rich",
+    }
+    assert parse_args_file(["-v", "--from-args-file=-", "--output", "plain"]) == {
+        "args_file": "-",
+        "verbose": True,
+        "output": "plain",
+    }
+    assert parse_args_file(["--from-args-file", str(tmp_path / "missing")]) is None
+    assert parse_args_file(["--from-args-file", path] + SINGLE_GRADE) is None
+    assert parse_args_file(["--output", "json"]) is None
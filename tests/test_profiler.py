@@ -0,0 +1,171 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the profiler.py file
+in the unit_grader/utils directory.
+-----------------------------------------------------------------
+The following classes and functions are tested:
+    * Profiler
+    * collapse_stats
+    * frame_label
+
+"""
+import cProfile
+import os
+import pstats
+import tracemalloc
+
+import pytest
+
+from unit_grader.commands.conversion_grader import grade
+from unit_grader.utils.profiler import (
+    ALLOCATIONS_FILE,
+    COLLAPSED_FILE,
+    PSTATS_FILE,
+    Profiler,
+    collapse_stats,
+    frame_label,
+)
+
+
+def busy(count: int) -> list:
+    """
+    Allocate and sort a list, called from two places below.
+    """
+    return sorted(str(number) for number in range(count))
+
+
+def outer() -> int:
+    """
+    Call busy directly and through inner.
+    """
+    return len(busy(20000)) + inner()
+
+
+def inner() -> int:
+    """
+    Call busy.
+    """
+    return len(busy(20000))
+
+
+def recursive(depth: int) -> int:
+    """
+    Call itself depth times.
+    """
+    return 0 if depth == 0 else 1 + recursive(depth - 1)
+
+
+def test_profiler(tmp_path) -> None:
+    """
+    Test the Profiler class.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the profile, the collapsed stacks and the allocation sites
+    of the profiled code are written to the directory, which is created,
+    and that memory tracing is stopped again.
+    """
+    directory = str(tmp_path / "out")
+    profiler = Profiler(directory)
+    profiler.start()
+    results = [grade(str(value), "Kelvin", "Celsius", "0") for value in range(100)]
+    assert tracemalloc.is_tracing()
+    paths = profiler.stop()
+
+    assert len(results) == 100
+    assert not tracemalloc.is_tracing()
+    assert paths == [
+        os.path.join(directory, name)
+        for name in (PSTATS_FILE, COLLAPSED_FILE, ALLOCATIONS_FILE)
+    ]
+    functions = {name for _, _, name in pstats.Stats(paths[0]).stats}
+    assert "grade" in functions
+    with open(paths[1], encoding="utf-8") as source:
+        stacks = source.read().splitlines()
+    assert any("grade (conversion_grader.py:" in line for line in stacks)
+    with open(paths[2], encoding="utf-8") as source:
+        allocations = source.read().splitlines()
+    assert allocations[0].startswith("# Peak traced memory: ")
+    assert allocations[1] == "# Top 25 allocation sites still held:"
+
+
+def test_profiler_keeps_tracing(tmp_path) -> None:
+    """
+    Test the Profiler class while memory is already traced.
+
+    Expected Behavior:
+    -------------------
+    Ensure that memory tracing is left running.
+    """
+    tracemalloc.start()
+    try:
+        profiler = Profiler(str(tmp_path))
+        profiler.start()
+        profiler.stop()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_profiler_not_started(tmp_path) -> None:
+    """
+    Test the stop method of a profiler that was not started.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a RuntimeError is raised.
+    """
+    with pytest.raises(RuntimeError, match="not started"):
+        Profiler(str(tmp_path)).stop()
+
+
+def test_collapse_stats() -> None:
+    """
+    Test the collapse_stats function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the time of a function called from two places is split
+    among both stacks, every line ends with its microseconds, and
+    recursive calls are folded into the outermost call.
+    """
+    profile = cProfile.Profile()
+    profile.enable()
+    outer()
+    recursive(5)
+    profile.disable()
+    stacks = {}
+    for line in collapse_stats(pstats.Stats(profile)):
+        stack, microseconds = line.rsplit(" ", 1)
+        stacks[tuple(frame.split(" (")[0] for frame in stack.split(";"))] = int(
+            microseconds
+        )
+
+    assert all(microseconds > 0 for microseconds in stacks.values())
+    assert any(stack[-2:] == ("outer", "busy") for stack in stacks)
+    assert any(stack[-3:] == ("outer", "inner", "busy") for stack in stacks)
+    assert not any(stack.count("recursive") > 1 for stack in stacks)
+
+
+# function, label
+test_cases_frame_label = [
+    (("/src/unit_grader/cli.py", 12, "batch"), "batch (cli.py:12)"),
+    (
+        ("~", 0, "<built-in method builtins.sorted>"),
+        "<built-in method builtins.sorted>",
+    ),
+    (("~", 0, "<method 'a;b'>"), "<method 'a,b'>"),
+]
+
+
+@pytest.mark.parametrize("function, label", test_cases_frame_label)
+def test_frame_label(function: tuple, label: str) -> None:
+    """
+    Test the frame_label function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that functions are labeled by name, file and line, built-ins by
+    name only, and without ";".
+    """
+    assert frame_label(function) == label
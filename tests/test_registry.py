@@ -0,0 +1,296 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the registry.py file
+in the unit_grader/config directory.
+-----------------------------------------------------------------
+The following classes are tested:
+    * AffineTransform
+    * UnitRegistry
+
+"""
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from unit_grader.config.data import CONVERSION_DATA, REGISTRY, UNITS
+from unit_grader.config.enums import UnitCategory
+from unit_grader.config.registry import AffineTransform, UnitRegistry
+
+# Conversions published before the registry existed
+PUBLISHED_CONVERSIONS = {
+    ("Celsius", "Fahrenheit"): lambda x: x * (9 / 5) + 32,
+    ("Celsius", "Kelvin"): lambda x: x + 273.15,
+    ("Celsius", "Rankine"): lambda x: (x + 273.15) * (9 / 5),
+    ("Fahrenheit", "Celsius"): lambda x: (x - 32) * (5 / 9),
+    ("Fahrenheit", "Kelvin"): lambda x: (x + 459.67) * (5 / 9),
+    ("Fahrenheit", "Rankine"): lambda x: x + 459.67,
+    ("Kelvin", "Celsius"): lambda x: x - 273.15,
+    ("Kelvin", "Fahrenheit"): lambda x: x * (9 / 5) - 459.67,
+    ("Kelvin", "Rankine"): lambda x: x * (9 / 5),
+    ("Rankine", "Celsius"): lambda x: (x - 491.67) * (5 / 9),
+    ("Rankine", "Fahrenheit"): lambda x: x - 459.67,
+    ("Rankine", "Kelvin"): lambda x: x * (5 / 9),
+    ("liters", "tablespoons"): lambda x: x * 67.628,
+    ("liters", "cubic-inches"): lambda x: x * 61.024,
+    ("liters", "cups"): lambda x: x * 4.227,
+    ("liters", "cubic-feet"): lambda x: x / 28.317,
+    ("liters", "gallons"): lambda x: x / 3.785,
+    ("tablespoons", "liters"): lambda x: x / 67.628,
+    ("tablespoons", "cubic-inches"): lambda x: x / 1.108,
+    ("tablespoons", "cups"): lambda x: x / 16,
+    ("tablespoons", "cubic-feet"): lambda x: x / 1915,
+    ("tablespoons", "gallons"): lambda x: x / 256,
+    ("cubic-inches", "liters"): lambda x: x / 61.024,
+    ("cubic-inches", "tablespoons"): lambda x: x * 1.108,
+    ("cubic-inches", "cups"): lambda x: x / 14.438,
+    ("cubic-inches", "cubic-feet"): lambda x: x / 1728,
+    ("cubic-inches", "gallons"): lambda x: x / 231,
+    ("cups", "liters"): lambda x: x / 4.227,
+    ("cups", "cubic-inches"): lambda x: x * 14.438,
+    ("cups", "tablespoons"): lambda x: x * 16,
+    ("cups", "cubic-feet"): lambda x: x / 119.7,
+    ("cups", "gallons"): lambda x: x / 16,
+    ("cubic-feet", "liters"): lambda x: x * 28.317,
+    ("cubic-feet", "cubic-inches"): lambda x: x * 1728,
+    ("cubic-feet", "tablespoons"): lambda x: x * 1915,
+    ("cubic-feet", "cups"): lambda x: x * 119.7,
+    ("cubic-feet", "gallons"): lambda x: x * 7.481,
+    ("gallons", "liters"): lambda x: x * 3.785,
+    ("gallons", "cubic-inches"): lambda x: x * 231,
+    ("gallons", "cubic-feet"): lambda x: x / 7.48,
+    ("gallons", "tablespoons"): lambda x: x * 256,
+    ("gallons", "cups"): lambda x: x * 16,
+}
+
+
+def test_units_keep_published_order() -> None:
+    """
+    Test the units built from the registry.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the categories and units keep their published order.
+    """
+    assert UNITS == {
+        UnitCategory.TEMPERATURE.value: ["Kelvin", "Celsius", "Fahrenheit", "Rankine"],
+        UnitCategory.VOLUME.value: [
+            "liters",
+            "tablespoons",
+            "cubic-inches",
+            "cups",
+            "cubic-feet",
+            "gallons",
+        ],
+    }
+
+
+@pytest.mark.parametrize("pair", list(PUBLISHED_CONVERSIONS))
+def test_conversion_data_matches_published_grades(pair: tuple) -> None:
+    """
+    Test the conversion data built from the registry against the published
+    conversions.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every value rounds to the same tenths as before.
+    """
+    category = REGISTRY.category_of(pair[0])
+    values = np.concatenate(
+        [
+            np.arange(-50_000, 50_000) / 100,
+            np.round(np.random.default_rng(0).uniform(-1e4, 1e4, 20_000), 3),
+        ]
+    )
+    published = np.round(np.round(PUBLISHED_CONVERSIONS[pair](values), 3), 1)
+    converted = np.round(np.round(CONVERSION_DATA[category][pair](values), 3), 1)
+    np.testing.assert_array_equal(converted, published)
+
+
+@pytest.mark.parametrize("pair", list(PUBLISHED_CONVERSIONS))
+def test_conversion_data_matches_published_grid(pair: tuple) -> None:
+    """
+    Test the conversion data built from the registry against the published
+    conversions on every three-decimal value in [-1500, 1500].
+
+    Expected Behavior:
+    -------------------
+    Ensure that volume conversions, which were published as one
+    multiplication or one division, give exactly the same floats (e.g.
+    -1124.064 / 1728), and that temperatures round to the same tenths.
+    """
+    category = REGISTRY.category_of(pair[0])
+    values = np.arange(-1_500_000, 1_500_001) / 1000
+    published = PUBLISHED_CONVERSIONS[pair](values)
+    converted = CONVERSION_DATA[category][pair](values)
+    if category == UnitCategory.VOLUME.value:
+        np.testing.assert_array_equal(converted, published)
+    else:
+        np.testing.assert_array_equal(
+            np.round(np.round(converted, 3), 1), np.round(np.round(published, 3), 1)
+        )
+
+
+def test_conversion_data_has_every_pair() -> None:
+    """
+    Test that the conversion data covers every pair of distinct units.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the pairs are exactly the published ones.
+    """
+    pairs = {pair for table in CONVERSION_DATA.values() for pair in table}
+    assert pairs == set(PUBLISHED_CONVERSIONS)
+
+
+def test_affine_transform_call() -> None:
+    """
+    Test the AffineTransform call on numbers and arrays.
+
+    Expected Behavior:
+    -------------------
+    Ensure that y = scale * x / divisor + offset is returned.
+    """
+    transform = AffineTransform(1.8, 32.0)
+    assert transform(100.0) == 212.0
+    assert transform(np.array([0.0, -40.0])).tolist() == [32.0, -40.0]
+    assert AffineTransform(2.0, 0.0)(1.5) == 3.0
+    assert AffineTransform(1.0, 0.0, 1728.0)(-1124.064) == -1124.064 / 1728
+    assert AffineTransform(1.0, 1.0, 4.0)(np.array([2.0])).tolist() == [1.5]
+
+
+def build_registry() -> UnitRegistry:
+    """
+    Build a small registry with a base unit, an offset unit and a scaled unit.
+    """
+    registry = UnitRegistry()
+    registry.define("length", "m")
+    registry.define("length", "cm", scale=Fraction(1, 100))
+    registry.define("temperature", "K")
+    registry.define("temperature", "C", offset="273.15")
+    return registry
+
+
+def test_registry_composes_transforms() -> None:
+    """
+    Test the UnitRegistry.transform method on composed pairs.
+
+    Expected Behavior:
+    -------------------
+    Ensure that pairs are composed through the base unit and cached, and
+    that units defined by a divisor are divided by it.
+    """
+    registry = build_registry()
+    registry.define("length", "in", divisor="39.37")
+    assert registry.transform("m", "in") == AffineTransform(39.37, 0.0)
+    assert registry.transform("in", "m") == AffineTransform(1.0, 0.0, 39.37)
+    assert registry.transform("m", "cm") == AffineTransform(100.0, 0.0)
+    assert registry.transform("cm", "m") == AffineTransform(0.01, 0.0)
+    assert registry.transform("K", "C") == AffineTransform(1.0, -273.15)
+    assert registry.transform("C", "C") == AffineTransform(1.0, 0.0)
+    assert registry.transform("m", "cm") is registry.transform("m", "cm")
+
+
+def test_registry_pin() -> None:
+    """
+    Test the UnitRegistry.pin method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a pinned pair replaces the composed one and only that pair.
+    """
+    registry = build_registry()
+    registry.transform("m", "cm")
+    registry.pin("m", "cm", "99.5")
+    assert registry.transform("m", "cm") == AffineTransform(99.5, 0.0)
+    assert registry.transform("cm", "m") == AffineTransform(0.01, 0.0)
+    registry.pin("cm", "m", 1, divisor=100)
+    assert registry.transform("cm", "m") == AffineTransform(1.0, 0.0, 100.0)
+
+
+def test_registry_units_and_category() -> None:
+    """
+    Test the UnitRegistry.units property and category_of method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that units are listed per category and unknown units have no category.
+    """
+    registry = build_registry()
+    assert registry.units == {"length": ["m", "cm"], "temperature": ["K", "C"]}
+    assert registry.category_of("cm") == "length"
+    assert registry.category_of("inch") is None
+
+
+def test_registry_conversion_table() -> None:
+    """
+    Test the UnitRegistry.conversion_table method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every pair of distinct units of a category is present.
+    """
+    table = build_registry().conversion_table()
+    assert list(table["length"]) == [("m", "cm"), ("cm", "m")]
+    assert list(table["temperature"]) == [("K", "C"), ("C", "K")]
+
+
+def test_registry_fingerprint() -> None:
+    """
+    Test the UnitRegistry.fingerprint method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that equal tables have the same fingerprint and that changing a
+    factor or adding a unit changes it.
+    """
+    fingerprint = build_registry().fingerprint()
+    assert len(fingerprint) == 64
+    assert build_registry().fingerprint() == fingerprint
+    pinned = build_registry()
+    pinned.pin("m", "cm", 101)
+    assert pinned.fingerprint() != fingerprint
+    extended = build_registry()
+    extended.define("length", "mm", scale=Fraction(1, 1000))
+    assert extended.fingerprint() != fingerprint
+
+
+def test_registry_coefficients() -> None:
+    """
+    Test the UnitRegistry.coefficients method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the scale, offset and divisor matrices line up with the units.
+    """
+    units, scales, offsets, divisors = REGISTRY.coefficients(UnitCategory.VOLUME.value)
+    assert units == tuple(UNITS[UnitCategory.VOLUME.value])
+    assert scales.shape == offsets.shape == divisors.shape == (6, 6)
+    assert scales.dtype == np.float64
+    for i, from_unit in enumerate(units):
+        for j, to_unit in enumerate(units):
+            transform = REGISTRY.transform(from_unit, to_unit)
+            assert (scales[i, j], offsets[i, j], divisors[i, j]) == transform
+
+
+test_cases_registry_errors = [
+    (lambda registry: registry.define("length", "m"), "already defined"),
+    (lambda registry: registry.define("length", "km", scale=0), "cannot be zero"),
+    (lambda registry: registry.transform("m", "inch"), "not a valid unit"),
+    (lambda registry: registry.pin("m", "C", 1), "not in the same category"),
+    (lambda registry: registry.pin("m", "cm", 1, divisor=0), "cannot be zero"),
+    (lambda registry: registry.define("length", "km", divisor=0), "cannot be zero"),
+]
+
+
+@pytest.mark.parametrize("action, message", test_cases_registry_errors)
+def test_registry_errors(action, message: str) -> None:
+    """
+    Test the UnitRegistry error handling.
+
+    Expected Behavior:
+    -------------------
+    Ensure that invalid definitions and pairs raise a ValueError.
+    """
+    with pytest.raises(ValueError, match=message):
+        action(build_registry())
@@ -0,0 +1,177 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the regrader.py file
+in the unit_grader/commands directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * TableDiff
+    * export_table
+    * load_table
+    * diff_tables
+    * regrade_stream
+
+"""
+import copy
+import io
+import json
+
+import pytest
+
+from unit_grader.commands.batch_grader import PlanStats
+from unit_grader.commands.regrader import (
+    TableDiff,
+    diff_tables,
+    export_table,
+    load_table,
+    regrade_stream,
+)
+from unit_grader.config.data import CONVERSION_DATA, REGISTRY, UNITS
+
+
+def old_table() -> dict:
+    """
+    Build the snapshot of an older table: the gallons to cubic-feet factor
+    was wrong and cups did not exist yet.
+    """
+    snapshot = copy.deepcopy(export_table(REGISTRY))
+    snapshot["units"]["volume"].remove("cups")
+    conversions = []
+    for conversion in snapshot["conversions"]:
+        if conversion[:2] == ["gallons", "cubic-feet"]:
+            conversion[4] = 7.5
+        if "cups" not in conversion[:2]:
+            conversions.append(conversion)
+    snapshot["conversions"] = conversions
+    return snapshot
+
+
+def test_export_table() -> None:
+    """
+    Test the export_table function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the snapshot holds every unit and conversion, survives a
+    JSON round trip, and loads back to the conversion data.
+    """
+    snapshot = json.loads(json.dumps(export_table(REGISTRY)))
+    assert snapshot["fingerprint"] == REGISTRY.fingerprint()
+    assert snapshot["units"] == UNITS
+    units, conversions = load_table(snapshot)
+    assert units == {unit for names in UNITS.values() for unit in names}
+    assert conversions == {
+        pair: tuple(transform)
+        for transforms in CONVERSION_DATA.values()
+        for pair, transform in transforms.items()
+    }
+
+
+def test_load_table_without_divisor() -> None:
+    """
+    Test the load_table function with a snapshot written before conversions
+    had a divisor.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the conversions are read with a divisor of one.
+    """
+    snapshot = {"units": {"volume": ["a", "b"]}, "conversions": [["a", "b", 2, 0]]}
+    assert load_table(snapshot) == ({"a", "b"}, {("a", "b"): (2.0, 0.0, 1.0)})
+
+
+test_cases_load_table_invalid = [
+    {},
+    {"units": [], "conversions": []},
+    {"units": {}, "conversions": [["a", "b", 1]]},
+    {"units": {}, "conversions": [["a", "b", "x", 0]]},
+    {"units": {}, "conversions": [["a", "b", 1, 0, 1, 0]]},
+]
+
+
+@pytest.mark.parametrize("snapshot", test_cases_load_table_invalid)
+def test_load_table_invalid(snapshot: dict) -> None:
+    """
+    Test the load_table function with snapshots that are not conversion
+    tables.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError is raised.
+    """
+    with pytest.raises(ValueError, match="not a conversion table"):
+        load_table(snapshot)
+
+
+def test_diff_tables() -> None:
+    """
+    Test the diff_tables function and the TableDiff.touches method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that changed, added and removed conversions and units are found,
+    and that only questions using them are touched.
+    """
+    diff = diff_tables(old_table(), export_table(REGISTRY))
+    assert ("gallons", "cubic-feet") in diff.pairs
+    assert ("cubic-feet", "gallons") not in diff.pairs
+    assert ("cups", "liters") in diff.pairs
+    assert diff.units == {"cups"}
+    assert diff.touches("gallons", "cubic-feet")
+    assert diff.touches("cups", "cups")
+    assert not diff.touches("cubic-feet", "gallons")
+    assert not diff.touches("Kelvin", "liters")
+    assert diff_tables(old_table(), old_table()) == TableDiff(frozenset(), frozenset())
+
+
+def test_regrade_stream() -> None:
+    """
+    Test the regrade_stream function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that only touched rows are regraded, and only the rows whose
+    result changed are written with their previous result.
+    """
+    source = io.StringIO(
+        "id,input_value,from_unit,to_unit,student_response,result\n"
+        "1,10,gallons,cubic-feet,1.3,incorrect\n"  # correct since the fix
+        "2,10,gallons,cubic-feet,1.4,incorrect\n"  # still incorrect
+        "3,10,cubic-feet,gallons,1.3,incorrect\n"  # not touched
+        "4,1,cups,tablespoons,16,invalid\n"  # cups are new
+        "5,1,Kelvin,Celsius,1,correct\n"  # not touched, even if stale
+    )
+    sink = io.StringIO()
+    stats = PlanStats()
+    assert regrade_stream(
+        source,
+        sink,
+        diff_tables(old_table(), export_table(REGISTRY)),
+        chunk_size=1,
+        stats=stats,
+    ) == (5, 3, 2)
+    assert sink.getvalue() == (
+        "id,input_value,from_unit,to_unit,student_response,previous_result,result\n"
+        "1,10,gallons,cubic-feet,1.3,incorrect,correct\n"
+        "4,1,cups,tablespoons,16,invalid,correct\n"
+    )
+    assert stats.rows == 3
+
+
+test_cases_regrade_stream_missing_columns = [
+    ("", "input_value, from_unit, to_unit, student_response, result"),
+    ("input_value,from_unit,to_unit,student_response\n", "result"),
+]
+
+
+@pytest.mark.parametrize("content, missing", test_cases_regrade_stream_missing_columns)
+def test_regrade_stream_missing_columns(content: str, missing: str) -> None:
+    """
+    Test the regrade_stream function with a file missing required columns.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a ValueError names the missing columns.
+    """
+    diff = TableDiff(frozenset(), frozenset())
+    with pytest.raises(ValueError, match=f"missing the column\\(s\\): {missing}\\."):
+        regrade_stream(io.StringIO(content), io.StringIO(), diff)
@@ -0,0 +1,96 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the rendering.py file
+in the unit_grader/utils directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * print_grade_result
+    * write_grade_result
+
+"""
+import json
+
+import pytest
+
+from unit_grader.commands.conversion_grader import grade
+from unit_grader.utils.rendering import print_grade_result, write_grade_result
+
+test_cases_print_grade_result = [
+    (("100", "Kelvin", "Celsius", "-173.15"), None),
+    (("100", "Kelvin", "Celsius", "-173"), "\n-173.0 is not the correct answer."),
+    (("dog", "Kelvin", "Celsius", "1"), "Input Error: dog as input_value"),
+]
+
+
+@pytest.mark.parametrize("question, feedback", test_cases_print_grade_result)
+def test_print_grade_result(
+    question: tuple, feedback: str, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Test the print_grade_result function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the feedback, if any, is printed before the grade.
+    """
+    result = grade(*question)
+    print_grade_result(result)
+    output = capsys.readouterr().out
+    assert output.endswith(f"Grade Result: {result.answer.value}\n")
+    if feedback is None:
+        assert output == f"\nGrade Result: {result.answer.value}\n"
+    else:
+        assert output.startswith(feedback)
+
+
+# question, output, line, exit_code
+test_cases_write_grade_result = [
+    (
+        ("100", "Kelvin", "Celsius", "-173.15"),
+        "json",
+        {"result": "correct", "message": None},
+        0,
+    ),
+    (
+        ("100", "Kelvin", "Celsius", "-173"),
+        "json",
+        {
+            "result": "incorrect",
+            "message": "-173.0 is not the correct answer. The correct answer is -173.2.",
+        },
+        1,
+    ),
+    (("dog", "Kelvin", "Celsius", "1"), "plain", "invalid", 3),
+    (("100", "Kelvin", "Celsius", "-173"), "plain", "incorrect", 1),
+    (("100", "Kelvin", "Celsius", "-173.15"), "exit-code", None, 0),
+    (("dog", "Kelvin", "Celsius", "1"), "exit-code", None, 3),
+]
+
+
+@pytest.mark.parametrize(
+    "question, output, line, exit_code", test_cases_write_grade_result
+)
+def test_write_grade_result(
+    question: tuple,
+    output: str,
+    line: object,
+    exit_code: int,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """
+    Test the write_grade_result function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that at most one line is written and the exit code tells the
+    answers apart.
+    """
+    assert write_grade_result(grade(*question), output) == exit_code
+    written = capsys.readouterr().out
+    if line is None:
+        assert written == ""
+    elif output == "json":
+        assert written.count("\n") == 1
+        assert json.loads(written) == line
+    else:
+        assert written == f"{line}\n"
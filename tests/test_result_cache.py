@@ -0,0 +1,129 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the result_cache.py file
+in the unit_grader/commands directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * result_key
+    * ResultCache
+
+"""
+import io
+import os
+from pathlib import Path
+
+import pytest
+import pytest_mock
+
+from unit_grader.commands import result_cache
+from unit_grader.commands.result_cache import ResultCache, result_key
+
+
+@pytest.fixture
+def submission_file(tmp_path) -> str:
+    """
+    Write a small submission file.
+    """
+    path = tmp_path / "submissions.csv"
+    path.write_text("input_value,from_unit,to_unit,student_response\n1,a,b,2\n")
+    return str(path)
+
+
+def test_result_key(
+    submission_file: str, tmp_path, mocker: pytest_mock.MockFixture
+) -> None:
+    """
+    Test the result_key function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the key only depends on the file contents, the options,
+    the package version and the conversion table.
+    """
+    key = result_key(submission_file, ",")
+    copy = tmp_path / "copy.csv"
+    copy.write_bytes(Path(submission_file).read_bytes())
+    assert result_key(str(copy), ",") == key
+    assert result_key(submission_file, "\t") != key
+    with open(copy, "a") as file:
+        file.write("1,a,b,3\n")
+    assert result_key(str(copy), ",") != key
+    mocker.patch.object(result_cache, "__version__", "0.0.0")
+    assert result_key(submission_file, ",") != key
+    mocker.stopall()
+    mocker.patch.object(result_cache.REGISTRY, "fingerprint", return_value="other")
+    assert result_key(submission_file, ",") != key
+
+
+def test_result_cache_store_and_load(tmp_path) -> None:
+    """
+    Test the store and load methods of the ResultCache class.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a stored output is loaded unchanged, in a directory created
+    on first store, and that a missing entry is not loaded.
+    """
+    cache = ResultCache(str(tmp_path / "cache"))
+    sink = io.StringIO()
+    assert cache.load("key", sink) is False
+    with cache.store("key") as entry:
+        entry.write("a,b\r\nc,é\n")
+    assert cache.load("key", sink) is True
+    assert sink.getvalue() == "a,b\r\nc,é\n"
+    assert os.listdir(tmp_path / "cache") == ["key"]
+
+
+def test_result_cache_store_failure(tmp_path) -> None:
+    """
+    Test the store method of the ResultCache class when writing fails.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the error is raised and no entry or temporary file is kept.
+    """
+    cache = ResultCache(str(tmp_path))
+    with pytest.raises(ValueError, match="missing"):
+        with cache.store("key") as entry:
+            entry.write("partial")
+            raise ValueError("missing column")
+    assert os.listdir(tmp_path) == []
+
+
+def test_result_cache_evict(tmp_path) -> None:
+    """
+    Test the evict method of the ResultCache class.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the least recently used entries are removed until the
+    cache fits its size limit, and that loading an entry marks it as used.
+    """
+    cache = ResultCache(str(tmp_path), max_bytes=25)
+    for age, key in enumerate(["old", "used", "new"]):
+        path = tmp_path / key
+        path.write_text("x" * 10)
+        os.utime(path, (1000 + age, 1000 + age))
+    (tmp_path / f"{result_cache.TEMPORARY_PREFIX}partial").write_text("x" * 100)
+    (tmp_path / "subdirectory").mkdir()
+    cache.load("old", io.StringIO())  # now the most recently used
+    assert cache.evict() == 1
+    assert not (tmp_path / "used").exists()
+    assert cache.evict() == 0
+
+
+def test_result_cache_evict_keeps_new_entry(tmp_path) -> None:
+    """
+    Test the store method of the ResultCache class with an entry larger
+    than the size limit.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the older entries are evicted but the new one is kept.
+    """
+    cache = ResultCache(str(tmp_path), max_bytes=5)
+    with cache.store("first") as entry:
+        entry.write("x" * 10)
+    with cache.store("second") as entry:
+        entry.write("x" * 10)
+    assert os.listdir(tmp_path) == ["second"]
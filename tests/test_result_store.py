@@ -0,0 +1,139 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the result_store.py file
+in the unit_grader/commands directory.
+-----------------------------------------------------------------
+The following classes and functions are tested:
+    * ResultStore
+
+"""
+import math
+import pickle
+
+import numpy as np
+import pytest
+import pytest_mock
+
+from unit_grader.commands.batch_grader import grade_plan, grade_results
+from unit_grader.commands.conversion_grader import grade
+from unit_grader.commands.result_store import NO_REASON, ResultStore
+from unit_grader.config.enums import Answer, ErrorCode
+
+QUESTIONS = [
+    ("100", "Kelvin", "Celsius", "-173.15"),
+    ("100", "Kelvin", "Celsius", "-173"),
+    ("100", "Kelvin", "Celsius", "dog"),
+    ("dog", "Kelvin", "Celsius", "1"),
+    ("100", "Kelvn", "Celsius", "1"),
+    ("100", "Kelvin", "Celsus", "1"),
+    ("100", "Kelvin", "liters", "1"),
+    ("100", "Kelvin", "Celsius", "dog"),
+    ("100", "Kelvin", "Celsius", "-173.15"),
+    ("1e400", "Kelvin", "Celsius", "inf"),
+]
+
+
+def test_result_store_append() -> None:
+    """
+    Test the append, answer and message methods of the ResultStore class.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every row reads back the answer and feedback of its
+    GradeResult, and identical feedback is interned once.
+    """
+    store = ResultStore()
+    results = [grade(*question) for question in QUESTIONS]
+    for result in results:
+        store.append(result)
+
+    assert len(store) == len(QUESTIONS)
+    assert list(store) == [result.answer for result in results]
+    for index, result in enumerate(results):
+        assert store.answer(index) is result.answer
+        assert store.message(index) == result.message()
+    assert len(store.messages) == 5  # both "dog" responses share one
+    assert store.reasons[0] == store.reasons[1] == NO_REASON
+    assert store.reasons[2] == store.reasons[7] != NO_REASON
+    assert store.errors[1] == ErrorCode.WRONG_ANSWER
+    assert math.isnan(store.response_values[2])
+    assert math.isnan(store.correct_values[3])
+    assert store.nbytes == 22 * len(QUESTIONS)
+
+
+def test_result_store_empty() -> None:
+    """
+    Test the ResultStore class without rows.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the store is empty, its counts are zero and adding no rows
+    keeps it empty.
+    """
+    store = ResultStore()
+    store.extend([])
+    assert len(store) == 0
+    assert list(store.graded()) == []
+    assert store.counts() == {
+        Answer.CORRECT: 0,
+        Answer.INCORRECT: 0,
+        Answer.INVALID: 0,
+    }
+
+
+def test_result_store_columns() -> None:
+    """
+    Test the columns and counts methods of the ResultStore class.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the columns are numpy views of the rows, rows cannot be
+    added while a view is alive, and the answers are counted.
+    """
+    store = grade_results(QUESTIONS)
+    columns = store.columns()
+    assert columns["answers"].dtype == np.int8
+    assert columns["correct_values"].dtype == np.float64
+    assert columns["reasons"].dtype == np.int32
+    assert columns["answers"].tolist() == [0, 1, 1, 2, 2, 2, 2, 1, 0, 0]
+    with pytest.raises(BufferError):
+        store.append(grade(*QUESTIONS[0]))
+    del columns
+    store.append(grade(*QUESTIONS[0]))
+    assert store.counts() == {
+        Answer.CORRECT: 4,
+        Answer.INCORRECT: 3,
+        Answer.INVALID: 4,
+    }
+
+
+def test_result_store_pickle() -> None:
+    """
+    Test pickling the ResultStore class.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a pickled store reads back the same rows.
+    """
+    store = grade_results(QUESTIONS)
+    assert list(pickle.loads(pickle.dumps(store)).graded()) == list(store.graded())
+
+
+def test_result_store_record(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the record method of the ResultStore class.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a planned chunk reads back like grading each submission,
+    in order, and each distinct result is encoded once.
+    """
+    encode = mocker.spy(ResultStore, "encode")
+    store = ResultStore()
+    store.record(grade_plan(QUESTIONS), len(QUESTIONS))
+    assert encode.call_count == len(set(QUESTIONS))
+    results = [grade(*question) for question in QUESTIONS]
+    assert list(store.graded()) == [
+        (result.answer.value, result.message()) for result in results
+    ]
+    assert len(store.messages) == 5
@@ -0,0 +1,164 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the server.py file
+in the unit_grader/commands directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * create_server
+    * serve
+    * GradingRequestHandler
+
+"""
+import os
+import signal
+import socket
+import threading
+
+import pytest
+import pytest_mock
+
+from unit_grader.commands.server import (
+    GradingServer,
+    create_server,
+    serve,
+)
+
+
+@pytest.fixture
+def running_server(tmp_path):
+    """
+    Run a grading server on a temporary socket in a background thread.
+    """
+    socket_path = str(tmp_path / "grader.sock")
+    server = create_server(socket_path)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_grading_request_handler(running_server: str) -> None:
+    """
+    Test the GradingRequestHandler over a real Unix socket.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every non-blank line gets one reply, in order.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(running_server)
+        client.sendall(
+            b'{"input_value": "32", "from_unit": "Fahrenheit",'
+            b' "to_unit": "Celsius", "student_response": "0", "id": "a"}\n'
+            b"\n"
+            b"not json\n"
+        )
+        client.shutdown(socket.SHUT_WR)
+        replies = client.makefile("r").read().splitlines()
+    assert replies[0] == '{"result": "correct", "id": "a"}'
+    assert replies[1].startswith('{"error": "Invalid JSON:')
+    assert len(replies) == 2
+
+
+def test_server_close_removes_socket(tmp_path) -> None:
+    """
+    Test that closing the server removes its socket file.
+
+    Expected Behavior:
+    -------------------
+    Ensure that no socket file is left behind, even if it is already gone.
+    """
+    socket_path = str(tmp_path / "grader.sock")
+    server = create_server(socket_path)
+    assert os.path.exists(socket_path)
+    server.server_close()
+    assert not os.path.exists(socket_path)
+    server.server_close()
+
+
+def test_create_server_replaces_stale_socket(tmp_path) -> None:
+    """
+    Test the create_server function when a stale socket file exists.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the stale socket is replaced.
+    """
+    socket_path = str(tmp_path / "grader.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+    server = create_server(socket_path)
+    assert isinstance(server, GradingServer)
+    server.server_close()
+
+
+def test_create_server_refuses_running_server(running_server: str) -> None:
+    """
+    Test the create_server function when another server listens on the path.
+
+    Expected Behavior:
+    -------------------
+    Ensure that FileExistsError is raised and the server keeps its socket.
+    """
+    with pytest.raises(FileExistsError, match="running server"):
+        create_server(running_server)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(running_server)
+
+
+def test_create_server_refuses_regular_file(tmp_path) -> None:
+    """
+    Test the create_server function when the path is a regular file.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the file is kept and FileExistsError is raised.
+    """
+    socket_path = tmp_path / "grader.sock"
+    socket_path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        create_server(str(socket_path))
+    assert socket_path.read_text() == "keep me"
+
+
+def test_serve_stops_on_sigterm(tmp_path, mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the serve function when SIGTERM is received.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the server stops, removes its socket and restores the handler.
+    """
+    socket_path = str(tmp_path / "grader.sock")
+    previous_handler = signal.getsignal(signal.SIGTERM)
+    mocker.patch.object(
+        GradingServer,
+        "serve_forever",
+        lambda self: os.kill(os.getpid(), signal.SIGTERM),
+    )
+    serve(socket_path)
+    assert not os.path.exists(socket_path)
+    assert signal.getsignal(signal.SIGTERM) is previous_handler
+
+
+def test_serve_in_background_thread(tmp_path, mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the serve function outside the main thread.
+
+    Expected Behavior:
+    -------------------
+    Ensure that no signal handler is installed and the server stops cleanly.
+    """
+    socket_path = str(tmp_path / "grader.sock")
+    mocker.patch.object(GradingServer, "serve_forever", side_effect=KeyboardInterrupt)
+    signal_function = mocker.spy(signal, "signal")
+    thread = threading.Thread(target=serve, args=(socket_path,))
+    thread.start()
+    thread.join()
+    signal_function.assert_not_called()
+    assert not os.path.exists(socket_path)
@@ -0,0 +1,206 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the stream_grader.py file
+in the unit_grader/commands directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * input_waiting
+    * grade_ndjson
+    * write_replies
+
+"""
+import io
+import json
+import os
+import threading
+import time
+
+import pytest
+import pytest_mock
+
+from unit_grader.commands import stream_grader
+from unit_grader.commands.stream_grader import (
+    grade_ndjson,
+    input_waiting,
+    write_replies,
+)
+
+
+class FlushCounter(io.StringIO):
+    """
+    An in-memory stream counting how often it is flushed.
+    """
+
+    flushes: int = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+def request(student_response: str, request_id: int) -> str:
+    """
+    Build a JSON grading request line for 100 Kelvin in Celsius.
+    """
+    return (
+        json.dumps(
+            {
+                "input_value": "100",
+                "from_unit": "Kelvin",
+                "to_unit": "Celsius",
+                "student_response": student_response,
+                "id": request_id,
+            }
+        )
+        + "\n"
+    )
+
+
+# flush_lines, flushes
+test_cases_grade_ndjson_flush = [
+    (1, 5),
+    (2, 3),
+    (5, 1),
+    (1000, 1),
+]
+
+
+@pytest.mark.parametrize("flush_lines, flushes", test_cases_grade_ndjson_flush)
+def test_grade_ndjson(flush_lines: int, flushes: int) -> None:
+    """
+    Test the grade_ndjson function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every request gets a reply in order, blank lines are
+    skipped, invalid lines get an error reply, and replies are flushed in
+    batches of at most flush_lines.
+    """
+    source = io.StringIO(
+        request("-173.15", 1)
+        + "\n"
+        + request("-173.1", 2)
+        + "not json\n"
+        + "[1]\n"
+        + request("dog", 3)
+    )
+    sink = FlushCounter()
+    assert grade_ndjson(source, sink, flush_lines) == 5
+    replies = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert replies == [
+        {"result": "correct", "id": 1},
+        {"result": "incorrect", "id": 2},
+        {"error": "Invalid JSON: Expecting value: line 1 column 1 (char 0)"},
+        {"error": "Request must be a JSON object."},
+        {"result": "incorrect", "id": 3},
+    ]
+    assert sink.flushes == flushes
+
+
+def test_grade_ndjson_failing_line(mocker: pytest_mock.MockFixture) -> None:
+    """
+    Test the grade_ndjson function when grading a line raises.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the line gets an error reply and the following lines are
+    still graded and written.
+    """
+    mocker.patch.object(
+        stream_grader,
+        "handle_line",
+        side_effect=[OverflowError("too large"), '{"result": "correct"}\n'],
+    )
+    sink = io.StringIO()
+    assert grade_ndjson(io.StringIO("first\nsecond\n"), sink) == 2
+    assert sink.getvalue().splitlines() == [
+        '{"error": "Grading failed: OverflowError(\'too large\')"}',
+        '{"result": "correct"}',
+    ]
+
+
+def test_grade_ndjson_empty() -> None:
+    """
+    Test the grade_ndjson function with no requests.
+
+    Expected Behavior:
+    -------------------
+    Ensure that nothing is written or flushed.
+    """
+    sink = FlushCounter()
+    assert grade_ndjson(io.StringIO("\n\n"), sink) == 0
+    assert sink.getvalue() == ""
+    assert sink.flushes == 0
+
+
+def test_grade_ndjson_replies_when_input_waits() -> None:
+    """
+    Test the grade_ndjson function on a pipe whose writer is still open.
+
+    Expected Behavior:
+    -------------------
+    Ensure that replies are flushed as soon as no more input is waiting,
+    without waiting for a full batch or the end of the input.
+    """
+    read_end, write_end = os.pipe()
+    sink = FlushCounter()
+    with os.fdopen(read_end) as source, os.fdopen(write_end, "w") as writer:
+        grader = threading.Thread(target=grade_ndjson, args=(source, sink, 1000))
+        grader.start()
+        writer.write(request("-173.15", 1) + request("0", 2))
+        writer.flush()
+        deadline = time.monotonic() + 10
+        while sink.getvalue().count("\n") < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sink.getvalue().count("\n") == 2
+        assert grader.is_alive()  # still waiting for more requests
+        writer.close()
+        grader.join()
+
+
+def test_input_waiting_in_memory() -> None:
+    """
+    Test the input_waiting function on an in-memory stream.
+
+    Expected Behavior:
+    -------------------
+    Ensure that in-memory streams are always ready.
+    """
+    assert input_waiting(io.StringIO(""))() is True
+
+
+@pytest.mark.parametrize("error", [OSError(10038, "not a socket"), ValueError])
+def test_input_waiting_not_pollable(
+    error: Exception, mocker: pytest_mock.MockFixture
+) -> None:
+    """
+    Test the input_waiting function on a stream that cannot be polled.
+
+    Expected Behavior:
+    -------------------
+    Ensure that streams select cannot poll, like pipes on Windows, are
+    never ready, so each reply is flushed.
+    """
+    mocker.patch.object(stream_grader.select, "select", side_effect=error)
+    source = io.StringIO("")
+    mocker.patch.object(source, "fileno", return_value=0)
+    assert input_waiting(source)() is False
+
+
+def test_write_replies() -> None:
+    """
+    Test the write_replies function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the replies are written and flushed once, and the batch
+    is emptied.
+    """
+    sink = FlushCounter()
+    replies = ['{"result": "correct"}\n', '{"result": "invalid"}\n']
+    assert write_replies(sink, replies) == 2
+    assert sink.getvalue() == '{"result": "correct"}\n{"result": "invalid"}\n'
+    assert sink.flushes == 1
+    assert replies == []
+    assert write_replies(sink, replies) == 0
+    assert sink.flushes == 1
@@ -0,0 +1,182 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the tenths.py file
+in the unit_grader/utils directory.
+-----------------------------------------------------------------
+The following functions are tested:
+    * to_tenths
+    * to_tenths_array
+
+"""
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from tests import test_common
+from unit_grader.commands.array_grader import grade_array
+from unit_grader.commands.conversion_grader import grade
+from unit_grader.config.data import CONVERSION_DATA
+from unit_grader.config.enums import Answer, AnswerCode
+from unit_grader.utils.common import convert_value, round_half_even
+from unit_grader.utils.tenths import EXACT_TENTHS, to_tenths, to_tenths_array
+
+
+def common_corpus() -> list:
+    """
+    Collect the conversions tested in test_common, with their expected value.
+    """
+    tests = (
+        test_common.test_convert_units_same_valid_from_unit_to_unit,
+        test_common.test_convert_units_different_valid_from_unit_to_unit,
+    )
+    return [case for test in tests for case in test.pytestmark[0].args[1]]
+
+
+# value, tenths
+test_cases_to_tenths = [
+    (-173.15, -1732),
+    (4.65, 46),  # 4.65 * 10 is exactly 46.5, a tie to even
+    (0.15, 2),  # 0.15 * 10 is exactly 1.5, a tie to even
+    (4.75, 48),
+    (0.25, 2),  # exact tie, to even
+    (0.75, 8),  # exact tie, to even
+    (-0.25, -2),
+    (-0.04, 0),
+    (0.0, 0),
+    (123.4, 1234),
+    (1e14, 10**15),
+    (float("inf"), None),
+    (float("-inf"), None),
+    (float("nan"), None),
+    (1e300, None),
+    (EXACT_TENTHS / 10, None),
+]
+
+
+@pytest.mark.parametrize("value, expected", test_cases_to_tenths)
+def test_to_tenths(value: float, expected: Optional[int]) -> None:
+    """
+    Test the to_tenths function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that values are rounded half to even to whole tenths, and that
+    values without exact tenths have none.
+    """
+    assert to_tenths(value) == expected
+
+
+def test_to_tenths_array_matches_scalar() -> None:
+    """
+    Test the to_tenths_array function against to_tenths.
+
+    Expected Behavior:
+    -------------------
+    Ensure that every value has the same tenths as with to_tenths, as int64,
+    and that values without exact tenths are flagged and set to 0.
+    """
+    values = np.array([value for value, _ in test_cases_to_tenths])
+    tenths, exact = to_tenths_array(values)
+    assert tenths.dtype == np.int64
+    expected = [to_tenths(value) for value in values.tolist()]
+    assert exact.tolist() == [value is not None for value in expected]
+    assert tenths.tolist() == [0 if value is None else value for value in expected]
+
+
+@pytest.mark.parametrize(
+    "input_value, from_unit, to_unit, category, conversion_data, expected",
+    common_corpus(),
+)
+def test_tenths_match_common_corpus(
+    input_value: str,
+    from_unit: str,
+    to_unit: str,
+    category: str,
+    conversion_data: dict,
+    expected: float,
+) -> None:
+    """
+    Test grading in tenths on the conversion corpus of test_common.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the converted value has the tenths of the expected value,
+    and that the expected value is graded correct, and a tenth off incorrect,
+    by both the scalar and the array grader.
+    """
+    converted = convert_value(
+        input_value, from_unit, to_unit, category, conversion_data
+    )
+    assert to_tenths(converted) == to_tenths(expected)
+    responses = [str(expected), str(round(expected + 0.1, 1))]
+    answers = [
+        grade(str(input_value), from_unit, to_unit, response, None).answer
+        for response in responses
+    ]
+    assert answers == [Answer.CORRECT, Answer.INCORRECT]
+    codes = grade_array(
+        [str(input_value)] * 2, [from_unit] * 2, [to_unit] * 2, responses
+    )
+    assert codes.tolist() == [AnswerCode.CORRECT, AnswerCode.INCORRECT]
+
+
+def float_grades(values: np.ndarray, answers: np.ndarray, same_unit: bool) -> list:
+    """
+    Grade by comparing the rounded floats, like the grader did before tenths.
+    """
+    with np.errstate(all="ignore"):
+        correct = np.round(values, 1) if same_unit else np.round(np.round(values, 3), 1)
+        return (correct == np.round(answers, 1)).tolist()
+
+
+def test_tenths_match_float_comparison() -> None:
+    """
+    Test grading in tenths against comparing the rounded floats.
+
+    Expected Behavior:
+    -------------------
+    Ensure that ties, neighbouring tenths, huge magnitudes and non-finite
+    values are graded the same by the scalar and the array grader as by
+    comparing the rounded floats.
+    """
+    rng = np.random.default_rng(0)
+    exponents = rng.integers(-3, 20, 4_000)
+    values = rng.uniform(-1, 1, 4_000) * 10.0**exponents
+    values = np.concatenate([values, np.arange(-2_000, 2_000) / 200])
+    offsets = rng.choice([0.0, 0.05, -0.05, 0.1, 0.0004, 1e-9], values.size)
+    special = np.array([np.inf, -np.inf, np.nan, 1e306, 1e306])
+    for from_unit, to_unit in (("liters", "liters"), ("Celsius", "Kelvin")):
+        if from_unit == to_unit:
+            correct = values
+        else:
+            correct = CONVERSION_DATA["temperature"][(from_unit, to_unit)](values)
+        answers = np.concatenate([correct + offsets, [np.inf, np.inf, 0.0, 1e306, 1]])
+        inputs = [repr(value) for value in np.concatenate([values, special]).tolist()]
+        responses = [repr(value) for value in answers.tolist()]
+        with np.errstate(all="ignore"):
+            correct = np.concatenate([correct, special])
+        expected = float_grades(correct, answers, from_unit == to_unit)
+        size = len(inputs)
+        codes = grade_array(inputs, [from_unit] * size, [to_unit] * size, responses)
+        assert (codes == AnswerCode.CORRECT).tolist() == expected
+        scalar = [
+            grade(value, from_unit, to_unit, response, None).answer is Answer.CORRECT
+            for value, response in zip(inputs, responses)
+        ]
+        assert scalar == expected
+
+
+def test_tenths_keep_rounded_values() -> None:
+    """
+    Test the to_tenths function on values already rounded to the tenths place.
+
+    Expected Behavior:
+    -------------------
+    Ensure that a value rounded to the tenths place keeps its tenths, so the
+    correct answers of the grader can be compared in tenths.
+    """
+    rng = np.random.default_rng(1)
+    tenths = rng.integers(-EXACT_TENTHS + 1, EXACT_TENTHS, 10_000).tolist()
+    for value in tenths + [EXACT_TENTHS - 1, 1 - EXACT_TENTHS]:
+        assert to_tenths(round_half_even(value / 10, 1)) == value
@@ -0,0 +1,171 @@
+"""
+-----------------------------------------------------------------
+This module contains unit tests for the timings.py file
+in the unit_grader/utils directory.
+-----------------------------------------------------------------
+The following classes and functions are tested:
+    * StageStats
+    * Timings
+    * dump_at_exit
+
+"""
+import io
+import json
+
+import pytest
+import pytest_mock
+
+from unit_grader.commands import conversion_grader
+from unit_grader.utils import numeric, timings
+from unit_grader.utils.timings import TIMINGS, StageStats, Timings, dump_at_exit
+
+
+@pytest.fixture
+def shared_timings() -> Timings:
+    """
+    Give the shared timings, disabled and emptied again after the test.
+    """
+    try:
+        yield TIMINGS
+    finally:
+        TIMINGS.disable()
+        TIMINGS.reset()
+
+
+def test_stage_stats() -> None:
+    """
+    Test the StageStats class.
+
+    Expected Behavior:
+    -------------------
+    Ensure that calls are counted in power-of-two microsecond buckets.
+    """
+    stats = StageStats()
+    assert stats.to_dict() == {
+        "count": 0,
+        "total_ms": 0.0,
+        "mean_us": 0.0,
+        "max_us": 0.0,
+        "histogram": {},
+    }
+    for seconds in (0.0000005, 0.000003, 0.0000035, 0.001):
+        stats.add(seconds)
+    assert stats.to_dict() == {
+        "count": 4,
+        "total_ms": 1.007,
+        "mean_us": 251.75,
+        "max_us": 1000.0,
+        "histogram": {"<1us": 1, "<4us": 2, "<1024us": 1},
+    }
+
+
+def test_timings_stage() -> None:
+    """
+    Test the Timings.stage method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that blocks are only timed while timings are enabled, also when
+    they raise.
+    """
+    recorder = Timings()
+    with recorder.stage("render"):
+        pass
+    assert recorder.report() == {}
+    recorder.enable()
+    with recorder.stage("render"):
+        pass
+    with pytest.raises(ValueError):
+        with recorder.stage("render"):
+            raise ValueError("failed")
+    assert recorder.report()["render"]["count"] == 2
+    recorder.reset()
+    assert recorder.report() == {}
+
+
+def test_timings_register() -> None:
+    """
+    Test the Timings.register, enable and disable methods.
+
+    Expected Behavior:
+    -------------------
+    Ensure that registered functions are only wrapped while timings are
+    enabled, whether they were registered before or after enabling, and
+    that failing calls are timed too.
+    """
+
+    def parse(text: str) -> float:
+        return float(text)
+
+    namespace = {"parse": parse}
+    recorder = Timings()
+    recorder.register(namespace, {"parse": "parse"})
+    assert namespace["parse"] is parse
+    recorder.enable()
+    recorder.enable()  # enabling twice does not wrap twice
+    assert namespace["parse"]("1.5") == 1.5
+    with pytest.raises(ValueError):
+        namespace["parse"]("dog")
+    late = {"convert": abs}
+    recorder.register(late, {"convert": "convert"})
+    assert late["convert"](-2) == 2
+    report = recorder.report()
+    assert (report["parse"]["count"], report["convert"]["count"]) == (2, 1)
+    recorder.disable()
+    assert namespace["parse"] is parse
+    assert late["convert"] is abs
+
+
+def test_timings_grading_stages(shared_timings: Timings) -> None:
+    """
+    Test the grading stages registered by the conversion grader.
+
+    Expected Behavior:
+    -------------------
+    Ensure that grading records every stage while timings are enabled and
+    that the original functions are restored afterwards.
+    """
+    shared_timings.enable()
+    conversion_grader.grade("100", "Kelvin", "Celsius", "-173", cache=None)
+    report = shared_timings.report()
+    assert {"solve", "parse", "validate", "convert", "round"} <= report.keys()
+    assert report["parse"]["count"] == 2
+    shared_timings.disable()
+    assert conversion_grader.parse_number is numeric.parse_number
+
+
+def test_timings_dump() -> None:
+    """
+    Test the Timings.dump method.
+
+    Expected Behavior:
+    -------------------
+    Ensure that the report is written as a single JSON line.
+    """
+    recorder = Timings()
+    recorder.record("render", 0.000002)
+    sink = io.StringIO()
+    recorder.dump(sink)
+    assert sink.getvalue().count("\n") == 1
+    assert json.loads(sink.getvalue())["timings"]["render"]["histogram"] == {"<4us": 1}
+
+
+def test_dump_at_exit(
+    shared_timings: Timings, tmp_path, mocker: pytest_mock.MockFixture
+) -> None:
+    """
+    Test the dump_at_exit function.
+
+    Expected Behavior:
+    -------------------
+    Ensure that timings are enabled and the report is written to the file
+    at exit.
+    """
+    register = mocker.patch.object(timings.atexit, "register")
+    path = tmp_path / "timings.json"
+    dump_at_exit(str(path))
+    assert shared_timings.enabled
+    with shared_timings.stage("render"):
+        pass
+    register.call_args.args[0]()
+    assert json.loads(path.read_text())["timings"]["render"]["count"] == 1